@@ -0,0 +1,5 @@
+from . import benchmark_parser_backends
+from . import benchmark_startup_importtime
+from . import benchmark_raw_artifact_readers
+from . import fixture_corpus
+from . import benchmark_ingest_parsers
\ No newline at end of file
@@ -0,0 +1,253 @@
+"""
+Benchmark the `ingest_*` functions on the recorded corpus of pages.
+
+This module replays every `ingest_*` function (and the parsing of the
+page they ingest from) of `benchmarks.fixture_corpus` on the recorded
+fixtures, without fetching the PAGASA-DOST website, and measures per
+function per fixture:
+
+- The minimum and median latency in milliseconds
+- The peak memory allocated by a call, traced by `tracemalloc` in a
+    separate call so tracing does not slow down the timed calls
+- The number of ingested records (e.g. places, cities or tourist
+    areas) and the records per second at the median latency
+
+The results can be saved as a baseline and compared with a later run,
+failing when the median latency of a function regressed by more than a
+threshold, so a slower parser is caught before it is deployed.
+
+Usage:
+    python src/benchmarks/benchmark_ingest_parsers.py [--fixture-dir DIR] [--repeat N] [--output FILE] [--baseline FILE] [--max-regression 0.25]
+
+Main functions:
+- `benchmark_ingest_parsers()` - Measure latency, peak memory and
+    records per second per function per fixture
+- `find_regressions()` - Compare results with a baseline
+"""
+import sys
+import os
+sys.path.insert(0, os.path.abspath('src'))
+
+# Do not record the benchmarked calls in the metrics of the pipeline
+os.environ.setdefault('PAGASA_INSTRUMENTATION', '0')
+
+import json
+import time
+import argparse
+import statistics
+import tracemalloc
+from benchmarks.fixture_corpus import FIXTURE_DIR
+from benchmarks.fixture_corpus import find_fixtures
+from benchmarks.fixture_corpus import load_replay_steps
+
+def count_records(
+        ingested_data: object
+) -> int:
+    """
+    Count the records of ingested data: a record per string,
+    per item of a list, per row of a dictionary of columns or per
+    key of a dictionary of records.
+
+    :param ingested_data: Ingested data
+    :type ingested_data: object
+
+    :return: Number of records
+    :rtype: int
+    """
+    if ingested_data is None or ingested_data == '':
+        return 0
+
+    if isinstance(ingested_data, list):
+        return len(ingested_data)
+
+    if isinstance(ingested_data, dict):
+        number_of_records = len(ingested_data)
+
+        for value in ingested_data.values():
+            if not isinstance(value, list):
+                return number_of_records
+
+        # Dictionaries of lists per field (e.g. `place`) have a record per row
+        return max([len(value) for value in ingested_data.values()], default=0)
+
+    return 1
+
+def benchmark_ingest_parsers(
+        fixtures: list[tuple[str, str]],
+        repeat: int = 20
+) -> list[dict]:
+    """
+    Measure the latency, peak memory and records per second of the
+    replay steps of recorded fixtures.
+
+    :param fixtures: Page names and corresponding fixture filepaths
+    :type fixtures: list[tuple[str, str]]
+
+    :param repeat: Number of timed calls per function per fixture
+    :type repeat: int
+
+    :return: Benchmark results containing the fixture, the function,
+        the minimum and median latency in milliseconds, the peak
+        memory in KiB, the number of records and the records per second
+    :rtype: list[dict]
+    """
+    results = []
+
+    for page_name, fixture_filepath in fixtures:
+        with open(fixture_filepath, 'r', encoding='utf-8') as html_file:
+            values = {
+                'html': html_file.read()
+            }
+
+        for function_name, function, argument_name, result_name in load_replay_steps(page_name):
+            argument = values[argument_name]
+            timings = []
+
+            for _ in range(repeat):
+                start = time.perf_counter()
+                result = function(argument)
+                timings.append(
+                    (time.perf_counter() - start) * 1000
+                )
+
+            tracemalloc.start()
+
+            try:
+                function(argument)
+                _, peak_memory_bytes = tracemalloc.get_traced_memory()
+
+            finally:
+                tracemalloc.stop()
+
+            if result_name is not None:
+                values[result_name] = result
+
+            median_ms = statistics.median(timings)
+            number_of_records = count_records(
+                result
+            )
+            records_per_second = 0.0
+
+            if median_ms > 0:
+                records_per_second = number_of_records / (median_ms / 1000)
+
+            results.append({
+                'fixture': os.path.basename(fixture_filepath),
+                'function': function_name,
+                'min_ms': min(timings),
+                'median_ms': median_ms,
+                'peak_kib': peak_memory_bytes / 1024,
+                'records': number_of_records,
+                'records_per_second': records_per_second
+            })
+
+    return results
+
+def find_regressions(
+        results: list[dict],
+        baseline_results: list[dict],
+        max_regression: float = 0.25
+) -> list[dict]:
+    """
+    Find the functions whose median latency regressed from a
+    baseline by more than a threshold.
+
+    :param results: Benchmark results of the current run
+    :type results: list[dict]
+
+    :param baseline_results: Benchmark results of the baseline
+    :type baseline_results: list[dict]
+
+    :param max_regression: Maximum accepted slowdown of the median
+        latency as a fraction of the baseline (e.g. 0.25 for 25%)
+    :type max_regression: float
+
+    :return: Regressed results containing the fixture, the function,
+        the baseline and current median latency and the slowdown
+    :rtype: list[dict]
+    """
+    baseline_median_ms = {}
+
+    for baseline_result in baseline_results:
+        baseline_median_ms[(baseline_result['fixture'], baseline_result['function'])] = baseline_result['median_ms']
+
+    regressions = []
+
+    for result in results:
+        key = (result['fixture'], result['function'])
+
+        # Functions new since the baseline, or too fast to compare, cannot regress
+        if baseline_median_ms.get(key, 0) <= 0:
+            continue
+
+        slowdown = result['median_ms'] / baseline_median_ms[key] - 1
+
+        if slowdown > max_regression:
+            regressions.append({
+                'fixture': result['fixture'],
+                'function': result['function'],
+                'baseline_median_ms': baseline_median_ms[key],
+                'median_ms': result['median_ms'],
+                'slowdown': slowdown
+            })
+
+    return regressions
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Benchmark the ingest_* functions on the recorded PAGASA-DOST pages.'
+    )
+    parser.add_argument('--fixture-dir', default=FIXTURE_DIR)
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--output', default=None)
+    parser.add_argument('--baseline', default=None)
+    parser.add_argument('--max-regression', type=float, default=0.25)
+    args = parser.parse_args()
+
+    fixtures = find_fixtures(
+        args.fixture_dir
+    )
+
+    if fixtures == []:
+        sys.exit(f'No fixtures found in {args.fixture_dir}')
+
+    results = benchmark_ingest_parsers(
+        fixtures,
+        args.repeat
+    )
+
+    print(
+        f"{'fixture':<44} {'function':<50} {'min_ms':>8} {'median_ms':>10} "
+        f"{'peak_kib':>9} {'records':>8} {'records_per_s':>14}"
+    )
+
+    for result in results:
+        print(
+            f"{result['fixture'][:44]:<44} {result['function'][:50]:<50} {result['min_ms']:>8.3f} "
+            f"{result['median_ms']:>10.3f} {result['peak_kib']:>9.1f} {result['records']:>8} "
+            f"{result['records_per_second']:>14.0f}"
+        )
+
+    if args.output is not None:
+        with open(args.output, 'w') as json_file:
+            json.dump(results, json_file, indent=4)
+
+    if args.baseline is not None:
+        with open(args.baseline, 'r') as json_file:
+            baseline_results = json.load(json_file)
+
+        regressions = find_regressions(
+            results,
+            baseline_results,
+            args.max_regression
+        )
+
+        for regression in regressions:
+            print(
+                f"Regression: {regression['function']} on {regression['fixture']} "
+                f"{regression['baseline_median_ms']:.3f} ms -> {regression['median_ms']:.3f} ms "
+                f"(+{regression['slowdown']:.0%})"
+            )
+
+        if regressions != []:
+            sys.exit(1)
@@ -0,0 +1,113 @@
+"""
+Benchmark the HTML parser backends of the ingest workflows.
+
+This module measures the time to build the BeautifulSoup object of
+saved PAGASA-DOST pages with every installed parser backend of
+`ingest.parser_backends`. By default the pages cached by the HTTP
+cache under `data/cache/http/` are used.
+
+Usage:
+    python src/benchmarks/benchmark_parser_backends.py [--html-dir DIR] [--repeat N]
+
+Main function:
+- `benchmark_parser_backends()` - Measure parse time per page per backend
+"""
+import sys
+import os
+sys.path.insert(0, os.path.abspath('src'))
+
+# Do not record the benchmarked calls in the metrics of the pipeline
+os.environ.setdefault('PAGASA_INSTRUMENTATION', '0')
+
+import glob
+import time
+import argparse
+import statistics
+import importlib.util
+from ingest.parser_backends import PARSER_BACKENDS
+from ingest.parser_backends import build_soup
+
+def get_installed_parser_backends(
+) -> list[str]:
+    """
+    Get the parser backends whose packages are installed.
+
+    :return: Names of the installed parser backends
+    :rtype: list[str]
+    """
+    installed_parser_backends = []
+
+    for parser_backend in PARSER_BACKENDS:
+        if parser_backend != 'html.parser' and importlib.util.find_spec(parser_backend) is None:
+            continue
+
+        installed_parser_backends.append(
+            parser_backend
+        )
+
+    return installed_parser_backends
+
+def benchmark_parser_backends(
+        html_filepaths: list[str],
+        repeat: int = 10
+) -> list[dict]:
+    """
+    Measure the parse time of saved pages with every installed
+    parser backend.
+
+    :param html_filepaths: Filepaths of the saved HTML pages
+    :type html_filepaths: list[str]
+
+    :param repeat: Number of times each page is parsed per backend
+    :type repeat: int
+
+    :return: Benchmark results containing the page, the parser
+        backend and the minimum and median parse time in milliseconds
+    :rtype: list[dict]
+    """
+    results = []
+
+    for html_filepath in html_filepaths:
+        with open(html_filepath, 'r', encoding='utf-8') as html_file:
+            html = html_file.read()
+
+        for parser_backend in get_installed_parser_backends():
+            timings = []
+
+            for _ in range(repeat):
+                start = time.perf_counter()
+                build_soup(html, parser_backend)
+                timings.append(
+                    (time.perf_counter() - start) * 1000
+                )
+
+            results.append({
+                'page': os.path.basename(html_filepath),
+                'size_kb': len(html.encode('utf-8')) / 1024,
+                'parser_backend': parser_backend,
+                'min_ms': min(timings),
+                'median_ms': statistics.median(timings)
+            })
+
+    return results
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Benchmark the HTML parser backends on saved PAGASA-DOST pages.'
+    )
+    parser.add_argument('--html-dir', default='data/cache/http')
+    parser.add_argument('--repeat', type=int, default=10)
+    args = parser.parse_args()
+
+    html_filepaths = sorted(glob.glob(os.path.join(args.html_dir, '*.html')))
+
+    if html_filepaths == []:
+        sys.exit(f'No saved HTML pages found in {args.html_dir}')
+
+    print(f"{'page':<40} {'size_kb':>8} {'parser_backend':<14} {'min_ms':>9} {'median_ms':>10}")
+
+    for result in benchmark_parser_backends(html_filepaths, args.repeat):
+        print(
+            f"{result['page'][:40]:<40} {result['size_kb']:>8.1f} {result['parser_backend']:<14} "
+            f"{result['min_ms']:>9.2f} {result['median_ms']:>10.2f}"
+        )
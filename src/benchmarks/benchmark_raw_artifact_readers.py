@@ -0,0 +1,97 @@
+"""
+Benchmark the readers of the raw artifacts of the extract workflows.
+
+This module measures the time to read every raw JSON artifact under
+`data/raw/` with `pd.read_json`, as the extract modules used to, and
+with the typed reader of `etl.extract.raw_artifacts` (`orjson` when
+installed, otherwise the standard `json` module).
+
+Usage:
+    python src/benchmarks/benchmark_raw_artifact_readers.py [--raw-dir DIR] [--repeat N]
+
+Main function:
+- `benchmark_raw_artifact_readers()` - Measure read time per artifact per reader
+"""
+import sys
+import os
+sys.path.insert(0, os.path.abspath('src'))
+
+import glob
+import time
+import argparse
+import statistics
+import pandas as pd
+from etl.extract.raw_artifacts import orjson
+from etl.extract.raw_artifacts import load_raw_artifact
+
+def benchmark_raw_artifact_readers(
+        raw_artifact_filepaths: list[str],
+        repeat: int = 100
+) -> list[dict]:
+    """
+    Measure the read time of raw artifacts with `pd.read_json`
+    and with the typed reader.
+
+    :param raw_artifact_filepaths: Filepaths of the raw JSON artifacts
+    :type raw_artifact_filepaths: list[str]
+
+    :param repeat: Number of times each artifact is read per reader
+    :type repeat: int
+
+    :return: Benchmark results containing the artifact, the reader
+        and the minimum and median read time in milliseconds
+    :rtype: list[dict]
+    """
+    if orjson is not None:
+        typed_reader_name = 'orjson'
+
+    else:
+        typed_reader_name = 'json'
+
+    readers = {
+        'pd.read_json': pd.read_json,
+        typed_reader_name: load_raw_artifact
+    }
+    results = []
+
+    for raw_artifact_filepath in raw_artifact_filepaths:
+        for reader_name, reader in readers.items():
+            timings = []
+
+            for _ in range(repeat):
+                start = time.perf_counter()
+                reader(raw_artifact_filepath)
+                timings.append(
+                    (time.perf_counter() - start) * 1000
+                )
+
+            results.append({
+                'artifact': os.path.relpath(raw_artifact_filepath, 'data/raw'),
+                'size_kb': os.path.getsize(raw_artifact_filepath) / 1024,
+                'reader': reader_name,
+                'min_ms': min(timings),
+                'median_ms': statistics.median(timings)
+            })
+
+    return results
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Benchmark the readers of the raw JSON artifacts.'
+    )
+    parser.add_argument('--raw-dir', default='data/raw')
+    parser.add_argument('--repeat', type=int, default=100)
+    args = parser.parse_args()
+
+    raw_artifact_filepaths = sorted(glob.glob(os.path.join(args.raw_dir, '*', '*.json')))
+
+    if raw_artifact_filepaths == []:
+        sys.exit(f'No raw JSON artifacts found in {args.raw_dir}')
+
+    print(f"{'artifact':<60} {'size_kb':>8} {'reader':<13} {'min_ms':>9} {'median_ms':>10}")
+
+    for result in benchmark_raw_artifact_readers(raw_artifact_filepaths, args.repeat):
+        print(
+            f"{result['artifact'][:60]:<60} {result['size_kb']:>8.1f} {result['reader']:<13} "
+            f"{result['min_ms']:>9.3f} {result['median_ms']:>10.3f}"
+        )
@@ -0,0 +1,112 @@
+"""
+Benchmark the cold-start import time of the ETL pipeline.
+
+This module imports the pipeline entry point and the executors of the
+ingest stages in a fresh interpreter with `python -X importtime`, the
+same imports an ingest-only run pays before fetching any page. It fails
+when the total import time exceeds a budget or when a module that only
+the extract stages need (pandas, the Snowflake connector) is imported,
+so regressions in cold-start time are caught before deployment.
+
+Usage:
+    python src/benchmarks/benchmark_startup_importtime.py [--max-ms MS] [--runs N]
+
+Main function:
+- `measure_startup_importtime()` - Measure the import time of a cold start
+"""
+import sys
+import os
+import argparse
+import statistics
+import subprocess
+
+INGEST_STAGE_NAMES = ['daily', 'cities', 'tourist_areas', 'advisory']
+
+FORBIDDEN_MODULES = ['pandas', 'snowflake', 'snowflake.connector', 'pyarrow']
+
+STARTUP_CODE = (
+    "import sys, os\n"
+    "sys.path.insert(0, os.path.abspath('src'))\n"
+    "import logs.logs\n"
+    "from pipeline.stages import load_stage_function\n"
+    f"for stage_name in {INGEST_STAGE_NAMES!r}:\n"
+    "    load_stage_function(stage_name)\n"
+)
+
+def measure_startup_importtime(
+) -> dict:
+    """
+    Measure the import time of a cold start of an ingest-only run
+    in a fresh interpreter.
+
+    :return: Measurement containing the total import time in
+        milliseconds, the imported modules and the imported
+        forbidden modules
+    :rtype: dict
+    """
+    completed_process = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', STARTUP_CODE],
+        capture_output=True,
+        text=True,
+        check=True
+    )
+
+    total_microseconds = 0
+    imported_modules = []
+
+    # Each line has the format: "import time: self [us] | cumulative | imported package"
+    for line in completed_process.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+
+        _, cumulative, module_name = line.split('|')
+        imported_modules.append(
+            module_name.strip()
+        )
+
+        # Only top-level imports are indented once, their cumulative time includes nested imports
+        if module_name.startswith(' ') and not module_name.startswith('  '):
+            total_microseconds += int(cumulative)
+
+    imported_forbidden_modules = []
+
+    for module_name in FORBIDDEN_MODULES:
+        if module_name in imported_modules:
+            imported_forbidden_modules.append(
+                module_name
+            )
+
+    measurement = {
+        'total_ms': total_microseconds / 1000,
+        'imported_modules': imported_modules,
+        'imported_forbidden_modules': imported_forbidden_modules
+    }
+
+    return measurement
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Benchmark the cold-start import time of an ingest-only pipeline run.'
+    )
+    parser.add_argument('--max-ms', type=float, default=1000)
+    parser.add_argument('--runs', type=int, default=5)
+    args = parser.parse_args()
+
+    measurements = []
+
+    for _ in range(args.runs):
+        measurements.append(
+            measure_startup_importtime()
+        )
+
+    median_ms = statistics.median(measurement['total_ms'] for measurement in measurements)
+    imported_forbidden_modules = measurements[0]['imported_forbidden_modules']
+
+    print(f"Imported modules: {len(measurements[0]['imported_modules'])}")
+    print(f'Median import time: {median_ms:.1f} ms (budget: {args.max_ms:.1f} ms)')
+
+    if imported_forbidden_modules != []:
+        sys.exit(f'Ingest-only runs import {imported_forbidden_modules}')
+
+    if median_ms > args.max_ms:
+        sys.exit(f'Import time regression: {median_ms:.1f} ms > {args.max_ms:.1f} ms')
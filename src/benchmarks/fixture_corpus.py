@@ -0,0 +1,265 @@
+"""
+Recorded corpus of PAGASA-DOST pages for offline replay of the parsers.
+
+This module records the HTML of the PAGASA-DOST pages under
+`data/fixtures/html/<page>/` and replays the `ingest_*` functions of
+every page on the recorded HTML, so the parsers can be run and timed
+without fetching pagasa.dost.gov.ph. Replaying never saves artifacts
+under `data/raw/`. The layout of the corpus is the layout of the
+snapshot directory of `pipeline.backfill`, so the corpus can also be
+backfilled into a local warehouse.
+
+The corpus contains a fixture per page, and a daily weather forecast
+with the tropical cyclone section, built by hand from the daily weather
+forecast fixture since no such page could be recorded. The committed
+fixtures reproduce the pages the committed `data/raw/` artifacts were
+ingested from (the tropical cyclone section is not saved yet), and
+`tests/test_fixture_corpus.py` checks that replaying them saves those
+artifacts; `record` adds live pages next to them:
+
+    data/fixtures/html/daily_weather_forecast/daily_weather_forecast.html
+    data/fixtures/html/daily_weather_forecast/daily_weather_forecast_with_tropical_cyclone.html
+    data/fixtures/html/weather_outlook_for_ph_cities/weather_outlook_for_ph_cities.html
+    data/fixtures/html/weather_outlook_for_ph_tourist_areas/weather_outlook_for_ph_tourist_areas.html
+    data/fixtures/html/weather_advisory/weather_advisory.html
+
+Usage:
+    python src/benchmarks/fixture_corpus.py record [--fixture-dir DIR] [--pages daily_weather_forecast,...]
+    python src/benchmarks/fixture_corpus.py replay [--fixture-dir DIR]
+
+Main functions:
+- `record_fixtures()` - Record the live pages into the corpus
+- `find_fixtures()` - Find the recorded fixtures of every page
+- `replay_fixture()` - Run the `ingest_*` functions on a fixture
+"""
+import sys
+import os
+sys.path.insert(0, os.path.abspath('src'))
+
+import glob
+import datetime
+import argparse
+import importlib
+from typing import Callable
+
+FIXTURE_DIR = 'data/fixtures/html'
+
+# Steps of every page as (module function, argument, result), the argument and the
+# result are names of the values passed between steps, starting from the `html`
+REPLAY_PLANS = {
+    'daily_weather_forecast': {
+        'module': 'ingest.ingest_daily_weather_forecast',
+        'steps': [
+            ('parse_soup_from_html', 'html', 'soup'),
+            ('index_daily_weather_forecast_sections', 'soup', 'sections'),
+            ('ingest_issued_datetime', 'sections', None),
+            ('ingest_synopsis', 'sections', None),
+            ('ingest_tropical_cyclone_informations', 'sections', None),
+            ('ingest_forecast_weather_conditions', 'sections', None),
+            ('ingest_forecast_wind_and_coastal_water_conditions', 'sections', None),
+            ('ingest_temperature_and_relative_humidity', 'sections', None)
+        ]
+    },
+    'weather_outlook_for_ph_cities': {
+        'module': 'ingest.ingest_weather_outlook_for_ph_cities',
+        'steps': [
+            ('parse_soup_from_html', 'html', 'soup'),
+            ('ingest_issued_datetime', 'soup', None),
+            ('ingest_time_validity', 'soup', None),
+            ('ingest_and_parse_list_of_all_ph_city_tags', 'soup', 'list_of_all_ph_city_tags'),
+            ('build_weather_outlook_for_ph_cities', 'list_of_all_ph_city_tags', None)
+        ]
+    },
+    'weather_outlook_for_ph_tourist_areas': {
+        'module': 'ingest.ingest_weather_outlook_for_ph_tourist_areas',
+        'steps': [
+            ('parse_soup_from_html', 'html', 'soup'),
+            ('ingest_issued_datetime', 'soup', None),
+            ('ingest_time_validity', 'soup', None),
+            ('build_weather_outlook_for_ph_tourist_areas', 'soup', None)
+        ]
+    },
+    'weather_advisory': {
+        'module': 'ingest.ingest_weather_advisory',
+        'steps': [
+            ('parse_soup_from_html', 'html', 'soup')
+        ]
+    }
+}
+
+def record_fixtures(
+        fixture_dir: str = FIXTURE_DIR,
+        page_names: list[str] | None = None
+) -> list[str]:
+    """
+    Record the live PAGASA-DOST pages into the corpus, named by
+    the time (UTC) they were recorded.
+
+    :param fixture_dir: Directory of the corpus
+    :type fixture_dir: str
+
+    :param page_names: Names of the pages to record, or NoneType
+        to record every page
+    :type page_names: list[str] | None
+
+    :return: Filepaths of the recorded fixtures
+    :rtype: list[str]
+    """
+    from ingest.fetch_pages import get_page_urls
+    from ingest.fetch_pages import fetch_pages_concurrently
+
+    page_urls = get_page_urls()
+
+    if page_names is None:
+        page_names = list(REPLAY_PLANS.keys())
+
+    urls = {}
+
+    for page_name in page_names:
+        if page_name not in REPLAY_PLANS:
+            raise ValueError(
+                f'Unknown page {page_name!r}, expected one of {list(REPLAY_PLANS.keys())}'
+            )
+
+        urls[page_name] = page_urls[page_name]
+
+    fetched_pages = fetch_pages_concurrently(
+        urls
+    )
+    recorded_at = datetime.datetime.now(datetime.timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+    fixture_filepaths = []
+
+    for page_name, fetched_page in fetched_pages.items():
+        # Pages that could not be fetched have no HTML to record
+        if fetched_page['html'] is None:
+            continue
+
+        os.makedirs(os.path.join(fixture_dir, page_name), exist_ok=True)
+        fixture_filepath = os.path.join(fixture_dir, page_name, f'{page_name}_{recorded_at}.html')
+
+        with open(fixture_filepath, 'w', encoding='utf-8') as html_file:
+            html_file.write(fetched_page['html'])
+
+        fixture_filepaths.append(
+            fixture_filepath
+        )
+
+    return fixture_filepaths
+
+def find_fixtures(
+        fixture_dir: str = FIXTURE_DIR
+) -> list[tuple[str, str]]:
+    """
+    Find the recorded fixtures of every page of the corpus.
+
+    :param fixture_dir: Directory of the corpus
+    :type fixture_dir: str
+
+    :return: Page names and corresponding fixture filepaths
+    :rtype: list[tuple[str, str]]
+    """
+    fixtures = []
+
+    for page_name in REPLAY_PLANS.keys():
+        for fixture_filepath in sorted(glob.glob(os.path.join(fixture_dir, page_name, '*.html'))):
+            fixtures.append(
+                (page_name, fixture_filepath)
+            )
+
+    return fixtures
+
+def load_replay_steps(
+        page_name: str
+) -> list[tuple[str, Callable, str, str | None]]:
+    """
+    Import the functions of the replay steps of a page.
+
+    :param page_name: Name of the page (e.g. `daily_weather_forecast`)
+    :type page_name: str
+
+    :return: Function names, functions, argument names and result
+        names of the replay steps
+    :rtype: list[tuple[str, Callable, str, str | None]]
+    """
+    replay_plan = REPLAY_PLANS[page_name]
+    module = importlib.import_module(
+        replay_plan['module']
+    )
+    replay_steps = []
+
+    for function_name, argument_name, result_name in replay_plan['steps']:
+        replay_steps.append(
+            (function_name, getattr(module, function_name), argument_name, result_name)
+        )
+
+    return replay_steps
+
+def replay_fixture(
+        page_name: str,
+        fixture_filepath: str
+) -> dict[str, object]:
+    """
+    Run the `ingest_*` functions of a page on a recorded fixture.
+
+    :param page_name: Name of the page of the fixture
+    :type page_name: str
+
+    :param fixture_filepath: Filepath of the fixture
+    :type fixture_filepath: str
+
+    :return: Dictionary containing function names and
+        corresponding ingested data
+    :rtype: dict[str, object]
+    """
+    with open(fixture_filepath, 'r', encoding='utf-8') as html_file:
+        values = {
+            'html': html_file.read()
+        }
+
+    ingested_data = {}
+
+    for function_name, function, argument_name, result_name in load_replay_steps(page_name):
+        result = function(
+            values[argument_name]
+        )
+
+        if result_name is not None:
+            values[result_name] = result
+            continue
+
+        ingested_data[function_name] = result
+
+    return ingested_data
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Record or replay the corpus of PAGASA-DOST pages.'
+    )
+    parser.add_argument('command', choices=['record', 'replay'])
+    parser.add_argument('--fixture-dir', default=FIXTURE_DIR)
+    parser.add_argument('--pages', default=None)
+    args = parser.parse_args()
+
+    if args.command == 'record':
+        page_names = None
+
+        if args.pages is not None:
+            page_names = args.pages.split(',')
+
+        for fixture_filepath in record_fixtures(args.fixture_dir, page_names):
+            print(f'Recorded {fixture_filepath}')
+
+        sys.exit(0)
+
+    fixtures = find_fixtures(
+        args.fixture_dir
+    )
+
+    if fixtures == []:
+        sys.exit(f'No fixtures found in {args.fixture_dir}')
+
+    for page_name, fixture_filepath in fixtures:
+        print(fixture_filepath)
+
+        for function_name, ingested_data in replay_fixture(page_name, fixture_filepath).items():
+            print(f'    {function_name}: {str(ingested_data)[:80]}')
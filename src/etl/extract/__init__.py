@@ -1 +1,11 @@
-from . import extract_daily_weather_forecast
\ No newline at end of file
+from . import extract_daily_weather_forecast
+from . import connection_pool
+from . import schema_registry
+from . import bulk_loader
+from . import extract_weather_outlook_for_ph_cities
+from . import extract_weather_outlook_for_ph_tourist_areas
+from . import warehouse
+from . import warehouse_snowflake
+from . import warehouse_sqlite
+from . import warehouse_duckdb
+from . import raw_artifacts
\ No newline at end of file
@@ -0,0 +1,292 @@
+"""
+Bulk loader of the cleaned DataFrames of a run into Snowflake.
+
+This module loads every cleaned DataFrame of a run with a single round
+trip sequence instead of one `write_pandas` call per table: the
+DataFrames are written as Parquet files into one local directory,
+uploaded into one temporary stage with a single `PUT`, then loaded
+into their SILVER tables inside one transaction, so either every table
+is loaded or none is.
+
+In `merge` mode (the default), the staged rows of a table with natural
+keys declared in `etl.extract.schema_registry` are copied into a
+temporary table and upserted with a single `MERGE`, so polling an
+unchanged forecast again does not duplicate its rows. Rows of a load
+sharing the same keys are deduplicated before staging, keeping the last
+row of the DataFrame (e.g. the latest snapshot of a backfill batch), as
+the local warehouse backends do. In `append`
+mode, or for tables without keys, the rows are copied directly into
+the table.
+
+Configuration (environment variables):
+- `PAGASA_LOAD_MODE` - `merge` (default) or `append`
+- `SNOWFLAKE_PUT_PARALLEL` - Number of threads uploading the Parquet
+    files (default: 4)
+
+Main functions:
+- `get_load_mode()` - Get the configured load mode
+- `write_dataframes_to_parquet()` - Write DataFrames as Parquet files
+- `build_copy_commands()` - Build the `COPY INTO` statements
+- `build_merge_command()` - Build the `MERGE` statement of a table
+- `bulk_load_dataframes()` - Load DataFrames into their tables
+"""
+from __future__ import annotations
+
+import os
+import shutil
+import tempfile
+from typing import TYPE_CHECKING
+from etl.extract.schema_registry import SILVER_TABLES
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+LOAD_MODES = ('merge', 'append')
+
+def get_load_mode(
+) -> str:
+    """
+    Get the load mode configured by `PAGASA_LOAD_MODE`.
+
+    :return: `merge` or `append`
+    :rtype: str
+    """
+    load_mode = os.getenv('PAGASA_LOAD_MODE', 'merge')
+
+    if load_mode not in LOAD_MODES:
+        raise ValueError(
+            f'Unknown load mode {load_mode!r}, expected one of {list(LOAD_MODES)}'
+        )
+
+    return load_mode
+
+def write_dataframes_to_parquet(
+        dataframes: dict[str, pd.DataFrame],
+        staging_dir: str
+) -> dict[str, str]:
+    """
+    Write DataFrames as Parquet files named after their tables.
+
+    :param dataframes: Dictionary containing table names and
+        corresponding cleaned data as DataFrame objects
+    :type dataframes: dict[str, pd.DataFrame]
+
+    :param staging_dir: Directory to write the Parquet files to
+    :type staging_dir: str
+
+    :return: Dictionary containing table names and corresponding
+        Parquet filenames
+    :rtype: dict[str, str]
+    """
+    parquet_filenames = {}
+
+    for table, data in dataframes.items():
+        parquet_filename = table + '.parquet'
+        data.to_parquet(
+            os.path.join(staging_dir, parquet_filename),
+            compression='snappy',
+            index=False
+        )
+        parquet_filenames[table] = parquet_filename
+
+    return parquet_filenames
+
+def build_copy_commands(
+        stage: str,
+        parquet_filenames: dict[str, str],
+        target_tables: dict[str, str]
+) -> list[str]:
+    """
+    Build the `COPY INTO` statements loading staged Parquet files
+    into their target tables, matching the columns by name.
+
+    :param stage: Fully qualified name of the stage
+    :type stage: str
+
+    :param parquet_filenames: Dictionary containing table names and
+        corresponding staged Parquet filenames
+    :type parquet_filenames: dict[str, str]
+
+    :param target_tables: Dictionary containing table names and
+        corresponding fully qualified names of the tables to copy
+        the staged rows into
+    :type target_tables: dict[str, str]
+
+    :return: `COPY INTO` statements, one per table
+    :rtype: list[str]
+    """
+    copy_commands = []
+
+    for table, parquet_filename in parquet_filenames.items():
+        copy_commands.append(
+            f"COPY INTO {target_tables[table]} "
+            f"FROM @{stage} FILES = ('{parquet_filename}') "
+            f"FILE_FORMAT = (TYPE = PARQUET) "
+            f"MATCH_BY_COLUMN_NAME = CASE_INSENSITIVE PURGE = TRUE"
+        )
+
+    return copy_commands
+
+def build_merge_command(
+        table: str,
+        declaration: dict,
+        staging_table: str
+) -> str:
+    """
+    Build the `MERGE` statement upserting the rows of a staging table
+    into a table on its natural keys. The rows of the staging table
+    must be unique per natural key, which `bulk_load_dataframes()`
+    ensures before staging them.
+
+    :param table: Name of the table
+    :type table: str
+
+    :param declaration: Declaration of the table (database, schema,
+        columns and keys)
+    :type declaration: dict
+
+    :param staging_table: Fully qualified name of the staging table
+    :type staging_table: str
+
+    :return: `MERGE` statement of the table
+    :rtype: str
+    """
+    keys = declaration['keys']
+    columns = list(declaration['columns'].keys())
+    non_key_columns = [column for column in columns if column not in keys]
+
+    join_condition = ' AND '.join(
+        [f'TARGET.{key} = SOURCE.{key}' for key in keys]
+    )
+    insert_columns = ', '.join(columns)
+    insert_values = ', '.join(
+        [f'SOURCE.{column}' for column in columns]
+    )
+
+    merge_command = f"MERGE INTO {declaration['database']}.{declaration['schema']}.{table} AS TARGET " \
+        f"USING {staging_table} AS SOURCE " \
+        f"ON {join_condition} "
+
+    if non_key_columns != []:
+        update_assignments = ', '.join(
+            [f'TARGET.{column} = SOURCE.{column}' for column in non_key_columns]
+        )
+        merge_command += f'WHEN MATCHED THEN UPDATE SET {update_assignments} '
+
+    merge_command += f'WHEN NOT MATCHED THEN INSERT ({insert_columns}) VALUES ({insert_values})'
+
+    return merge_command
+
+def bulk_load_dataframes(
+        conn: object,
+        dataframes: dict[str, pd.DataFrame],
+        tables: dict[str, dict] | None = None,
+        load_mode: str | None = None
+) -> None:
+    """
+    Load DataFrames into their tables with one upload to one temporary
+    stage and the `COPY INTO` (and `MERGE`) statements of every table
+    in one transaction.
+
+    :param conn: Established Snowflake connection
+    :type conn: SnowflakeConnection
+
+    :param dataframes: Dictionary containing table names and
+        corresponding cleaned data as DataFrame objects
+    :type dataframes: dict[str, pd.DataFrame]
+
+    :param tables: Dictionary containing table names and corresponding
+        declarations, or NoneType to use the SILVER tables
+    :type tables: dict[str, dict] | None
+
+    :param load_mode: `merge` or `append`, or NoneType to use
+        `PAGASA_LOAD_MODE`
+    :type load_mode: str | None
+    """
+    if tables is None:
+        tables = SILVER_TABLES
+
+    if load_mode is None:
+        load_mode = get_load_mode()
+
+    if dataframes == {}:
+        return
+
+    # The temporary stage lives in the schema of the first table and is reused by the later
+    # loads of the pooled session, which is never shared by two loads at once
+    first_declaration = tables[next(iter(dataframes))]
+    stage = first_declaration['database'] + '.' + first_declaration['schema'] + '.' + 'PAGASA_BULK_LOAD'
+    put_parallel = int(os.getenv('SNOWFLAKE_PUT_PARALLEL', '4'))
+
+    staged_dataframes = {}
+    target_tables = {}
+    merge_commands = []
+
+    for table, data in dataframes.items():
+        declaration = tables[table]
+        qualified_table = declaration['database'] + '.' + declaration['schema'] + '.' + table
+        staged_dataframes[table] = data
+
+        if load_mode == 'merge' and declaration.get('keys'):
+            # The last row of a key in load order wins, so a MERGE never sees two source rows per key
+            staged_dataframes[table] = data.drop_duplicates(subset=declaration['keys'], keep='last')
+            staging_table = qualified_table + '_STAGING'
+            target_tables[table] = staging_table
+            merge_commands.append(
+                build_merge_command(table, declaration, staging_table)
+            )
+
+        else:
+            target_tables[table] = qualified_table
+
+    staging_dir = tempfile.mkdtemp(prefix='pagasa_bulk_load_')
+
+    try:
+        parquet_filenames = write_dataframes_to_parquet(
+            staged_dataframes,
+            staging_dir
+        )
+        staging_pattern = os.path.join(staging_dir, '*.parquet').replace('\\', '/')
+
+        cursor = conn.cursor()
+        cursor.execute(
+            f'CREATE TEMPORARY STAGE IF NOT EXISTS {stage}'
+        )
+        cursor.execute(
+            f"PUT 'file://{staging_pattern}' @{stage} PARALLEL = {put_parallel} AUTO_COMPRESS = FALSE OVERWRITE = TRUE"
+        )
+
+        # The staging tables must be created before the transaction: Snowflake commits an open
+        # transaction before running DDL, so a `CREATE` after `BEGIN` would split the load into
+        # two transactions. They are temporary tables of the session, replaced by every load, so
+        # creating them outside the transaction never exposes partial data
+        for table, target_table in target_tables.items():
+            declaration = tables[table]
+            qualified_table = declaration['database'] + '.' + declaration['schema'] + '.' + table
+
+            if target_table != qualified_table:
+                cursor.execute(
+                    f'CREATE OR REPLACE TEMPORARY TABLE {target_table} LIKE {qualified_table}'
+                )
+
+        cursor.execute('BEGIN')
+
+        try:
+            for copy_command in build_copy_commands(stage, parquet_filenames, target_tables):
+                cursor.execute(
+                    copy_command
+                )
+
+            for merge_command in merge_commands:
+                cursor.execute(
+                    merge_command
+                )
+
+        except Exception:
+            cursor.execute('ROLLBACK')
+            raise
+
+        cursor.execute('COMMIT')
+
+    finally:
+        shutil.rmtree(staging_dir, ignore_errors=True)
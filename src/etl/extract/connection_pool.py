@@ -0,0 +1,216 @@
+"""
+Pool of authenticated Snowflake connections for the extract stages.
+
+This module keeps authenticated Snowflake sessions open between loads
+and hands them out to every extract stage of the process, so logging
+in to Snowflake is paid once per process instead of once per load.
+Sessions are opened with `client_session_keep_alive` so idle pooled
+sessions do not expire, closed sessions are discarded, and all pooled
+sessions are closed explicitly at exit.
+
+Configuration (environment variables):
+- `SNOWFLAKE_CONNECTOR` - `snowflake` (default) or `fake` to use the
+    local fake connector of `etl.extract.fake_snowflake_connector`
+- `SNOWFLAKE_POOL_SIZE` - Maximum idle sessions kept per credentials
+    (default: 4)
+
+Main functions:
+- `get_connection()` - Get a pooled connection
+- `release_connection()` - Return a connection to the pool
+- `pooled_connection()` - Context manager around a pooled connection
+- `close_all_connections()` - Close every pooled connection
+"""
+import os
+import atexit
+import threading
+from typing import Callable
+from typing import Iterator
+from contextlib import contextmanager
+from logs.instrumentation import instrument
+
+_idle_connections = {}
+_connection_keys = {}
+_pool_lock = threading.Lock()
+
+def get_connector(
+) -> Callable:
+    """
+    Get the `connect()` function of the configured Snowflake connector.
+
+    :return: Function opening a Snowflake connection
+    :rtype: Callable
+    """
+    connector_name = os.getenv('SNOWFLAKE_CONNECTOR', 'snowflake')
+
+    if connector_name == 'fake':
+        from etl.extract.fake_snowflake_connector import connect
+
+        return connect
+
+    if connector_name == 'snowflake':
+        import snowflake.connector
+
+        return snowflake.connector.connect
+
+    raise ValueError(
+        f"Unknown Snowflake connector {connector_name!r}, expected 'snowflake' or 'fake'"
+    )
+
+def get_connection(
+        username: str,
+        password: str,
+        account: str,
+        warehouse: str
+) -> object:
+    """
+    Get a pooled Snowflake connection for the credentials, opening
+    a new session only when no open idle session is available.
+
+    :param username: Snowflake username
+    :type username: str
+
+    :param password: Snowflake password
+    :type password: str
+
+    :param account: Snowflake account identifier
+    :type account: str
+
+    :param warehouse: Name of the Snowflake warehouse to use
+    :type warehouse: str
+
+    :return: Established Snowflake connection
+    :rtype: SnowflakeConnection
+    """
+    connection_key = (account, username, warehouse)
+
+    with _pool_lock:
+        idle_connections = _idle_connections.get(connection_key, [])
+
+        while idle_connections != []:
+            conn = idle_connections.pop()
+
+            if not conn.is_closed():
+                return conn
+
+            _connection_keys.pop(id(conn), None)
+
+    connect = get_connector()
+
+    with instrument('warehouse_connect', {'warehouse': 'snowflake'}):
+        conn = connect(
+            user=username,
+            password=password,
+            account=account,
+            warehouse=warehouse,
+            client_session_keep_alive=True
+        )
+
+    # Keep a reference to the connection so its id is not reused while it is checked out
+    with _pool_lock:
+        _connection_keys[id(conn)] = (connection_key, conn)
+
+    return conn
+
+def release_connection(
+        conn: object
+) -> None:
+    """
+    Return a Snowflake connection to the pool, closing it when it
+    is already closed or the pool of its credentials is full.
+
+    :param conn: Established Snowflake connection
+    :type conn: SnowflakeConnection
+    """
+    pool_size = int(os.getenv('SNOWFLAKE_POOL_SIZE', '4'))
+
+    with _pool_lock:
+        connection_key, _ = _connection_keys.get(id(conn), (None, None))
+
+        if connection_key is not None and not conn.is_closed():
+            idle_connections = _idle_connections.setdefault(connection_key, [])
+
+            if len(idle_connections) < pool_size:
+                idle_connections.append(conn)
+                return
+
+        _connection_keys.pop(id(conn), None)
+
+    conn.close()
+
+def discard_connection(
+        conn: object
+) -> None:
+    """
+    Close a Snowflake connection without returning it to the pool,
+    e.g. after it failed in the middle of a load.
+
+    :param conn: Established Snowflake connection
+    :type conn: SnowflakeConnection
+    """
+    with _pool_lock:
+        _connection_keys.pop(id(conn), None)
+
+    conn.close()
+
+def close_all_connections(
+) -> None:
+    """
+    Close every idle pooled Snowflake connection.
+    """
+    with _pool_lock:
+        connections = []
+
+        for idle_connections in _idle_connections.values():
+            connections.extend(idle_connections)
+
+        _idle_connections.clear()
+        _connection_keys.clear()
+
+    for conn in connections:
+        conn.close()
+
+@contextmanager
+def pooled_connection(
+        username: str,
+        password: str,
+        account: str,
+        warehouse: str
+) -> Iterator[object]:
+    """
+    Context manager around a pooled Snowflake connection. The
+    connection is returned to the pool when the block succeeds
+    and discarded when it raises.
+
+    :param username: Snowflake username
+    :type username: str
+
+    :param password: Snowflake password
+    :type password: str
+
+    :param account: Snowflake account identifier
+    :type account: str
+
+    :param warehouse: Name of the Snowflake warehouse to use
+    :type warehouse: str
+
+    :return: Established Snowflake connection
+    :rtype: Iterator[SnowflakeConnection]
+    """
+    conn = get_connection(
+        username,
+        password,
+        account,
+        warehouse
+    )
+
+    try:
+        yield conn
+
+    except BaseException:
+        discard_connection(conn)
+        raise
+
+    release_connection(conn)
+
+# Close the pooled sessions explicitly instead of letting them expire on the server
+atexit.register(close_all_connections)
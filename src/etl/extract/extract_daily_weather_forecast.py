@@ -2,139 +2,14 @@
 Docstring for etl.extract.extract_daily_weather_forecast
 """
 import pandas as pd
-import datetime
-import snowflake.connector as snowflake
-from snowflake.connector.pandas_tools import write_pandas
-
-def connect(
-        username: str,
-        password: str,
-        account: str,
-        warehouse: str               
-) -> snowflake.SnowflakeConnection:
-    """
-    Connect the credentials to the
-    Snowflake Data Warehouse.
-
-    :param username: Snowflake username
-    :type username: str
-
-    :param password: Snowflake password
-    :type password: str
-
-    :param account: Snowflake account
-        identifier
-    :type account: str
-
-    :param warehouse: Name of the Snowflake
-        warehouse to use
-    :type warehouse: str
-
-    :return: Established Snowflake connection
-    :rtype: SnowflakeConnection
-    """
-    conn = snowflake.connect(
-        user=username,
-        password=password,
-        account=account,
-        warehouse=warehouse
-    )
-
-    return conn
-
-def database_config(
-        conn: snowflake.SnowflakeConnection,
-        database: str,
-        schema: str,
-        table: str,
-        columns: dict[str, str]
-) -> None:
-    """
-    Configure Snowflake database by creating database,
-    schema, and a table for storing cleaned data.
-
-    :param conn: Established Snowflake connection
-    :type conn: snowflake.SnowflakeConnection
-
-    :param database: Name of the Snowflake database
-        to create
-    :type database: str
-
-    :param schema: Name of the Snowflake table schema
-        to create
-    :type schema: str
-   
-    :param table: Name of the Snowflake table to create
-    :type table: str
-
-    :param columns: Dictionary containing column names and
-        corresponding datatypes
-    :type columns: dict[str, str]
-    """
-    cursor = conn.cursor()
-
-    cursor.execute(
-        f"CREATE DATABASE IF NOT EXISTS {database}"
-    )
-    cursor.execute(
-        f"USE DATABASE {database}"
-    )
-    cursor.execute(
-        f"CREATE SCHEMA IF NOT EXISTS {database}.{schema}"
-    )
-    command_to_create_table = []
-
-    for column_name, data_type in columns.items():
-        command_to_create_table.append(
-            column_name + ' ' + data_type
-        )
-
-    command_to_create_table = ', '.join(command_to_create_table)
-    command_to_create_table = '(' + command_to_create_table + ')'
-    command_to_create_table = 'CREATE TABLE IF NOT EXISTS' + ' ' + schema + '.' + table + command_to_create_table
-    cursor.execute(
-        command_to_create_table
-    )
-
-def store_cleaned_data_to_snowflake(
-        conn: snowflake.SnowflakeConnection,
-        data: pd.DataFrame,
-        table: str,
-        database: str,
-        schema: str
-) -> None:
-    """
-    Store clean data as a DataFrame
-    object to the Snowflake Database.
-
-    :param conn: Established Snowflake
-        connection
-    :type conn: snowflake.SnowflakeConnection
-
-    :param data: Clean data as a DataFrame object
-    :type data: pd.DataFrame
-
-    :param table: Name of the Snowflake table to
-        load the clean data
-    :type table: str
-
-    :param database: Name of the Snowflake database
-    :type database: str
-
-    :param schema: Name of the Snowflake table schema
-    :type schema: str
-    """
-    write_pandas(
-        conn=conn,
-        df=data,
-        table_name=table,
-        database=database,
-        schema=schema
-    )
+from etl.extract.raw_artifacts import IssuedDatetimeRecord
+from etl.extract.raw_artifacts import SynopsisRecord
+from etl.extract.raw_artifacts import read_issued_datetime_records
+from etl.extract.raw_artifacts import read_synopsis_records
 
 def extract_issued_datetime(
         issued_datetime_filepath: str        
-) -> pd.DataFrame:
+) -> list[IssuedDatetimeRecord]:
     """
     Extract the ingested issued datetime
     from the subdirectory path `data/raw/daily_weather_forecasts`.
@@ -145,95 +20,76 @@ def extract_issued_datetime(
         `data/raw/daily_weather_forecasts`
     :type issued_datetime_filepath: str
 
-    :return: Issued datetime as a DataFrame object
-    :rtype: DataFrame
+    :return: Issued datetime records
+    :rtype: list[IssuedDatetimeRecord]
     """
-    issued_datetime_dataframe = pd.read_json(
+    issued_datetime_records = read_issued_datetime_records(
         issued_datetime_filepath
     )
 
-    return issued_datetime_dataframe
+    return issued_datetime_records
 
 def clean_issued_datetime(
-        issued_datetime_dataframe: pd.DataFrame
+        issued_datetime_records: list[IssuedDatetimeRecord]
 ) -> pd.DataFrame:
     """
-    Clean the issued datetime as a DataFrame object.
-
-    :param issued_datetime_dataframe: Issued datetime as
-        a DataFrame object
-    :type issued_datetime_dataframe: pd.DataFrame
-
-    :return: Cleaned issued datetime as a DataFrame object
-    :rtype: DataFrame
-    """
-    issued_datetime = issued_datetime_dataframe['issued_datetime'][0]
-    issued_datetime = str(issued_datetime)
-    issued_datetime = issued_datetime.replace('Issued at:', '')
-    issued_datetime = issued_datetime.strip()
+    Clean the issued datetime records as a DataFrame object.
 
-    issued_date = issued_datetime.split(', ')[1]
+    Every issued datetime (e.g. `Issued at: 5:00 PM,
+    28 January 2026`, or `Issued at: 6:00 PM today, 28 January 2026`
+    on the tourist areas page) is parsed at once with an explicit
+    format after normalizing the `Issued at:` prefix, the relative day
+    words, commas and whitespace, so a backfill of many snapshots is
+    cleaned in one vectorized pass.
 
-    day = issued_date.split()[0]
-    day = int(day)
+    :param issued_datetime_records: Issued datetime records
+    :type issued_datetime_records: list[IssuedDatetimeRecord]
 
-    month_dictionary = {
-        'January': '01',
-        'February': '02',
-        'March': '03',
-        'April': '04',
-        'May': '05',
-        'June': '06',
-        'July': '07',
-        'August': '08',
-        'September': '09',
-        'October': '10',
-        'November': '11',
-        'December': '12'
-    }
-    month = issued_date.split()[1]
-    month = month_dictionary[month]
-    month = int(month)
-
-    year = issued_date.split()[2]
-    year = int(year)
+    :return: Cleaned issued datetimes as a DataFrame object
+        with a row per issued datetime
+    :rtype: DataFrame
 
-    issued_date = datetime.date(
-        year,
-        month,
-        day
+    :raises ValueError: If issued datetimes do not match the
+        format, listing every issued datetime that failed
+    """
+    issued_datetimes = pd.Series(
+        [issued_datetime_record['issued_datetime'] for issued_datetime_record in issued_datetime_records],
+        dtype=str
     )
+    issued_datetimes = issued_datetimes.str.replace('Issued at:', '', regex=False)
+
+    # The date follows the relative day words, e.g. `6:00 PM today, 28 January 2026`
+    issued_datetimes = issued_datetimes.str.replace(r'\b(?:today|tonight|tomorrow)\b', ' ', regex=True, case=False)
+    issued_datetimes = issued_datetimes.str.replace(',', ' ', regex=False)
+    issued_datetimes = issued_datetimes.str.replace(r'\s+', ' ', regex=True)
+    issued_datetimes = issued_datetimes.str.strip()
+
+    # `%I` with `%p` maps 12 AM to midnight and 12 PM to noon
+    parsed_issued_datetimes = pd.to_datetime(
+        issued_datetimes,
+        format='%I:%M %p %d %B %Y',
+        errors='coerce'
+    )
+    unparsed_issued_datetimes = issued_datetimes[parsed_issued_datetimes.isna()]
 
-    issued_time = issued_datetime.split(', ')[0]
-
-    if 'PM' in issued_time:
-        issued_time = issued_time.replace('PM', '')
-        issued_time = issued_time.strip()
-        
-        hours = issued_time.split(':')[0]
-        hours = int(hours)
-        hours = hours + 12
-        issued_time = datetime.time(hours, 0)
-
-    else:
-        issued_time = issued_time.replace('AM', '')
-        issued_time = issued_time.strip()
+    if not unparsed_issued_datetimes.empty:
+        raise ValueError(
+            f'Unknown format of issued datetimes {list(unparsed_issued_datetimes)}, '
+            "expected e.g. 'Issued at: 5:00 PM, 28 January 2026'"
+        )
 
-        hours = issued_time.split(':')[0]
-        hours = int(hours)
-        issued_time = datetime.time(hours, 0)
-        issued_time = issued_time.strftime('%H:%M:%S')
+    issued_datetimes = parsed_issued_datetimes
 
     clean_issued_datetime = pd.DataFrame({
-        'ISSUED_DATE': [issued_date],
-        'ISSUED_TIME': [issued_time]
+        'ISSUED_DATE': issued_datetimes.dt.date,
+        'ISSUED_TIME': issued_datetimes.dt.time
     })
 
     return clean_issued_datetime
 
 def extract_synopsis(
         synopsis_filepath: str
-) -> pd.DataFrame:
+) -> list[SynopsisRecord]:
     """
     Extract the ingested synopsis from the subdirectory
     path `data/raw/daily_weather_forecasts`.
@@ -243,34 +99,51 @@ def extract_synopsis(
         `data/raw/daily_weather_forecasts`
     :type synopsis_filepath: str
 
-    :return: Synopsis as a DataFrame object
-    :rtype: DataFrame
+    :return: Synopsis records
+    :rtype: list[SynopsisRecord]
     """
-    synopsis_dataframe = pd.read_json(
+    synopsis_records = read_synopsis_records(
         synopsis_filepath
     )
 
-    return synopsis_dataframe
+    return synopsis_records
 
 def clean_synopsis(
-        synopsis_dataframe: pd.DataFrame
+        synopsis_records: list[SynopsisRecord],
+        clean_issued_datetime: pd.DataFrame
 ) -> pd.DataFrame:
     """
-    Clean the synopsis as a DataFrame object.
+    Clean the synopsis records as a DataFrame object, keyed by
+    the issued datetime of the forecast they were issued with, so
+    the same synopsis issued on two days is kept twice.
+
+    :param synopsis_records: Synopsis records
+    :type synopsis_records: list[SynopsisRecord]
 
-    :param synopsis_dataframe: Synopsis as a
-        DataFrame object
-    :type synopsis_dataframe: pd.DataFrame
+    :param clean_issued_datetime: Cleaned issued datetimes with a
+        row per synopsis record
+    :type clean_issued_datetime: pd.DataFrame
 
     :return: Cleaned synopsis as a DataFrame object
     :rtype: DataFrame
     """
-    synopsis = synopsis_dataframe['synopsis'][0]
-    synopsis = str(synopsis)
-    synopsis = synopsis.strip()
+    if len(synopsis_records) != len(clean_issued_datetime):
+        raise ValueError(
+            f'Expected an issued datetime per synopsis, got {len(clean_issued_datetime)} '
+            f'issued datetimes for {len(synopsis_records)} synopses'
+        )
+
+    synopses = []
+
+    for synopsis_record in synopsis_records:
+        synopsis = synopsis_record['synopsis']
+        synopsis = synopsis.strip()
+        synopses.append(synopsis)
 
     clean_synopsis = pd.DataFrame({
-        "SYNOPSIS": [synopsis]
+        'ISSUED_DATE': list(clean_issued_datetime['ISSUED_DATE']),
+        'ISSUED_TIME': list(clean_issued_datetime['ISSUED_TIME']),
+        'SYNOPSIS': synopses
     })
 
     return clean_synopsis
\ No newline at end of file
@@ -0,0 +1,174 @@
+"""
+Docstring for etl.extract.extract_weather_outlook_for_ph_cities
+"""
+from __future__ import annotations
+
+import pandas as pd
+import datetime
+from typing import TYPE_CHECKING
+from etl.extract.raw_artifacts import WeatherOutlookRecord
+from etl.extract.raw_artifacts import read_weather_outlook_records
+from etl.extract.raw_artifacts import read_raw_table
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+def extract_ph_city_weather_outlooks(
+        weather_outlook_for_ph_cities_filepath: str
+) -> dict[str, WeatherOutlookRecord]:
+    """
+    Extract the ingested weather outlook for selected
+    Philippine cities from the subdirectory path
+    `data/raw/weather_outlooks_for_ph_cities`.
+
+    :param weather_outlook_for_ph_cities_filepath: Filepath
+        of the ingested weather outlook for selected Philippine
+        cities from the subdirectory path
+        `data/raw/weather_outlooks_for_ph_cities`
+    :type weather_outlook_for_ph_cities_filepath: str
+
+    :return: Dictionary containing city names and
+        corresponding weather outlook records
+    :rtype: dict[str, WeatherOutlookRecord]
+    """
+    weather_outlook_for_ph_cities_records = read_weather_outlook_records(
+        weather_outlook_for_ph_cities_filepath
+    )
+
+    return weather_outlook_for_ph_cities_records
+
+def clean_ph_city_weather_outlooks(
+        weather_outlook_for_ph_cities_records: dict[str, WeatherOutlookRecord]
+) -> pd.DataFrame:
+    """
+    Clean the weather outlook for selected Philippine cities
+    as a DataFrame object with a row per city and weather date.
+
+    :param weather_outlook_for_ph_cities_records: Dictionary
+        containing city names and corresponding weather
+        outlook records
+    :type weather_outlook_for_ph_cities_records: dict[str, WeatherOutlookRecord]
+
+    :return: Cleaned weather outlook for selected Philippine
+        cities as a DataFrame object
+    :rtype: DataFrame
+    """
+    cities = []
+    weather_dates = []
+    minimum_temperatures = []
+    maximum_temperatures = []
+    chance_of_rain_percentages = []
+
+    for city, weather_outlook in weather_outlook_for_ph_cities_records.items():
+        city = ' '.join(str(city).split())
+
+        for weather_date, temperature_range, chance_of_rain_percentage in zip(
+            weather_outlook['weather_date'],
+            weather_outlook['temperature_range'],
+            weather_outlook['chance_of_rain_percentage']
+        ):
+            weather_date = ' '.join(str(weather_date).split())
+            weather_date = datetime.datetime.strptime(
+                weather_date,
+                '%A %B %d, %Y'
+            ).date()
+
+            minimum_temperature = None
+            maximum_temperature = None
+
+            if len(temperature_range) == 2:
+                minimum_temperature = int(temperature_range[0].replace('°C', '').strip())
+                maximum_temperature = int(temperature_range[1].replace('°C', '').strip())
+
+            chance_of_rain_percentage = str(chance_of_rain_percentage)
+            chance_of_rain_percentage = chance_of_rain_percentage.replace('Chance of rain:', '')
+            chance_of_rain_percentage = chance_of_rain_percentage.replace('%', '')
+            chance_of_rain_percentage = chance_of_rain_percentage.strip()
+
+            if chance_of_rain_percentage.isdigit():
+                chance_of_rain_percentage = int(chance_of_rain_percentage)
+
+            else:
+                chance_of_rain_percentage = None
+
+            cities.append(city)
+            weather_dates.append(weather_date)
+            minimum_temperatures.append(minimum_temperature)
+            maximum_temperatures.append(maximum_temperature)
+            chance_of_rain_percentages.append(chance_of_rain_percentage)
+
+    clean_weather_outlook_for_ph_cities = pd.DataFrame({
+        'CITY': cities,
+        'WEATHER_DATE': weather_dates,
+        'MINIMUM_TEMPERATURE': pd.array(minimum_temperatures, dtype='Int64'),
+        'MAXIMUM_TEMPERATURE': pd.array(maximum_temperatures, dtype='Int64'),
+        'CHANCE_OF_RAIN_PERCENTAGE': pd.array(chance_of_rain_percentages, dtype='Int64')
+    })
+
+    return clean_weather_outlook_for_ph_cities
+
+def extract_ph_city_weather_outlook_table(
+        weather_outlook_for_ph_cities_parquet_filepath: str
+) -> pa.Table:
+    """
+    Extract the tidy Parquet snapshot of the weather outlook for
+    selected Philippine cities from the subdirectory path
+    `data/raw/weather_outlooks_for_ph_cities`.
+
+    :param weather_outlook_for_ph_cities_parquet_filepath: Filepath
+        of the Parquet snapshot of the weather outlook for selected
+        Philippine cities
+    :type weather_outlook_for_ph_cities_parquet_filepath: str
+
+    :return: Memory-mapped table with a row per city
+        and weather date
+    :rtype: pa.Table
+    """
+    weather_outlook_for_ph_cities_table = read_raw_table(
+        weather_outlook_for_ph_cities_parquet_filepath
+    )
+
+    return weather_outlook_for_ph_cities_table
+
+def clean_ph_city_weather_outlook_table(
+        weather_outlook_for_ph_cities_table: pa.Table
+) -> pd.DataFrame:
+    """
+    Clean the tidy table of the weather outlook for selected
+    Philippine cities as a DataFrame object, parsing every
+    column at once.
+
+    :param weather_outlook_for_ph_cities_table: Table with a row
+        per city and weather date
+    :type weather_outlook_for_ph_cities_table: pa.Table
+
+    :return: Cleaned weather outlook for selected Philippine
+        cities as a DataFrame object
+    :rtype: DataFrame
+    """
+    weather_outlook_table = weather_outlook_for_ph_cities_table.to_pandas()
+
+    weather_dates = pd.to_datetime(
+        weather_outlook_table['weather_date'],
+        format='%A %B %d, %Y'
+    )
+
+    minimum_temperatures = weather_outlook_table['minimum_temperature'].str.replace('°C', '', regex=False).str.strip()
+    minimum_temperatures = pd.to_numeric(minimum_temperatures, errors='coerce').astype('Int64')
+
+    maximum_temperatures = weather_outlook_table['maximum_temperature'].str.replace('°C', '', regex=False).str.strip()
+    maximum_temperatures = pd.to_numeric(maximum_temperatures, errors='coerce').astype('Int64')
+
+    chance_of_rain_percentages = weather_outlook_table['chance_of_rain_percentage'].str.replace('Chance of rain:', '', regex=False)
+    chance_of_rain_percentages = chance_of_rain_percentages.str.replace('%', '', regex=False).str.strip()
+    chance_of_rain_percentages = pd.to_numeric(chance_of_rain_percentages, errors='coerce').astype('Int64')
+
+    clean_weather_outlook_for_ph_cities = pd.DataFrame({
+        'CITY': weather_outlook_table['city'],
+        'WEATHER_DATE': weather_dates.dt.date,
+        'MINIMUM_TEMPERATURE': minimum_temperatures,
+        'MAXIMUM_TEMPERATURE': maximum_temperatures,
+        'CHANCE_OF_RAIN_PERCENTAGE': chance_of_rain_percentages
+    })
+
+    return clean_weather_outlook_for_ph_cities
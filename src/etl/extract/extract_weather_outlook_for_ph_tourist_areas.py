@@ -0,0 +1,155 @@
+"""
+Docstring for etl.extract.extract_weather_outlook_for_ph_tourist_areas
+"""
+from __future__ import annotations
+
+import pandas as pd
+import datetime
+from typing import TYPE_CHECKING
+from etl.extract.raw_artifacts import WeatherOutlookRecord
+from etl.extract.raw_artifacts import read_weather_outlook_records
+from etl.extract.raw_artifacts import read_raw_table
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+def extract_ph_tourist_area_weather_outlooks(
+        weather_outlook_for_ph_tourist_areas_filepath: str
+) -> dict[str, WeatherOutlookRecord]:
+    """
+    Extract the ingested weather outlook for selected
+    Philippine tourist areas from the subdirectory path
+    `data/raw/weather_outlooks_for_ph_tourist_areas`.
+
+    :param weather_outlook_for_ph_tourist_areas_filepath: Filepath
+        of the ingested weather outlook for selected Philippine
+        tourist areas from the subdirectory path
+        `data/raw/weather_outlooks_for_ph_tourist_areas`
+    :type weather_outlook_for_ph_tourist_areas_filepath: str
+
+    :return: Dictionary containing tourist area names and
+        corresponding weather outlook records
+    :rtype: dict[str, WeatherOutlookRecord]
+    """
+    weather_outlook_for_ph_tourist_areas_records = read_weather_outlook_records(
+        weather_outlook_for_ph_tourist_areas_filepath
+    )
+
+    return weather_outlook_for_ph_tourist_areas_records
+
+def clean_ph_tourist_area_weather_outlooks(
+        weather_outlook_for_ph_tourist_areas_records: dict[str, WeatherOutlookRecord]
+) -> pd.DataFrame:
+    """
+    Clean the weather outlook for selected Philippine tourist
+    areas as a DataFrame object with a row per tourist area
+    and weather date.
+
+    :param weather_outlook_for_ph_tourist_areas_records: Dictionary
+        containing tourist area names and corresponding weather
+        outlook records
+    :type weather_outlook_for_ph_tourist_areas_records: dict[str, WeatherOutlookRecord]
+
+    :return: Cleaned weather outlook for selected Philippine
+        tourist areas as a DataFrame object
+    :rtype: DataFrame
+    """
+    tourist_areas = []
+    weather_dates = []
+    minimum_temperatures = []
+    maximum_temperatures = []
+
+    for tourist_area, weather_outlook in weather_outlook_for_ph_tourist_areas_records.items():
+        tourist_area = ' '.join(str(tourist_area).split())
+
+        for weather_date, temperature_range in zip(
+            weather_outlook['weather_date'],
+            weather_outlook['temperature_range']
+        ):
+            weather_date = ' '.join(str(weather_date).split())
+            weather_date = datetime.datetime.strptime(
+                weather_date,
+                '%A %B %d, %Y'
+            ).date()
+
+            minimum_temperature = None
+            maximum_temperature = None
+
+            if len(temperature_range) == 2:
+                minimum_temperature = int(temperature_range[0].replace('°C', '').strip())
+                maximum_temperature = int(temperature_range[1].replace('°C', '').strip())
+
+            tourist_areas.append(tourist_area)
+            weather_dates.append(weather_date)
+            minimum_temperatures.append(minimum_temperature)
+            maximum_temperatures.append(maximum_temperature)
+
+    clean_weather_outlook_for_ph_tourist_areas = pd.DataFrame({
+        'TOURIST_AREA': tourist_areas,
+        'WEATHER_DATE': weather_dates,
+        'MINIMUM_TEMPERATURE': pd.array(minimum_temperatures, dtype='Int64'),
+        'MAXIMUM_TEMPERATURE': pd.array(maximum_temperatures, dtype='Int64')
+    })
+
+    return clean_weather_outlook_for_ph_tourist_areas
+
+def extract_ph_tourist_area_weather_outlook_table(
+        weather_outlook_for_ph_tourist_areas_parquet_filepath: str
+) -> pa.Table:
+    """
+    Extract the tidy Parquet snapshot of the weather outlook for
+    selected Philippine tourist areas from the subdirectory path
+    `data/raw/weather_outlooks_for_ph_tourist_areas`.
+
+    :param weather_outlook_for_ph_tourist_areas_parquet_filepath: Filepath
+        of the Parquet snapshot of the weather outlook for selected
+        Philippine tourist areas
+    :type weather_outlook_for_ph_tourist_areas_parquet_filepath: str
+
+    :return: Memory-mapped table with a row per tourist area
+        and weather date
+    :rtype: pa.Table
+    """
+    weather_outlook_for_ph_tourist_areas_table = read_raw_table(
+        weather_outlook_for_ph_tourist_areas_parquet_filepath
+    )
+
+    return weather_outlook_for_ph_tourist_areas_table
+
+def clean_ph_tourist_area_weather_outlook_table(
+        weather_outlook_for_ph_tourist_areas_table: pa.Table
+) -> pd.DataFrame:
+    """
+    Clean the tidy table of the weather outlook for selected
+    Philippine tourist areas as a DataFrame object, parsing every
+    column at once.
+
+    :param weather_outlook_for_ph_tourist_areas_table: Table with a row
+        per tourist area and weather date
+    :type weather_outlook_for_ph_tourist_areas_table: pa.Table
+
+    :return: Cleaned weather outlook for selected Philippine
+        tourist areas as a DataFrame object
+    :rtype: DataFrame
+    """
+    weather_outlook_table = weather_outlook_for_ph_tourist_areas_table.to_pandas()
+
+    weather_dates = pd.to_datetime(
+        weather_outlook_table['weather_date'],
+        format='%A %B %d, %Y'
+    )
+
+    minimum_temperatures = weather_outlook_table['minimum_temperature'].str.replace('°C', '', regex=False).str.strip()
+    minimum_temperatures = pd.to_numeric(minimum_temperatures, errors='coerce').astype('Int64')
+
+    maximum_temperatures = weather_outlook_table['maximum_temperature'].str.replace('°C', '', regex=False).str.strip()
+    maximum_temperatures = pd.to_numeric(maximum_temperatures, errors='coerce').astype('Int64')
+
+    clean_weather_outlook_for_ph_tourist_areas = pd.DataFrame({
+        'TOURIST_AREA': weather_outlook_table['tourist_area'],
+        'WEATHER_DATE': weather_dates.dt.date,
+        'MINIMUM_TEMPERATURE': minimum_temperatures,
+        'MAXIMUM_TEMPERATURE': maximum_temperatures
+    })
+
+    return clean_weather_outlook_for_ph_tourist_areas
@@ -0,0 +1,152 @@
+"""
+Local fake of the Snowflake connector for offline runs.
+
+This module mimics the parts of `snowflake.connector` used by the
+extract stages (`connect()`, cursors, `execute()`, `commit()`,
+`rollback()`, `close()` and `is_closed()`) without any network access.
+Executed statements are recorded on the connection, so the connection
+pool and the extract stages can be exercised offline by setting
+`SNOWFLAKE_CONNECTOR=fake`. Statements starting with one of the
+`failing_statements` prefixes of the connection raise a
+`FakeSnowflakeError`, so failed loads can be exercised too.
+
+Main function:
+- `connect()` - Open a fake Snowflake connection
+"""
+import itertools
+
+_connection_ids = itertools.count(1)
+
+class FakeSnowflakeError(Exception):
+    """
+    Error raised by a failing statement of a fake Snowflake connection.
+    """
+
+class FakeSnowflakeCursor:
+    """
+    Fake Snowflake cursor recording the executed statements
+    on its connection.
+    """
+    def __init__(
+            self,
+            connection: 'FakeSnowflakeConnection'
+    ) -> None:
+        self.connection = connection
+        self.rowcount = 0
+        self._rows = []
+
+    def execute(
+            self,
+            command: str,
+            params: object | None = None
+    ) -> 'FakeSnowflakeCursor':
+        if self.connection.is_closed():
+            raise RuntimeError('Connection is closed')
+
+        self.connection.executed_statements.append(
+            command
+        )
+        self._rows = []
+
+        for failing_statement in self.connection.failing_statements:
+            if command.startswith(failing_statement):
+                raise FakeSnowflakeError(
+                    f'Statement failed: {command}'
+                )
+
+        return self
+
+    def fetchone(
+            self
+    ) -> tuple | None:
+        if self._rows == []:
+            return None
+
+        return self._rows[0]
+
+    def fetchall(
+            self
+    ) -> list[tuple]:
+        return self._rows
+
+    def close(
+            self
+    ) -> None:
+        return None
+
+class FakeSnowflakeConnection:
+    """
+    Fake Snowflake connection recording the executed statements.
+    """
+    def __init__(
+            self,
+            user: str,
+            account: str,
+            warehouse: str,
+            **kwargs
+    ) -> None:
+        self.connection_id = next(_connection_ids)
+        self.user = user
+        self.account = account
+        self.warehouse = warehouse
+        self.options = kwargs
+        self.executed_statements = []
+        self.failing_statements = []
+        self._closed = False
+
+    def cursor(
+            self
+    ) -> FakeSnowflakeCursor:
+        return FakeSnowflakeCursor(self)
+
+    def commit(
+            self
+    ) -> None:
+        self.executed_statements.append('COMMIT')
+
+    def rollback(
+            self
+    ) -> None:
+        self.executed_statements.append('ROLLBACK')
+
+    def close(
+            self
+    ) -> None:
+        self._closed = True
+
+    def is_closed(
+            self
+    ) -> bool:
+        return self._closed
+
+def connect(
+        user: str,
+        password: str,
+        account: str,
+        warehouse: str,
+        **kwargs
+) -> FakeSnowflakeConnection:
+    """
+    Open a fake Snowflake connection.
+
+    :param user: Snowflake username
+    :type user: str
+
+    :param password: Snowflake password (ignored)
+    :type password: str
+
+    :param account: Snowflake account identifier
+    :type account: str
+
+    :param warehouse: Name of the Snowflake warehouse to use
+    :type warehouse: str
+
+    :return: Fake Snowflake connection
+    :rtype: FakeSnowflakeConnection
+    """
+    return FakeSnowflakeConnection(
+        user,
+        account,
+        warehouse,
+        **kwargs
+    )
@@ -0,0 +1,166 @@
+"""
+Typed readers of the raw artifacts ingested under `data/raw/`.
+
+This module loads the JSON artifacts saved by the ingest workflows
+into plain typed records instead of DataFrame objects, so reading an
+80-byte artifact does not go through the pandas JSON reader. The
+extract modules clean the records and only build a DataFrame at the
+load boundary. Artifacts are decoded with `orjson` when installed,
+otherwise with the standard `json` module. Both the `pretty` and the
+`compact` layouts of `ingest.json_output` are accepted. The optional
+Parquet snapshots of `ingest.parquet_output` are memory-mapped with
+`pyarrow` instead of being read into memory.
+
+Main functions:
+- `load_raw_artifact()` - Decode a raw JSON artifact
+- `read_issued_datetime_records()` - Read issued datetime records
+- `read_synopsis_records()` - Read synopsis records
+- `read_weather_outlook_records()` - Read weather outlook records
+- `read_raw_table()` - Memory-map a Parquet snapshot
+"""
+from __future__ import annotations
+
+import json
+from typing import TypedDict
+from typing import TYPE_CHECKING
+
+try:
+    import orjson
+
+except ImportError:
+    orjson = None
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+class IssuedDatetimeRecord(TypedDict):
+    issued_datetime: str
+
+class SynopsisRecord(TypedDict):
+    synopsis: str
+
+class WeatherOutlookRecord(TypedDict, total=False):
+    weather_date: list[str]
+    temperature_range: list[list[str]]
+    chance_of_rain_percentage: list[str]
+
+def load_raw_artifact(
+        raw_artifact_filepath: str
+) -> object:
+    """
+    Decode a raw JSON artifact.
+
+    :param raw_artifact_filepath: Filepath of the raw JSON artifact
+    :type raw_artifact_filepath: str
+
+    :return: Decoded JSON document
+    :rtype: object
+    """
+    with open(raw_artifact_filepath, 'rb') as json_file:
+        raw_artifact = json_file.read()
+
+    if orjson is not None:
+        return orjson.loads(raw_artifact)
+
+    return json.loads(raw_artifact)
+
+def read_issued_datetime_records(
+        issued_datetime_filepath: str
+) -> list[IssuedDatetimeRecord]:
+    """
+    Read the issued datetime records of a raw artifact, including
+    the artifacts saved with the misspelled `isssued_datetime` key.
+
+    :param issued_datetime_filepath: Filepath of the ingested
+        issued datetime
+    :type issued_datetime_filepath: str
+
+    :return: Issued datetime records
+    :rtype: list[IssuedDatetimeRecord]
+    """
+    issued_datetime_records = []
+
+    for raw_record in load_raw_artifact(issued_datetime_filepath):
+        issued_datetime = raw_record.get('issued_datetime', raw_record.get('isssued_datetime'))
+        issued_datetime_records.append({
+            'issued_datetime': str(issued_datetime)
+        })
+
+    return issued_datetime_records
+
+def read_synopsis_records(
+        synopsis_filepath: str
+) -> list[SynopsisRecord]:
+    """
+    Read the synopsis records of a raw artifact.
+
+    :param synopsis_filepath: Filepath of the ingested synopsis
+    :type synopsis_filepath: str
+
+    :return: Synopsis records
+    :rtype: list[SynopsisRecord]
+    """
+    synopsis_records = []
+
+    for raw_record in load_raw_artifact(synopsis_filepath):
+        synopsis_records.append({
+            'synopsis': str(raw_record['synopsis'])
+        })
+
+    return synopsis_records
+
+def read_weather_outlook_records(
+        weather_outlook_filepath: str
+) -> dict[str, WeatherOutlookRecord]:
+    """
+    Read the weather outlook records of a raw artifact of the
+    weather outlook for selected Philippine cities or tourist areas,
+    copying the shared weather dates of a `compact` artifact back into
+    the record of every city or tourist area.
+
+    :param weather_outlook_filepath: Filepath of the ingested
+        weather outlook
+    :type weather_outlook_filepath: str
+
+    :return: Dictionary containing city or tourist area names
+        and corresponding weather outlook records
+    :rtype: dict[str, WeatherOutlookRecord]
+    """
+    raw_artifact = load_raw_artifact(
+        weather_outlook_filepath
+    )
+
+    if 'weather_outlooks' not in raw_artifact or 'weather_date' not in raw_artifact:
+        return raw_artifact
+
+    weather_outlook_records = {}
+
+    for name, raw_record in raw_artifact['weather_outlooks'].items():
+        weather_outlook_record = {
+            'weather_date': raw_artifact['weather_date']
+        }
+        weather_outlook_record.update(raw_record)
+        weather_outlook_records[name] = weather_outlook_record
+
+    return weather_outlook_records
+
+def read_raw_table(
+        parquet_filepath: str
+) -> pa.Table:
+    """
+    Memory-map the tidy table of a Parquet snapshot.
+
+    :param parquet_filepath: Filepath of the Parquet snapshot
+    :type parquet_filepath: str
+
+    :return: Tidy table of the Parquet snapshot
+    :rtype: pa.Table
+    """
+    import pyarrow.parquet as pq
+
+    raw_table = pq.read_table(
+        parquet_filepath,
+        memory_map=True
+    )
+
+    return raw_table
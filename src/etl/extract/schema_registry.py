@@ -0,0 +1,272 @@
+"""
+Registry of the SILVER tables loaded by the extract stages.
+
+This module declares every SILVER table (database, schema, columns and
+natural keys) in one place and bootstraps them in Snowflake with `CREATE ... IF NOT
+EXISTS` statements, adding the declared columns missing from existing
+tables with `ALTER TABLE ... ADD COLUMN IF NOT EXISTS`. The bootstrap runs at most once per process, and
+the fingerprint of the declared tables is cached locally under
+`data/cache/schema_bootstrap.json` after a successful bootstrap, so
+the DDL round trips are only issued again when the declared tables
+change (or the cache is invalidated after a failed load).
+
+Configuration (environment variables):
+- `PAGASA_SCHEMA_BOOTSTRAP_CACHE` - Set to `0` to ignore the local
+    cache and bootstrap once per process (default: 1)
+
+Main functions:
+- `compute_schema_fingerprint()` - Fingerprint the declared tables
+- `bootstrap_schemas()` - Create the declared tables when needed
+- `invalidate_schema_bootstrap_cache()` - Force the next bootstrap
+"""
+import os
+import json
+import hashlib
+import threading
+
+SCHEMA_BOOTSTRAP_CACHE_FILEPATH = 'data/cache/schema_bootstrap.json'
+
+SILVER_TABLES = {
+    'ISSUED_DATETIMES': {
+        'database': 'SILVER',
+        'schema': 'DAILY_WEATHER_FORECASTS',
+        'columns': {
+            'ISSUED_DATE': 'DATE',
+            'ISSUED_TIME': 'TIME'
+        },
+        'keys': ['ISSUED_DATE', 'ISSUED_TIME']
+    },
+    'SYNOPSES': {
+        'database': 'SILVER',
+        'schema': 'DAILY_WEATHER_FORECASTS',
+        'columns': {
+            'ISSUED_DATE': 'DATE',
+            'ISSUED_TIME': 'TIME',
+            'SYNOPSIS': 'VARCHAR'
+        },
+        'keys': ['ISSUED_DATE', 'ISSUED_TIME']
+    },
+    'CITY_WEATHER_OUTLOOKS': {
+        'database': 'SILVER',
+        'schema': 'WEATHER_OUTLOOKS_FOR_PH_CITIES',
+        'columns': {
+            'CITY': 'VARCHAR',
+            'WEATHER_DATE': 'DATE',
+            'MINIMUM_TEMPERATURE': 'NUMBER',
+            'MAXIMUM_TEMPERATURE': 'NUMBER',
+            'CHANCE_OF_RAIN_PERCENTAGE': 'NUMBER'
+        },
+        'keys': ['CITY', 'WEATHER_DATE']
+    },
+    'TOURIST_AREA_WEATHER_OUTLOOKS': {
+        'database': 'SILVER',
+        'schema': 'WEATHER_OUTLOOKS_FOR_PH_TOURIST_AREAS',
+        'columns': {
+            'TOURIST_AREA': 'VARCHAR',
+            'WEATHER_DATE': 'DATE',
+            'MINIMUM_TEMPERATURE': 'NUMBER',
+            'MAXIMUM_TEMPERATURE': 'NUMBER'
+        },
+        'keys': ['TOURIST_AREA', 'WEATHER_DATE']
+    }
+}
+
+_bootstrapped_fingerprints = set()
+_bootstrap_lock = threading.Lock()
+
+def compute_schema_fingerprint(
+        tables: dict[str, dict]
+) -> str:
+    """
+    Compute the fingerprint of declared tables.
+
+    :param tables: Dictionary containing table names and corresponding
+        declarations (database, schema, columns and keys)
+    :type tables: dict[str, dict]
+
+    :return: Hexadecimal SHA-256 fingerprint of the declared tables
+    :rtype: str
+    """
+    declaration = json.dumps(tables, sort_keys=True)
+
+    return hashlib.sha256(declaration.encode('utf-8')).hexdigest()
+
+def build_schema_ddl(
+        tables: dict[str, dict]
+) -> list[str]:
+    """
+    Build the DDL statements creating the declared tables, creating
+    every database and schema only once and adding the declared
+    columns missing from tables created by an older declaration.
+
+    :param tables: Dictionary containing table names and corresponding
+        declarations (database, schema, columns and keys)
+    :type tables: dict[str, dict]
+
+    :return: DDL statements creating the declared tables
+    :rtype: list[str]
+    """
+    databases = []
+    schemas = []
+    commands_to_create_tables = []
+    commands_to_add_columns = []
+
+    for table, declaration in tables.items():
+        database = declaration['database']
+        schema = declaration['database'] + '.' + declaration['schema']
+
+        if database not in databases:
+            databases.append(database)
+
+        if schema not in schemas:
+            schemas.append(schema)
+
+        command_to_create_table = []
+
+        for column_name, data_type in declaration['columns'].items():
+            command_to_create_table.append(
+                column_name + ' ' + data_type
+            )
+            commands_to_add_columns.append(
+                f'ALTER TABLE {schema}.{table} ADD COLUMN IF NOT EXISTS {column_name} {data_type}'
+            )
+
+        command_to_create_table = ', '.join(command_to_create_table)
+        command_to_create_table = '(' + command_to_create_table + ')'
+        command_to_create_table = 'CREATE TABLE IF NOT EXISTS' + ' ' + schema + '.' + table + command_to_create_table
+        commands_to_create_tables.append(
+            command_to_create_table
+        )
+
+    schema_ddl = []
+
+    for database in databases:
+        schema_ddl.append(f'CREATE DATABASE IF NOT EXISTS {database}')
+
+    for schema in schemas:
+        schema_ddl.append(f'CREATE SCHEMA IF NOT EXISTS {schema}')
+
+    schema_ddl.extend(commands_to_create_tables)
+    schema_ddl.extend(commands_to_add_columns)
+
+    return schema_ddl
+
+def load_schema_bootstrap_cache(
+) -> dict[str, str]:
+    """
+    Load the fingerprints of the last successful bootstraps.
+
+    :return: Dictionary containing Snowflake accounts and corresponding
+        fingerprints of the last successful bootstrap
+    :rtype: dict[str, str]
+    """
+    if os.getenv('PAGASA_SCHEMA_BOOTSTRAP_CACHE', '1') == '0':
+        return {}
+
+    if not os.path.exists(SCHEMA_BOOTSTRAP_CACHE_FILEPATH):
+        return {}
+
+    with open(SCHEMA_BOOTSTRAP_CACHE_FILEPATH, 'r') as json_file:
+        schema_bootstrap_cache = json.load(json_file)
+
+    return schema_bootstrap_cache
+
+def save_schema_bootstrap_cache(
+        schema_bootstrap_cache: dict[str, str]
+) -> None:
+    """
+    Save the fingerprints of the last successful bootstraps.
+
+    :param schema_bootstrap_cache: Dictionary containing Snowflake
+        accounts and corresponding fingerprints of the last successful
+        bootstrap
+    :type schema_bootstrap_cache: dict[str, str]
+    """
+    if os.getenv('PAGASA_SCHEMA_BOOTSTRAP_CACHE', '1') == '0':
+        return
+
+    cache_dir = os.path.dirname(SCHEMA_BOOTSTRAP_CACHE_FILEPATH)
+
+    if not os.path.exists(cache_dir):
+        os.makedirs(cache_dir)
+
+    with open(SCHEMA_BOOTSTRAP_CACHE_FILEPATH, 'w') as json_file:
+        json.dump(schema_bootstrap_cache, json_file, indent=4)
+
+def bootstrap_schemas(
+        conn: object,
+        account: str,
+        tables: dict[str, dict] | None = None
+) -> bool:
+    """
+    Create the declared databases, schemas and tables unless they were
+    already bootstrapped by this process or, according to the local
+    cache, by a previous process with the same declarations.
+
+    :param conn: Established Snowflake connection
+    :type conn: SnowflakeConnection
+
+    :param account: Snowflake account identifier the cache is keyed by
+    :type account: str
+
+    :param tables: Dictionary containing table names and corresponding
+        declarations, or NoneType to use the SILVER tables
+    :type tables: dict[str, dict] | None
+
+    :return: True if DDL statements were issued, otherwise False
+    :rtype: bool
+    """
+    if tables is None:
+        tables = SILVER_TABLES
+
+    fingerprint = compute_schema_fingerprint(
+        tables
+    )
+
+    with _bootstrap_lock:
+        if (account, fingerprint) in _bootstrapped_fingerprints:
+            return False
+
+        schema_bootstrap_cache = load_schema_bootstrap_cache()
+
+        if schema_bootstrap_cache.get(account) == fingerprint:
+            _bootstrapped_fingerprints.add((account, fingerprint))
+            return False
+
+        cursor = conn.cursor()
+
+        for command in build_schema_ddl(tables):
+            cursor.execute(
+                command
+            )
+
+        schema_bootstrap_cache[account] = fingerprint
+        save_schema_bootstrap_cache(
+            schema_bootstrap_cache
+        )
+        _bootstrapped_fingerprints.add((account, fingerprint))
+
+    return True
+
+def invalidate_schema_bootstrap_cache(
+        account: str
+) -> None:
+    """
+    Invalidate the bootstrap of an account, e.g. after a load failed
+    because a table was dropped, so the next load bootstraps again.
+
+    :param account: Snowflake account identifier
+    :type account: str
+    """
+    with _bootstrap_lock:
+        for bootstrapped_fingerprint in list(_bootstrapped_fingerprints):
+            if bootstrapped_fingerprint[0] == account:
+                _bootstrapped_fingerprints.discard(bootstrapped_fingerprint)
+
+        schema_bootstrap_cache = load_schema_bootstrap_cache()
+
+        if account in schema_bootstrap_cache:
+            del schema_bootstrap_cache[account]
+            save_schema_bootstrap_cache(
+                schema_bootstrap_cache
+            )
@@ -0,0 +1,90 @@
+"""
+Warehouse abstraction of the extract stages.
+
+This module selects the warehouse the extract stages load the SILVER
+tables into. Every warehouse backend is a module implementing the
+same three functions, so the extract executors do not depend on
+Snowflake and full pipeline runs (e.g. throughput tests or backfills)
+can load a local database without network access or warehouse credits:
+
+- `warehouse_connection()` - Context manager around a connection
+- `create_tables()` - Create the declared SILVER tables
+- `write_dataframes()` - Write cleaned DataFrames into their tables
+
+Backends are imported on first use, so selecting a local backend
+never imports the Snowflake connector.
+
+Configuration (environment variables):
+- `PAGASA_WAREHOUSE` - `snowflake` (default), `sqlite` or `duckdb`
+- `PAGASA_LOAD_MODE` - `merge` (default) or `append`
+
+Main functions:
+- `get_warehouse_backend()` - Import the configured warehouse backend
+- `get_warehouse_settings()` - Get the warehouse and load mode the
+    extract stages load into
+"""
+import os
+import importlib
+from types import ModuleType
+
+WAREHOUSE_BACKENDS = {
+    'snowflake': 'etl.extract.warehouse_snowflake',
+    'sqlite': 'etl.extract.warehouse_sqlite',
+    'duckdb': 'etl.extract.warehouse_duckdb'
+}
+
+def get_warehouse_backend(
+        warehouse_name: str | None = None
+) -> ModuleType:
+    """
+    Import the module of a warehouse backend.
+
+    :param warehouse_name: Name of the warehouse backend, or
+        NoneType to use `PAGASA_WAREHOUSE`
+    :type warehouse_name: str | None
+
+    :return: Module of the warehouse backend
+    :rtype: ModuleType
+    """
+    if warehouse_name is None:
+        warehouse_name = os.getenv('PAGASA_WAREHOUSE', 'snowflake')
+
+    if warehouse_name not in WAREHOUSE_BACKENDS:
+        raise ValueError(
+            f'Unknown warehouse {warehouse_name!r}, expected one of {list(WAREHOUSE_BACKENDS.keys())}'
+        )
+
+    return importlib.import_module(
+        WAREHOUSE_BACKENDS[warehouse_name]
+    )
+
+def get_warehouse_settings(
+) -> dict[str, str | None]:
+    """
+    Get the settings deciding where and how the extract stages load
+    the SILVER tables, i.e. the warehouse backend, its target (the
+    path of a local database or the Snowflake account) and the load
+    mode, e.g. to rerun the extract stages when the target changes.
+
+    :return: Dictionary containing the warehouse, its target
+        and the load mode
+    :rtype: dict[str, str | None]
+    """
+    from etl.extract.bulk_loader import get_load_mode
+
+    warehouse_name = os.getenv('PAGASA_WAREHOUSE', 'snowflake')
+
+    if warehouse_name == 'sqlite':
+        target = os.path.abspath(os.getenv('PAGASA_SQLITE_PATH', 'data/warehouse/pagasa.sqlite3'))
+
+    elif warehouse_name == 'duckdb':
+        target = os.path.abspath(os.getenv('PAGASA_DUCKDB_PATH', 'data/warehouse/pagasa.duckdb'))
+
+    else:
+        target = os.getenv('SNOWFLAKE_ACCOUNT')
+
+    return {
+        'warehouse': warehouse_name,
+        'target': target,
+        'load_mode': get_load_mode()
+    }
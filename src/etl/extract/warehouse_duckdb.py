@@ -0,0 +1,173 @@
+"""
+DuckDB backend of the warehouse abstraction.
+
+This module loads the SILVER tables into a local DuckDB database, e.g.
+for local throughput tests and backfills without network access. The
+database file stands in for the Snowflake database, so every table is
+created in its declared schema (e.g.
+`DAILY_WEATHER_FORECASTS.ISSUED_DATETIMES`). DataFrames are written
+with one set-based `INSERT ... SELECT` per table from the registered
+DataFrame. In `merge` mode, rows with the same natural keys as the
+written rows are deleted first, in the same transaction.
+
+The `duckdb` package is optional and only imported by this backend.
+
+Configuration (environment variables):
+- `PAGASA_DUCKDB_PATH` - Path of the DuckDB database
+    (default: data/warehouse/pagasa.duckdb)
+
+Main functions:
+- `warehouse_connection()` - Context manager around a connection
+- `create_tables()` - Create the declared SILVER tables
+- `write_dataframes()` - Write cleaned DataFrames into their tables
+"""
+from __future__ import annotations
+
+import os
+from typing import Iterator
+from typing import TYPE_CHECKING
+from contextlib import contextmanager
+from etl.extract.schema_registry import SILVER_TABLES
+from etl.extract.bulk_loader import get_load_mode
+from logs.instrumentation import instrument
+
+if TYPE_CHECKING:
+    import duckdb
+    import pandas as pd
+
+# Snowflake data types without a DuckDB equivalent of the same name
+DUCKDB_DATA_TYPES = {
+    'NUMBER': 'BIGINT'
+}
+
+@contextmanager
+def warehouse_connection(
+) -> Iterator[duckdb.DuckDBPyConnection]:
+    """
+    Context manager around a connection to the DuckDB database.
+
+    :return: Connection to the DuckDB database
+    :rtype: Iterator[duckdb.DuckDBPyConnection]
+    """
+    import duckdb
+
+    duckdb_path = os.getenv('PAGASA_DUCKDB_PATH', 'data/warehouse/pagasa.duckdb')
+    duckdb_dir = os.path.dirname(duckdb_path)
+
+    if duckdb_dir != '' and not os.path.exists(duckdb_dir):
+        os.makedirs(duckdb_dir)
+
+    with instrument('warehouse_connect', {'warehouse': 'duckdb'}):
+        conn = duckdb.connect(duckdb_path)
+
+    try:
+        yield conn
+
+    finally:
+        conn.close()
+
+def create_tables(
+        conn: duckdb.DuckDBPyConnection,
+        tables: dict[str, dict] | None = None
+) -> None:
+    """
+    Create the declared schemas and tables, adding the declared
+    columns missing from existing tables.
+
+    :param conn: Connection to the DuckDB database
+    :type conn: duckdb.DuckDBPyConnection
+
+    :param tables: Dictionary containing table names and corresponding
+        declarations, or NoneType to use the SILVER tables
+    :type tables: dict[str, dict] | None
+    """
+    if tables is None:
+        tables = SILVER_TABLES
+
+    for table, declaration in tables.items():
+        conn.execute(
+            f"CREATE SCHEMA IF NOT EXISTS {declaration['schema']}"
+        )
+        command_to_create_table = []
+
+        for column_name, data_type in declaration['columns'].items():
+            command_to_create_table.append(
+                column_name + ' ' + DUCKDB_DATA_TYPES.get(data_type, data_type)
+            )
+
+        command_to_create_table = ', '.join(command_to_create_table)
+        conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {declaration['schema']}.{table} ({command_to_create_table})"
+        )
+
+        # Tables created by an older declaration get the columns declared since
+        for column_name, data_type in declaration['columns'].items():
+            conn.execute(
+                f"ALTER TABLE {declaration['schema']}.{table} ADD COLUMN IF NOT EXISTS "
+                f"{column_name} {DUCKDB_DATA_TYPES.get(data_type, data_type)}"
+            )
+
+def write_dataframes(
+        conn: duckdb.DuckDBPyConnection,
+        dataframes: dict[str, pd.DataFrame],
+        tables: dict[str, dict] | None = None,
+        load_mode: str | None = None
+) -> None:
+    """
+    Write cleaned DataFrames into their tables in one transaction.
+
+    :param conn: Connection to the DuckDB database
+    :type conn: duckdb.DuckDBPyConnection
+
+    :param dataframes: Dictionary containing table names and
+        corresponding cleaned data as DataFrame objects
+    :type dataframes: dict[str, pd.DataFrame]
+
+    :param tables: Dictionary containing table names and corresponding
+        declarations, or NoneType to use the SILVER tables
+    :type tables: dict[str, dict] | None
+
+    :param load_mode: `merge` or `append`, or NoneType to use
+        `PAGASA_LOAD_MODE`
+    :type load_mode: str | None
+    """
+    if tables is None:
+        tables = SILVER_TABLES
+
+    if load_mode is None:
+        load_mode = get_load_mode()
+
+    with instrument('write_dataframes', {'warehouse': 'duckdb'}) as measurement:
+        conn.execute('BEGIN TRANSACTION')
+
+        try:
+            for table, data in dataframes.items():
+                declaration = tables[table]
+                qualified_table = declaration['schema'] + '.' + table
+                columns = ', '.join(declaration['columns'].keys())
+                keys = declaration.get('keys', [])
+
+                if load_mode == 'merge' and keys != []:
+                    data = data.drop_duplicates(subset=keys, keep='last')
+
+                conn.register('staged_dataframe', data)
+
+                if load_mode == 'merge' and keys != []:
+                    key_condition = ' AND '.join(
+                        [f'{qualified_table}.{key} IS NOT DISTINCT FROM staged_dataframe.{key}' for key in keys]
+                    )
+                    conn.execute(
+                        f'DELETE FROM {qualified_table} USING staged_dataframe WHERE {key_condition}'
+                    )
+
+                conn.execute(
+                    f'INSERT INTO {qualified_table} ({columns}) SELECT {columns} FROM staged_dataframe'
+                )
+                conn.unregister('staged_dataframe')
+                measurement['rows'] += len(data)
+
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+
+        conn.execute('COMMIT')
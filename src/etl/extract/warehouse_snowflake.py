@@ -0,0 +1,113 @@
+"""
+Snowflake backend of the warehouse abstraction.
+
+This module loads the SILVER tables into Snowflake through a pooled
+session of `etl.extract.connection_pool`, the cached schema bootstrap
+of `etl.extract.schema_registry` and the bulk loader of
+`etl.extract.bulk_loader`.
+
+Configuration (environment variables):
+- `SNOWFLAKE_USERNAME`, `SNOWFLAKE_PASSWORD`, `SNOWFLAKE_ACCOUNT` and
+    `SNOWFLAKE_WAREHOUSE` - Snowflake credentials
+
+Main functions:
+- `warehouse_connection()` - Context manager around a pooled session
+- `create_tables()` - Create the declared SILVER tables
+- `write_dataframes()` - Write cleaned DataFrames into their tables
+"""
+from __future__ import annotations
+
+import os
+from typing import Iterator
+from typing import TYPE_CHECKING
+from contextlib import contextmanager
+from etl.extract.connection_pool import pooled_connection
+from etl.extract.schema_registry import bootstrap_schemas
+from etl.extract.schema_registry import invalidate_schema_bootstrap_cache
+from etl.extract.bulk_loader import bulk_load_dataframes
+from logs.instrumentation import instrument
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+@contextmanager
+def warehouse_connection(
+) -> Iterator[object]:
+    """
+    Context manager around a pooled Snowflake session shared
+    by all extract stages.
+
+    :return: Established Snowflake connection
+    :rtype: Iterator[SnowflakeConnection]
+    """
+    with pooled_connection(
+        os.getenv('SNOWFLAKE_USERNAME'),
+        os.getenv('SNOWFLAKE_PASSWORD'),
+        os.getenv('SNOWFLAKE_ACCOUNT'),
+        os.getenv('SNOWFLAKE_WAREHOUSE')
+    ) as conn:
+        yield conn
+
+def create_tables(
+        conn: object,
+        tables: dict[str, dict] | None = None
+) -> None:
+    """
+    Create the declared tables, issuing DDL only when their
+    declarations changed since the last bootstrap.
+
+    :param conn: Established Snowflake connection
+    :type conn: SnowflakeConnection
+
+    :param tables: Dictionary containing table names and corresponding
+        declarations, or NoneType to use the SILVER tables
+    :type tables: dict[str, dict] | None
+    """
+    bootstrap_schemas(
+        conn,
+        os.getenv('SNOWFLAKE_ACCOUNT'),
+        tables
+    )
+
+def write_dataframes(
+        conn: object,
+        dataframes: dict[str, pd.DataFrame],
+        tables: dict[str, dict] | None = None,
+        load_mode: str | None = None
+) -> None:
+    """
+    Write cleaned DataFrames into their tables with one bulk load.
+
+    :param conn: Established Snowflake connection
+    :type conn: SnowflakeConnection
+
+    :param dataframes: Dictionary containing table names and
+        corresponding cleaned data as DataFrame objects
+    :type dataframes: dict[str, pd.DataFrame]
+
+    :param tables: Dictionary containing table names and corresponding
+        declarations, or NoneType to use the SILVER tables
+    :type tables: dict[str, dict] | None
+
+    :param load_mode: `merge` or `append`, or NoneType to use
+        `PAGASA_LOAD_MODE`
+    :type load_mode: str | None
+    """
+    with instrument('write_dataframes', {'warehouse': 'snowflake'}) as measurement:
+        try:
+            bulk_load_dataframes(
+                conn,
+                dataframes,
+                tables,
+                load_mode
+            )
+
+        except Exception:
+            # The tables may have been dropped since the cached bootstrap
+            invalidate_schema_bootstrap_cache(
+                os.getenv('SNOWFLAKE_ACCOUNT')
+            )
+            raise
+
+        for data in dataframes.values():
+            measurement['rows'] += len(data)
@@ -0,0 +1,213 @@
+"""
+SQLite backend of the warehouse abstraction.
+
+This module loads the SILVER tables into a local SQLite database with
+the standard library only, e.g. for local throughput tests and
+backfills without network access. SQLite has no databases nor schemas,
+so every table is named after its schema and table (e.g.
+`DAILY_WEATHER_FORECASTS__ISSUED_DATETIMES`). In `merge` mode, rows
+with the same natural keys as the written rows are deleted before the
+rows are inserted, in the same transaction.
+
+Configuration (environment variables):
+- `PAGASA_SQLITE_PATH` - Path of the SQLite database
+    (default: data/warehouse/pagasa.sqlite3)
+
+Main functions:
+- `warehouse_connection()` - Context manager around a connection
+- `create_tables()` - Create the declared SILVER tables
+- `write_dataframes()` - Write cleaned DataFrames into their tables
+"""
+from __future__ import annotations
+
+import os
+import sqlite3
+import datetime
+from typing import Iterator
+from typing import TYPE_CHECKING
+from contextlib import contextmanager
+from etl.extract.schema_registry import SILVER_TABLES
+from etl.extract.bulk_loader import get_load_mode
+from logs.instrumentation import instrument
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+def get_local_table_name(
+        table: str,
+        declaration: dict
+) -> str:
+    """
+    Get the name of a declared table in the SQLite database.
+
+    :param table: Name of the table
+    :type table: str
+
+    :param declaration: Declaration of the table (database, schema,
+        columns and keys)
+    :type declaration: dict
+
+    :return: Name of the table in the SQLite database
+    :rtype: str
+    """
+    return declaration['schema'] + '__' + table
+
+def convert_value(
+        value: object
+) -> object:
+    """
+    Convert a DataFrame value to a value SQLite can store.
+
+    :param value: Value of a DataFrame cell
+    :type value: object
+
+    :return: Value as NoneType, a Python scalar or an ISO 8601 string
+    :rtype: object
+    """
+    if value is None:
+        return None
+
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+
+    # NumPy scalars are converted to the corresponding Python scalars
+    if hasattr(value, 'item'):
+        return value.item()
+
+    return value
+
+@contextmanager
+def warehouse_connection(
+) -> Iterator[sqlite3.Connection]:
+    """
+    Context manager around a connection to the SQLite database.
+
+    :return: Connection to the SQLite database
+    :rtype: Iterator[sqlite3.Connection]
+    """
+    sqlite_path = os.getenv('PAGASA_SQLITE_PATH', 'data/warehouse/pagasa.sqlite3')
+    sqlite_dir = os.path.dirname(sqlite_path)
+
+    if sqlite_dir != '' and not os.path.exists(sqlite_dir):
+        os.makedirs(sqlite_dir)
+
+    with instrument('warehouse_connect', {'warehouse': 'sqlite'}):
+        conn = sqlite3.connect(sqlite_path)
+
+    try:
+        yield conn
+
+    finally:
+        conn.close()
+
+def create_tables(
+        conn: sqlite3.Connection,
+        tables: dict[str, dict] | None = None
+) -> None:
+    """
+    Create the declared tables, adding the declared columns
+    missing from existing tables.
+
+    :param conn: Connection to the SQLite database
+    :type conn: sqlite3.Connection
+
+    :param tables: Dictionary containing table names and corresponding
+        declarations, or NoneType to use the SILVER tables
+    :type tables: dict[str, dict] | None
+    """
+    if tables is None:
+        tables = SILVER_TABLES
+
+    with conn:
+        for table, declaration in tables.items():
+            command_to_create_table = []
+
+            for column_name, data_type in declaration['columns'].items():
+                command_to_create_table.append(
+                    column_name + ' ' + data_type
+                )
+
+            command_to_create_table = ', '.join(command_to_create_table)
+            conn.execute(
+                f'CREATE TABLE IF NOT EXISTS {get_local_table_name(table, declaration)} ({command_to_create_table})'
+            )
+
+            # SQLite has no `ADD COLUMN IF NOT EXISTS`, so compare with the existing columns
+            existing_columns = []
+
+            for table_column in conn.execute(f'PRAGMA table_info({get_local_table_name(table, declaration)})'):
+                existing_columns.append(
+                    table_column[1]
+                )
+
+            for column_name, data_type in declaration['columns'].items():
+                if column_name not in existing_columns:
+                    conn.execute(
+                        f'ALTER TABLE {get_local_table_name(table, declaration)} ADD COLUMN {column_name} {data_type}'
+                    )
+
+def write_dataframes(
+        conn: sqlite3.Connection,
+        dataframes: dict[str, pd.DataFrame],
+        tables: dict[str, dict] | None = None,
+        load_mode: str | None = None
+) -> None:
+    """
+    Write cleaned DataFrames into their tables in one transaction.
+
+    :param conn: Connection to the SQLite database
+    :type conn: sqlite3.Connection
+
+    :param dataframes: Dictionary containing table names and
+        corresponding cleaned data as DataFrame objects
+    :type dataframes: dict[str, pd.DataFrame]
+
+    :param tables: Dictionary containing table names and corresponding
+        declarations, or NoneType to use the SILVER tables
+    :type tables: dict[str, dict] | None
+
+    :param load_mode: `merge` or `append`, or NoneType to use
+        `PAGASA_LOAD_MODE`
+    :type load_mode: str | None
+    """
+    if tables is None:
+        tables = SILVER_TABLES
+
+    if load_mode is None:
+        load_mode = get_load_mode()
+
+    with instrument('write_dataframes', {'warehouse': 'sqlite'}) as measurement:
+        with conn:
+            for table, data in dataframes.items():
+                declaration = tables[table]
+                local_table_name = get_local_table_name(table, declaration)
+                columns = list(declaration['columns'].keys())
+                keys = declaration.get('keys', [])
+
+                if load_mode == 'merge' and keys != []:
+                    data = data.drop_duplicates(subset=keys, keep='last')
+
+                data = data[columns].astype(object)
+                data = data.where(data.notna(), None)
+                rows = []
+
+                for row in data.itertuples(index=False, name=None):
+                    rows.append(
+                        tuple(convert_value(value) for value in row)
+                    )
+
+                measurement['rows'] += len(rows)
+
+                if load_mode == 'merge' and keys != []:
+                    key_indices = [columns.index(key) for key in keys]
+                    key_condition = ' AND '.join([f'{key} IS ?' for key in keys])
+                    conn.executemany(
+                        f'DELETE FROM {local_table_name} WHERE {key_condition}',
+                        [tuple(row[key_index] for key_index in key_indices) for row in rows]
+                    )
+
+                placeholders = ', '.join(['?'] * len(columns))
+                conn.executemany(
+                    f"INSERT INTO {local_table_name} ({', '.join(columns)}) VALUES ({placeholders})",
+                    rows
+                )
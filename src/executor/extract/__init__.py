@@ -1 +1,3 @@
-from . import execute_extract_daily_weather_forecast
\ No newline at end of file
+from . import execute_extract_daily_weather_forecast
+from . import execute_extract_weather_outlook_for_ph_cities
+from . import execute_extract_weather_outlook_for_ph_tourist_areas
\ No newline at end of file
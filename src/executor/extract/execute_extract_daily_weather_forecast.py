@@ -1,11 +1,8 @@
 """
 Docstring for src.executor.extract.execute_extract_daily_weather_forecast
 """
-import os
 from dotenv import load_dotenv
-from etl.extract.extract_daily_weather_forecast import connect
-from etl.extract.extract_daily_weather_forecast import database_config
-from etl.extract.extract_daily_weather_forecast import store_cleaned_data_to_snowflake
+from etl.extract.warehouse import get_warehouse_backend
 from etl.extract.extract_daily_weather_forecast import extract_issued_datetime
 from etl.extract.extract_daily_weather_forecast import clean_issued_datetime
 from etl.extract.extract_daily_weather_forecast import extract_synopsis
@@ -21,41 +18,34 @@ def extract_daily_weather_forecast(
     """
     # Load environment variables from .env file
     load_dotenv()
-    conn = connect(
-        os.getenv('SNOWFLAKE_USERNAME'),
-        os.getenv('SNOWFLAKE_PASSWORD'),
-        os.getenv('SNOWFLAKE_ACCOUNT'),
-        os.getenv('SNOWFLAKE_WAREHOUSE')
-    )
 
-    issued_datetime_dataframe = extract_issued_datetime(
-        'data/raw/daily_weather_forecasts/issued_datetime.json'
-    )
-    issued_datetime_dataframe = clean_issued_datetime(
-        issued_datetime_dataframe
-    )
-    database_config(
-        conn,
-        'SILVER',
-        'DAILY_WEATHER_FORECASTS',
-        'ISSUED_DATETIMES',
-        {
-            'ISSUED_DATE': 'DATE',
-            'ISSUED_TIME': 'TIME'
-        }
-    )
+    # Load the warehouse selected by `PAGASA_WAREHOUSE` (Snowflake by default)
+    warehouse = get_warehouse_backend()
 
-    store_cleaned_data_to_snowflake(
-        conn,
-        issued_datetime_dataframe,
-        'ISSUED_DATETIMES',
-        'PAGASA_DOST_DATABASE',
-        'DAILY_WEATHER_FORECASTS'
-    )
+    with warehouse.warehouse_connection() as conn:
+        warehouse.create_tables(
+            conn
+        )
 
-    synopsis_dataframe = extract_synopsis(
-        'data/raw/daily_weather_forecasts/synopsis.json'
-    )
-    clean_synopsis_dataframe = clean_synopsis(
-        synopsis_dataframe
-    )
\ No newline at end of file
+        issued_datetime_records = extract_issued_datetime(
+            'data/raw/daily_weather_forecasts/issued_datetime.json'
+        )
+        issued_datetime_dataframe = clean_issued_datetime(
+            issued_datetime_records
+        )
+        synopsis_records = extract_synopsis(
+            'data/raw/daily_weather_forecasts/synopsis.json'
+        )
+        clean_synopsis_dataframe = clean_synopsis(
+            synopsis_records,
+            issued_datetime_dataframe
+        )
+
+        # Write every cleaned table of the run in one load
+        warehouse.write_dataframes(
+            conn,
+            {
+                'ISSUED_DATETIMES': issued_datetime_dataframe,
+                'SYNOPSES': clean_synopsis_dataframe
+            }
+        )
@@ -0,0 +1,56 @@
+"""
+Docstring for src.executor.extract.execute_extract_weather_outlook_for_ph_tourist_areas
+"""
+import os
+from dotenv import load_dotenv
+from ingest.parquet_output import is_parquet_output_enabled
+from etl.extract.warehouse import get_warehouse_backend
+from etl.extract.extract_weather_outlook_for_ph_tourist_areas import extract_ph_tourist_area_weather_outlooks
+from etl.extract.extract_weather_outlook_for_ph_tourist_areas import clean_ph_tourist_area_weather_outlooks
+from etl.extract.extract_weather_outlook_for_ph_tourist_areas import extract_ph_tourist_area_weather_outlook_table
+from etl.extract.extract_weather_outlook_for_ph_tourist_areas import clean_ph_tourist_area_weather_outlook_table
+
+def extract_weather_outlook_for_ph_tourist_areas(
+) -> None:
+    """
+    Executes the function in the
+    `src.etl.extract.extract_weather_outlook_for_ph_tourist_areas`
+    module to extract the data from the
+    `data/raw/weather_outlooks_for_ph_tourist_areas/` subdirectory
+    path that consist of ingested artifacts as a JSON file
+    """
+    # Load environment variables from .env file
+    load_dotenv()
+
+    # Load the warehouse selected by `PAGASA_WAREHOUSE` (Snowflake by default)
+    warehouse = get_warehouse_backend()
+
+    with warehouse.warehouse_connection() as conn:
+        warehouse.create_tables(
+            conn
+        )
+
+        # Prefer the memory-mapped Parquet snapshot written next to the JSON artifact
+        if is_parquet_output_enabled() and os.path.exists('data/raw/weather_outlooks_for_ph_tourist_areas/weather_outlook_for_ph_tourist_areas.parquet'):
+            weather_outlook_for_ph_tourist_areas_table = extract_ph_tourist_area_weather_outlook_table(
+                'data/raw/weather_outlooks_for_ph_tourist_areas/weather_outlook_for_ph_tourist_areas.parquet'
+            )
+            weather_outlook_for_ph_tourist_areas_dataframe = clean_ph_tourist_area_weather_outlook_table(
+                weather_outlook_for_ph_tourist_areas_table
+            )
+
+        else:
+            weather_outlook_for_ph_tourist_areas_records = extract_ph_tourist_area_weather_outlooks(
+                'data/raw/weather_outlooks_for_ph_tourist_areas/weather_outlook_for_ph_tourist_areas.json'
+            )
+            weather_outlook_for_ph_tourist_areas_dataframe = clean_ph_tourist_area_weather_outlooks(
+                weather_outlook_for_ph_tourist_areas_records
+            )
+
+        # Upsert on the natural keys so polling an unchanged outlook does not duplicate its rows
+        warehouse.write_dataframes(
+            conn,
+            {
+                'TOURIST_AREA_WEATHER_OUTLOOKS': weather_outlook_for_ph_tourist_areas_dataframe
+            }
+        )
@@ -8,8 +8,12 @@ subdirectory for further processing.
 Main function:
 - `ingest_daily_weather_forecast()` - Runs the end-to-end ingest workflow
 """
+from ingest.fetch_pages import get_page_urls
+from ingest.fetch_pages import fetch_page
+from ingest.http_cache import save_cache_entry
 from ingest.ingest_daily_weather_forecast import create_subdir
-from ingest.ingest_daily_weather_forecast import ingest_and_parse_soup_from_url
+from ingest.ingest_daily_weather_forecast import parse_soup_from_html
+from ingest.ingest_daily_weather_forecast import index_daily_weather_forecast_sections
 from ingest.ingest_daily_weather_forecast import ingest_issued_datetime
 from ingest.ingest_daily_weather_forecast import save_ingested_issued_datetime
 from ingest.ingest_daily_weather_forecast import ingest_synopsis
@@ -24,56 +28,86 @@ from ingest.ingest_daily_weather_forecast import ingest_temperature_and_relative
 from ingest.ingest_daily_weather_forecast import save_ingested_temperature_and_relative_humidity
 
 def ingest_daily_weather_forecast(
-) -> None:
+        fetched_page: dict | None = None
+) -> bool:
     """
     Executes the function in the
     `src.ingest.ingest_daily_weather_forecast.py`
     module to ingest the data from the daily
     weather forecast page of PAGASA-DOST website.
+
+    :param fetched_page: Fetched daily weather
+        forecast page from the fetch stage,
+        or NoneType to fetch the page
+    :type fetched_page: dict | None
+
+    :return: True if the page was ingested, or False if the
+        page is unchanged since it was last ingested
+    :rtype: bool
     """
     create_subdir()
-    soup = ingest_and_parse_soup_from_url(
-        'https://www.pagasa.dost.gov.ph/weather#daily-weather-forecast'
+
+    if fetched_page is None:
+        fetched_page = fetch_page(
+            get_page_urls()['daily_weather_forecast']
+        )
+
+    # Skip parsing and saving when the page is unchanged since it was last ingested
+    if fetched_page['unchanged']:
+        return False
+
+    soup = parse_soup_from_html(
+        fetched_page['html']
+    )
+    sections = index_daily_weather_forecast_sections(
+        soup
     )
 
     issued_datetime = ingest_issued_datetime(
-        soup
+        sections
     )
     save_ingested_issued_datetime(
         issued_datetime
     )
 
     synopsis = ingest_synopsis(
-        soup
+        sections
     )
     save_ingesed_synopsis(
         synopsis
     )
 
     tropical_cyclone_informations = ingest_tropical_cyclone_informations(
-        soup
+        sections
     )
     save_ingested_tropical_cyclone_informations(
         tropical_cyclone_informations
     )
 
     forecast_weather_conditions = ingest_forecast_weather_conditions(
-        soup
+        sections
     )
     save_ingested_forecast_weather_conditions(
         forecast_weather_conditions
     )
 
     forecast_wind_and_coastal_water_conditions = ingest_forecast_wind_and_coastal_water_conditions(
-        soup
+        sections
     )
     save_ingested_forecast_wind_and_coastal_water_conditions(
         forecast_wind_and_coastal_water_conditions
     )
 
     temperature_and_relative_humidity = ingest_temperature_and_relative_humidity(
-        soup
+        sections
     )
     save_ingested_temperature_and_relative_humidity(
         temperature_and_relative_humidity
-    )
\ No newline at end of file
+    )
+
+    save_cache_entry(
+        fetched_page,
+        'data/raw/daily_weather_forecasts'
+    )
+
+    return True
\ No newline at end of file
@@ -8,18 +8,48 @@ for further processing.
 Main function:
 - `ingest_weather_advisory` - Runs the end-to-end ingest workflow
 """
+from ingest.fetch_pages import get_page_urls
+from ingest.fetch_pages import fetch_page
+from ingest.http_cache import save_cache_entry
 from ingest.ingest_weather_advisory import create_subdir
-from ingest.ingest_weather_advisory import ingest_and_parse_soup_from_url
+from ingest.ingest_weather_advisory import parse_soup_from_html
 
 def ingest_weather_advisory(
-) -> None:
+        fetched_page: dict | None = None
+) -> bool:
     """
     Executes the function in the
     `src.ingest.ingest_weather_advisory.py`
     module to ingest the data from the weather advisory
     page of PAGASA-DOST website.
+
+    :param fetched_page: Fetched weather
+        advisory page from the fetch stage,
+        or NoneType to fetch the page
+    :type fetched_page: dict | None
+
+    :return: True if the page was ingested, or False if the
+        page is unchanged since it was last ingested
+    :rtype: bool
     """
     create_subdir()
-    soup = ingest_and_parse_soup_from_url(
-        'https://www.pagasa.dost.gov.ph/weather/weather-advisory'
-    )
\ No newline at end of file
+
+    if fetched_page is None:
+        fetched_page = fetch_page(
+            get_page_urls()['weather_advisory']
+        )
+
+    # Skip parsing and saving when the page is unchanged since it was last ingested
+    if fetched_page['unchanged']:
+        return False
+
+    soup = parse_soup_from_html(
+        fetched_page['html']
+    )
+
+    save_cache_entry(
+        fetched_page,
+        'data/raw/weather_advisories'
+    )
+
+    return True
\ No newline at end of file
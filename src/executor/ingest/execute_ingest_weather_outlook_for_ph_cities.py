@@ -9,34 +9,51 @@ subdirectory for further processing.
 Main function:
 - `ingest_weather_outlook_for_ph_cities` - Runs the end-to-end ingest workflow
 """
+from ingest.fetch_pages import get_page_urls
+from ingest.fetch_pages import fetch_page
+from ingest.http_cache import save_cache_entry
 from ingest.ingest_weather_outlook_for_ph_cities import create_subdir
-from ingest.ingest_weather_outlook_for_ph_cities import ingest_and_parse_soup_from_url
+from ingest.ingest_weather_outlook_for_ph_cities import parse_soup_from_html
 from ingest.ingest_weather_outlook_for_ph_cities import ingest_issued_datetime
 from ingest.ingest_weather_outlook_for_ph_cities import save_ingested_issued_datetime
 from ingest.ingest_weather_outlook_for_ph_cities import ingest_time_validity
 from ingest.ingest_weather_outlook_for_ph_cities import save_ingested_time_validity
 from ingest.ingest_weather_outlook_for_ph_cities import ingest_and_parse_list_of_all_ph_city_tags
-from ingest.ingest_weather_outlook_for_ph_cities import ingest_ph_city_names
-from ingest.ingest_weather_outlook_for_ph_cities import ingest_weather_dates
-from ingest.ingest_weather_outlook_for_ph_cities import map_ph_city_names_to_weather_dates
-from ingest.ingest_weather_outlook_for_ph_cities import ingest_temperature_ranges
-from ingest.ingest_weather_outlook_for_ph_cities import map_ph_city_names_to_temperature_ranges
-from ingest.ingest_weather_outlook_for_ph_cities import ingest_chance_of_rain_percentages
-from ingest.ingest_weather_outlook_for_ph_cities import map_ph_city_names_to_chance_of_rain_percentages
+from ingest.ingest_weather_outlook_for_ph_cities import build_weather_outlook_for_ph_cities
 from ingest.ingest_weather_outlook_for_ph_cities import save_ingested_weather_outlook_for_ph_cities
 
 def ingest_weather_outlook_for_ph_cities(
-) -> None:
+        fetched_page: dict | None = None
+) -> bool:
     """
     Executes the function in the
     `src.ingest.ingest_weather_outlook_for_ph_cities.py`
     module to ingest the data from the weather outlook
     for selected Philippine cities page of PAGASA-DOST
     website.
+
+    :param fetched_page: Fetched weather outlook
+        for selected Philippine cities page from the fetch stage,
+        or NoneType to fetch the page
+    :type fetched_page: dict | None
+
+    :return: True if the page was ingested, or False if the
+        page is unchanged since it was last ingested
+    :rtype: bool
     """
     create_subdir()
-    soup = ingest_and_parse_soup_from_url(
-        'https://www.pagasa.dost.gov.ph/weather/weather-outlook-selected-philippine-cities'
+
+    if fetched_page is None:
+        fetched_page = fetch_page(
+            get_page_urls()['weather_outlook_for_ph_cities']
+        )
+
+    # Skip parsing and saving when the page is unchanged since it was last ingested
+    if fetched_page['unchanged']:
+        return False
+
+    soup = parse_soup_from_html(
+        fetched_page['html']
     )
 
     issued_datetime = ingest_issued_datetime(
@@ -57,34 +74,17 @@ def ingest_weather_outlook_for_ph_cities(
         soup
     )
 
-    ph_city_names_dict = ingest_ph_city_names(
+    weather_outlook_for_ph_cities = build_weather_outlook_for_ph_cities(
         list_of_all_ph_city_tags
     )
 
-    list_of_all_weather_dates = ingest_weather_dates(
-        list_of_all_ph_city_tags
-    )
-    ph_city_names_with_weather_dates = map_ph_city_names_to_weather_dates(
-        ph_city_names_dict,
-        list_of_all_weather_dates
-    )
-
-    list_of_all_temperature_ranges = ingest_temperature_ranges(
-        list_of_all_ph_city_tags
-    )
-    weather_outlook_for_ph_cities = map_ph_city_names_to_temperature_ranges(
-        ph_city_names_with_weather_dates,
-        list_of_all_temperature_ranges   
+    save_ingested_weather_outlook_for_ph_cities(
+        weather_outlook_for_ph_cities
     )
 
-    list_of_all_chance_of_rain_percentages = ingest_chance_of_rain_percentages(
-        list_of_all_ph_city_tags
-    )
-    weather_outlook_for_ph_cities = map_ph_city_names_to_chance_of_rain_percentages(
-        weather_outlook_for_ph_cities,
-        list_of_all_chance_of_rain_percentages
+    save_cache_entry(
+        fetched_page,
+        'data/raw/weather_outlooks_for_ph_cities'
     )
 
-    save_ingested_weather_outlook_for_ph_cities(
-        weather_outlook_for_ph_cities
-    )
\ No newline at end of file
+    return True
\ No newline at end of file
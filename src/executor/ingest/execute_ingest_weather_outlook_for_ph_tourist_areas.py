@@ -9,30 +9,49 @@ subdirectory for further processing.
 Main function:
 - `ingest_weather_outlook_for_ph_tourist_areas` - Runs the end-to-end ingest workflow
 """
+from ingest.fetch_pages import get_page_urls
+from ingest.fetch_pages import fetch_page
+from ingest.http_cache import save_cache_entry
 from ingest.ingest_weather_outlook_for_ph_tourist_areas import create_subdir
-from ingest.ingest_weather_outlook_for_ph_tourist_areas import ingest_and_parse_soup_from_url
+from ingest.ingest_weather_outlook_for_ph_tourist_areas import parse_soup_from_html
 from ingest.ingest_weather_outlook_for_ph_tourist_areas import ingest_issued_datetime
 from ingest.ingest_weather_outlook_for_ph_tourist_areas import save_ingested_issued_datetime
 from ingest.ingest_weather_outlook_for_ph_tourist_areas import ingest_time_validity
 from ingest.ingest_weather_outlook_for_ph_tourist_areas import save_ingested_time_validity
-from ingest.ingest_weather_outlook_for_ph_tourist_areas import ingest_ph_tourist_area_names
-from ingest.ingest_weather_outlook_for_ph_tourist_areas import ingest_weather_dates
-from ingest.ingest_weather_outlook_for_ph_tourist_areas import map_ph_tourist_area_names_to_weather_dates
-from ingest.ingest_weather_outlook_for_ph_tourist_areas import ingest_temperature_ranges
-from ingest.ingest_weather_outlook_for_ph_tourist_areas import map_ph_tourist_area_names_to_temperature_ranges
+from ingest.ingest_weather_outlook_for_ph_tourist_areas import build_weather_outlook_for_ph_tourist_areas
 from ingest.ingest_weather_outlook_for_ph_tourist_areas import save_ingested_weather_outlook_for_ph_tourist_areas
 
 def ingest_weather_outlook_for_ph_tourist_areas(
-) -> None:
+        fetched_page: dict | None = None
+) -> bool:
     """
     Executes the function in the
     `src.ingest.ingest_weather_outlook_for_ph_tourist_areas.py`
     module to ingest the data from the weather outlook for selected
     Philippine tourist areas page of PAGASA-DOST website.
+
+    :param fetched_page: Fetched weather outlook
+        for selected Philippine tourist areas page from the fetch stage,
+        or NoneType to fetch the page
+    :type fetched_page: dict | None
+
+    :return: True if the page was ingested, or False if the
+        page is unchanged since it was last ingested
+    :rtype: bool
     """
     create_subdir()
-    soup = ingest_and_parse_soup_from_url(
-        'https://www.pagasa.dost.gov.ph/weather/weather-outlook-selected-tourist-areas'
+
+    if fetched_page is None:
+        fetched_page = fetch_page(
+            get_page_urls()['weather_outlook_for_ph_tourist_areas']
+        )
+
+    # Skip parsing and saving when the page is unchanged since it was last ingested
+    if fetched_page['unchanged']:
+        return False
+
+    soup = parse_soup_from_html(
+        fetched_page['html']
     )
 
     issued_datetime = ingest_issued_datetime(
@@ -49,26 +68,17 @@ def ingest_weather_outlook_for_ph_tourist_areas(
         time_validity
     )
 
-    ph_tourist_area_names_dict = ingest_ph_tourist_area_names(
-        soup        
-    )
-
-    list_of_all_weather_dates = ingest_weather_dates(
+    weather_outlook_for_ph_tourist_areas = build_weather_outlook_for_ph_tourist_areas(
         soup
     )
-    ph_tourist_area_names_with_weather_dates = map_ph_tourist_area_names_to_weather_dates(
-        ph_tourist_area_names_dict,
-        list_of_all_weather_dates
-    )
 
-    list_of_all_temperature_ranges = ingest_temperature_ranges(
-        soup
+    save_ingested_weather_outlook_for_ph_tourist_areas(
+        weather_outlook_for_ph_tourist_areas
     )
-    weather_outlook_for_ph_tourist_areas = map_ph_tourist_area_names_to_temperature_ranges(
-        ph_tourist_area_names_with_weather_dates,
-        list_of_all_temperature_ranges
+
+    save_cache_entry(
+        fetched_page,
+        'data/raw/weather_outlooks_for_ph_tourist_areas'
     )
 
-    save_ingested_weather_outlook_for_ph_tourist_areas(
-        weather_outlook_for_ph_tourist_areas
-    )
\ No newline at end of file
+    return True
\ No newline at end of file
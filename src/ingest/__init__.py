@@ -1,3 +1,10 @@
+from . import http_session
+from . import http_cache
+from . import fetch_pages
+from . import parser_backends
+from . import raw_archive
+from . import json_output
+from . import parquet_output
 from . import ingest_daily_weather_forecast
 from . import ingest_weather_outlook_for_ph_cities
 from . import ingest_weather_outlook_for_ph_tourist_areas
@@ -0,0 +1,200 @@
+"""
+Fetch pages from the PAGASA-DOST website for the ingest workflows.
+
+This module contains functions used by the ETL pipeline to download
+the HTML of the PAGASA-DOST pages in a single fetch stage. The pages are
+downloaded concurrently on a thread pool and each fetched page is handed
+to the parser of its ingest module, so the wall-clock time of a full run
+is bounded by the slowest page instead of the sum of all pages.
+
+Main functions:
+- `get_page_urls()` - Build the URLs of the PAGASA-DOST pages to fetch
+- `fetch_page()` - Fetch a single page and record its timing
+- `fetch_pages_concurrently()` - Fetch several pages concurrently
+"""
+import os
+import time
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from ingest.http_session import get_with_retries
+from ingest.http_cache import load_cache_entry
+from ingest.http_cache import build_conditional_headers
+from ingest.http_cache import compute_content_hash
+from ingest.http_cache import is_cached_output_current
+from logs.instrumentation import instrument
+
+PAGASA_DOST_BASE_URL = 'https://www.pagasa.dost.gov.ph'
+
+PAGASA_DOST_PAGE_PATHS = {
+    'daily_weather_forecast': '/weather#daily-weather-forecast',
+    'weather_outlook_for_ph_cities': '/weather/weather-outlook-selected-philippine-cities',
+    'weather_outlook_for_ph_tourist_areas': '/weather/weather-outlook-selected-tourist-areas',
+    'weather_advisory': '/weather/weather-advisory'
+}
+
+def get_page_urls(
+        base_url: str | None = None
+) -> dict[str, str]:
+    """
+    Build the URLs of the PAGASA-DOST pages to fetch.
+
+    The base URL can be overridden with the `PAGASA_DOST_BASE_URL`
+    environment variable, e.g. to point the pipeline to a local
+    HTTP server serving saved HTML pages.
+
+    :param base_url: Base URL of the PAGASA-DOST website, or
+        NoneType to use the environment variable or the default
+        base URL
+    :type base_url: str | None
+
+    :return: Dictionary containing page names and corresponding URLs
+    :rtype: dict[str, str]
+    """
+    if base_url is None:
+        base_url = os.getenv('PAGASA_DOST_BASE_URL', PAGASA_DOST_BASE_URL)
+
+    base_url = base_url.rstrip('/')
+    page_urls = {}
+
+    for page_name, page_path in PAGASA_DOST_PAGE_PATHS.items():
+        page_urls[page_name] = base_url + page_path
+
+    return page_urls
+
+def fetch_page(
+        url: str
+) -> dict:
+    """
+    Fetch a single page from the PAGASA-DOST website using
+    the shared pooled HTTP session.
+
+    The request is a conditional GET when the page is cached. The
+    fetched page is flagged as unchanged when the website responds
+    with `304 Not Modified` or with the same content as the cached
+    page and the artifacts ingested from the cached page are current,
+    in which case the HTML of the cached page is returned. Any other
+    final status (e.g. `403 Forbidden` or a `503` left after the
+    retries) is returned as an error, so the stage ingesting the page
+    fails instead of ingesting a blank page.
+
+    :param url: URL of the page to fetch
+    :type url: str
+
+    :return: Fetched page containing the URL, the HTTP status code,
+        the HTML of the page (NoneType if the page could not be
+        fetched), the elapsed seconds of the fetch, the unchanged
+        flag, the validators, the content hash of the page and the
+        error (an `HTTPError` carrying the response if the page could
+        not be fetched, otherwise NoneType)
+    :rtype: dict
+    """
+    cache_entry = load_cache_entry(
+        url
+    )
+    conditional_headers = build_conditional_headers(
+        cache_entry
+    )
+
+    start = time.perf_counter()
+
+    with instrument('fetch_page', {'url': url}) as measurement:
+        response = get_with_retries(
+            url,
+            conditional_headers
+        )
+        measurement['bytes_fetched'] = len(response.content)
+
+    elapsed_seconds = time.perf_counter() - start
+
+    html = None
+    content_sha256 = None
+    unchanged = False
+    error = None
+
+    if response.status_code == 304 and cache_entry is not None:
+        html = cache_entry['html']
+        content_sha256 = cache_entry['content_sha256']
+        unchanged = True
+
+    elif response.status_code == 200:
+        html = response.text
+        content_sha256 = compute_content_hash(html)
+
+        # Some pages ignore conditional GETs, so compare the content with the cached page
+        if cache_entry is not None and cache_entry['content_sha256'] == content_sha256:
+            unchanged = True
+
+    else:
+        error = requests.HTTPError(
+            f'{response.status_code} Error: {response.reason} for url: {url}',
+            response=response
+        )
+
+    # Ingest an unchanged page again when its artifacts are missing or the output settings changed
+    if unchanged and not is_cached_output_current(cache_entry):
+        unchanged = False
+
+    fetched_page = {
+        'url': url,
+        'status_code': response.status_code,
+        'html': html,
+        'elapsed_seconds': elapsed_seconds,
+        'unchanged': unchanged,
+        'etag': response.headers.get('ETag'),
+        'last_modified': response.headers.get('Last-Modified'),
+        'content_sha256': content_sha256,
+        'error': error
+    }
+
+    return fetched_page
+
+def fetch_pages_concurrently(
+        page_urls: dict[str, str],
+        max_workers: int | None = None
+) -> dict[str, dict]:
+    """
+    Fetch several pages from the PAGASA-DOST website concurrently.
+
+    :param page_urls: Dictionary containing page names and
+        corresponding URLs to fetch
+    :type page_urls: dict[str, str]
+
+    :param max_workers: Maximum number of threads used to fetch
+        the pages, or NoneType to use one thread per page
+    :type max_workers: int | None
+
+    :return: Dictionary containing page names and corresponding
+        fetched pages, a page that failed to be fetched containing
+        its URL, NoneType HTML and the raised error
+    :rtype: dict[str, dict]
+    """
+    fetched_pages = {}
+
+    if page_urls == {}:
+        return fetched_pages
+
+    if max_workers is None:
+        max_workers = len(page_urls)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {}
+
+        for page_name, url in page_urls.items():
+            futures[page_name] = executor.submit(
+                fetch_page,
+                url
+            )
+
+        for page_name, future in futures.items():
+            # A page failing after its retries only fails the stage ingesting it
+            try:
+                fetched_pages[page_name] = future.result()
+
+            except Exception as error:
+                fetched_pages[page_name] = {
+                    'url': page_urls[page_name],
+                    'html': None,
+                    'error': error
+                }
+
+    return fetched_pages
@@ -0,0 +1,266 @@
+"""
+On-disk HTTP cache for the pages of the PAGASA-DOST website.
+
+This module contains functions used by the ETL pipeline to remember the
+last successfully ingested version of every page. Cache entries are keyed
+by URL and store the `ETag` and `Last-Modified` validators, a SHA-256 hash
+of the page content and the page itself under the `data/cache/http/`
+subdirectory, so unchanged pages can be detected with a conditional GET
+(`If-None-Match`/`If-Modified-Since`) or by their content hash and the
+whole ingest chain can be skipped. A cache entry also records the
+artifacts ingested from the page and the output settings they were
+saved with, so an unchanged page is ingested again when its artifacts
+are missing or the output settings changed. Cache files are replaced
+atomically, so a crash never leaves a truncated entry behind.
+
+Configuration (environment variables):
+- `PAGASA_HTTP_CACHE` - Set to `0` to disable the cache (default: 1)
+- `PAGASA_HTTP_CACHE_DIR` - Directory of the cache (default: data/cache/http)
+
+Main functions:
+- `load_cache_entry()` - Load the cache entry of a URL
+- `build_conditional_headers()` - Build the conditional GET headers
+- `is_cached_output_current()` - Check the artifacts of a cached page
+- `save_cache_entry()` - Save the cache entry of a fetched page
+"""
+import os
+import glob
+import json
+import hashlib
+import tempfile
+from ingest.json_output import get_json_output_mode
+from ingest.parquet_output import is_parquet_output_enabled
+
+def is_cache_enabled(
+) -> bool:
+    """
+    Check if the HTTP cache is enabled.
+
+    :return: True if the HTTP cache is enabled, otherwise False
+    :rtype: bool
+    """
+    return os.getenv('PAGASA_HTTP_CACHE', '1') != '0'
+
+def get_cache_dir(
+) -> str:
+    """
+    Get the directory of the HTTP cache.
+
+    :return: Directory of the HTTP cache
+    :rtype: str
+    """
+    return os.getenv('PAGASA_HTTP_CACHE_DIR', 'data/cache/http')
+
+def compute_content_hash(
+        html: str
+) -> str:
+    """
+    Compute the SHA-256 hash of the content of a page.
+
+    :param html: HTML of the page
+    :type html: str
+
+    :return: Hexadecimal SHA-256 hash of the page content
+    :rtype: str
+    """
+    return hashlib.sha256(html.encode('utf-8')).hexdigest()
+
+def get_cache_key(
+        url: str
+) -> str:
+    """
+    Get the cache key of a URL.
+
+    :param url: URL of the page
+    :type url: str
+
+    :return: Cache key of the URL
+    :rtype: str
+    """
+    return hashlib.sha256(url.encode('utf-8')).hexdigest()
+
+def load_cache_entry(
+        url: str
+) -> dict | None:
+    """
+    Load the cache entry of a URL.
+
+    :param url: URL of the page
+    :type url: str
+
+    :return: Cache entry containing the validators, the content
+        hash and the HTML of the page, or NoneType if the page is
+        not cached
+    :rtype: dict | None
+    """
+    if not is_cache_enabled():
+        return None
+
+    cache_key = get_cache_key(url)
+    metadata_filepath = os.path.join(get_cache_dir(), cache_key + '.json')
+    html_filepath = os.path.join(get_cache_dir(), cache_key + '.html')
+
+    if not os.path.exists(metadata_filepath) or not os.path.exists(html_filepath):
+        return None
+
+    with open(metadata_filepath, 'r') as json_file:
+        cache_entry = json.load(json_file)
+
+    with open(html_filepath, 'r', encoding='utf-8') as html_file:
+        cache_entry['html'] = html_file.read()
+
+    # A page that does not match its metadata (e.g. written by an older version) is not trusted
+    if compute_content_hash(cache_entry['html']) != cache_entry['content_sha256']:
+        return None
+
+    return cache_entry
+
+def build_conditional_headers(
+        cache_entry: dict | None
+) -> dict[str, str]:
+    """
+    Build the conditional GET headers from the cache entry of a URL.
+
+    :param cache_entry: Cache entry of the URL, or NoneType if
+        the page is not cached
+    :type cache_entry: dict | None
+
+    :return: Dictionary containing the conditional GET headers
+    :rtype: dict[str, str]
+    """
+    headers = {}
+
+    if cache_entry is None:
+        return headers
+
+    if cache_entry['etag'] is not None:
+        headers['If-None-Match'] = cache_entry['etag']
+
+    if cache_entry['last_modified'] is not None:
+        headers['If-Modified-Since'] = cache_entry['last_modified']
+
+    return headers
+
+def get_output_settings(
+) -> dict[str, object]:
+    """
+    Get the output settings the ingested artifacts are saved with.
+
+    :return: Dictionary containing the JSON output mode and the
+        Parquet output flag
+    :rtype: dict[str, object]
+    """
+    return {
+        'json_output': get_json_output_mode(),
+        'parquet_output': is_parquet_output_enabled()
+    }
+
+def is_cached_output_current(
+        cache_entry: dict
+) -> bool:
+    """
+    Check if the artifacts ingested from a cached page are still
+    saved, with the current output settings.
+
+    :param cache_entry: Cache entry of the page
+    :type cache_entry: dict
+
+    :return: True if every artifact recorded in the cache entry
+        exists and the output settings are unchanged, otherwise False
+    :rtype: bool
+    """
+    # Entries saved before the artifacts were recorded have no output settings
+    if cache_entry.get('output_settings') != get_output_settings():
+        return False
+
+    for output_filepath in cache_entry['output_filepaths']:
+        if not os.path.exists(output_filepath):
+            return False
+
+    return True
+
+def write_file_atomically(
+        filepath: str,
+        content: str
+) -> None:
+    """
+    Write a text file through a temporary file in the same
+    directory replacing it atomically, so readers never see a
+    partially written file.
+
+    :param filepath: Filepath of the file
+    :type filepath: str
+
+    :param content: Content of the file
+    :type content: str
+    """
+    file_descriptor, temporary_filepath = tempfile.mkstemp(
+        dir=os.path.dirname(filepath),
+        prefix=os.path.basename(filepath) + '.',
+        suffix='.tmp'
+    )
+
+    try:
+        with os.fdopen(file_descriptor, 'w', encoding='utf-8') as file:
+            file.write(content)
+
+        os.replace(
+            temporary_filepath,
+            filepath
+        )
+
+    except BaseException:
+        os.remove(temporary_filepath)
+        raise
+
+def save_cache_entry(
+        fetched_page: dict,
+        output_dir: str
+) -> None:
+    """
+    Save the cache entry of a fetched page. This is meant to be called
+    once the page was ingested successfully, so a failed ingest is
+    retried on the next fetch.
+
+    :param fetched_page: Fetched page from the fetch stage
+    :type fetched_page: dict
+
+    :param output_dir: Directory of the artifacts ingested from
+        the page (e.g. `data/raw/daily_weather_forecasts`)
+    :type output_dir: str
+    """
+    if not is_cache_enabled() or fetched_page['html'] is None or fetched_page['unchanged']:
+        return
+
+    cache_dir = get_cache_dir()
+
+    if not os.path.exists(cache_dir):
+        os.makedirs(cache_dir)
+
+    output_filepaths = []
+
+    for output_filepath in sorted(glob.glob(os.path.join(output_dir, '*'))):
+        if os.path.isfile(output_filepath):
+            output_filepaths.append(
+                output_filepath
+            )
+
+    cache_key = get_cache_key(fetched_page['url'])
+    cache_entry = {
+        'url': fetched_page['url'],
+        'etag': fetched_page['etag'],
+        'last_modified': fetched_page['last_modified'],
+        'content_sha256': fetched_page['content_sha256'],
+        'output_filepaths': output_filepaths,
+        'output_settings': get_output_settings()
+    }
+
+    # Write the page before its metadata so an entry never points to a missing page
+    write_file_atomically(
+        os.path.join(cache_dir, cache_key + '.html'),
+        fetched_page['html']
+    )
+    write_file_atomically(
+        os.path.join(cache_dir, cache_key + '.json'),
+        json.dumps(cache_entry, indent=4)
+    )
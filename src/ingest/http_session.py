@@ -0,0 +1,174 @@
+"""
+Shared HTTP transport for the ingest workflows.
+
+This module contains the pooled HTTP session used by the ETL pipeline
+to fetch pages from the PAGASA-DOST website. The session reuses
+connections to the website across pages, negotiates compressed
+responses (gzip/deflate, and brotli when a brotli decoder is installed),
+applies connect/read timeouts and retries failed requests with
+exponential backoff within a retry budget shared by all requests of
+the process.
+
+Configuration (environment variables):
+- `PAGASA_CONNECT_TIMEOUT` - Connect timeout in seconds (default: 5)
+- `PAGASA_READ_TIMEOUT` - Read timeout in seconds (default: 30)
+- `PAGASA_MAX_RETRIES` - Maximum retries per request (default: 3)
+- `PAGASA_RETRY_BUDGET` - Maximum retries per process (default: 10)
+- `PAGASA_BACKOFF_FACTOR` - Backoff factor in seconds (default: 0.5)
+
+Main functions:
+- `get_session()` - Get the shared pooled HTTP session
+- `get_with_retries()` - Send a GET request with timeouts and retries
+"""
+import os
+import time
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+_session = None
+_session_lock = threading.Lock()
+
+_remaining_retry_budget = None
+_retry_budget_lock = threading.Lock()
+
+def get_session(
+) -> requests.Session:
+    """
+    Get the shared pooled HTTP session, creating it on first use.
+
+    :return: Shared HTTP session with connection pooling and
+        compressed response negotiation
+    :rtype: requests.Session
+    """
+    global _session
+
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+
+            # Keep enough pooled connections for the concurrent fetch stage
+            adapter = HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=8
+            )
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+
+            # Advertise brotli only when urllib3 is able to decode it
+            session.headers.update(
+                make_headers(accept_encoding=True)
+            )
+            _session = session
+
+    return _session
+
+def close_session(
+) -> None:
+    """
+    Close the shared HTTP session and its pooled connections.
+    """
+    global _session
+
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
+
+def get_timeouts(
+) -> tuple[float, float]:
+    """
+    Get the connect and read timeouts of the HTTP requests.
+
+    :return: Connect and read timeouts in seconds
+    :rtype: tuple[float, float]
+    """
+    connect_timeout = float(os.getenv('PAGASA_CONNECT_TIMEOUT', '5'))
+    read_timeout = float(os.getenv('PAGASA_READ_TIMEOUT', '30'))
+
+    return connect_timeout, read_timeout
+
+def consume_retry_budget(
+) -> bool:
+    """
+    Consume one retry from the retry budget shared by all
+    requests of the process.
+
+    :return: True if a retry is allowed, otherwise False
+    :rtype: bool
+    """
+    global _remaining_retry_budget
+
+    with _retry_budget_lock:
+        if _remaining_retry_budget is None:
+            _remaining_retry_budget = int(os.getenv('PAGASA_RETRY_BUDGET', '10'))
+
+        if _remaining_retry_budget <= 0:
+            return False
+
+        _remaining_retry_budget -= 1
+
+    return True
+
+def reset_retry_budget(
+) -> None:
+    """
+    Reset the retry budget so it is read again from the
+    environment on the next retry.
+    """
+    global _remaining_retry_budget
+
+    with _retry_budget_lock:
+        _remaining_retry_budget = None
+
+def get_with_retries(
+        url: str,
+        headers: dict[str, str] | None = None
+) -> requests.Response:
+    """
+    Send a GET request using the shared HTTP session, retrying
+    connection errors, timeouts and retryable status codes with
+    exponential backoff.
+
+    :param url: URL to request
+    :type url: str
+
+    :param headers: Additional request headers, or NoneType
+    :type headers: dict[str, str] | None
+
+    :return: Response of the last attempt
+    :rtype: requests.Response
+    """
+    session = get_session()
+    timeouts = get_timeouts()
+    max_retries = int(os.getenv('PAGASA_MAX_RETRIES', '3'))
+    backoff_factor = float(os.getenv('PAGASA_BACKOFF_FACTOR', '0.5'))
+
+    attempt = 0
+
+    while True:
+        try:
+            response = session.get(
+                url,
+                headers=headers,
+                timeout=timeouts
+            )
+
+        except (requests.ConnectionError, requests.Timeout):
+            if attempt >= max_retries or not consume_retry_budget():
+                raise
+
+        else:
+            if response.status_code not in RETRYABLE_STATUS_CODES:
+                return response
+
+            if attempt >= max_retries or not consume_retry_budget():
+                return response
+
+            response.close()
+
+        time.sleep(backoff_factor * (2 ** attempt))
+        attempt += 1
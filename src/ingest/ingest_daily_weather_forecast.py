@@ -6,6 +6,9 @@ data from the PAGASA-DOST daily weather forecast page and store the
 ingested artifacts as JSON files under the `data/raw/daily_weather_forecasts/`
 subdirectory for further processing.
 
+The page is indexed once with `index_daily_weather_forecast_sections()`
+and every ingest function reads its section from that index.
+
 Ingested data:
 - Issued datetime
 - Synopsis
@@ -15,9 +18,23 @@ Ingested data:
 - Temperature and relative humidity
 """
 import os
-import requests
-import json
 from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
+from bs4 import Tag
+from ingest.fetch_pages import fetch_page
+from ingest.json_output import save_ingested_json
+from ingest.parquet_output import is_parquet_output_enabled
+from ingest.parquet_output import build_place_columns
+from ingest.parquet_output import save_ingested_parquet
+from ingest.parser_backends import build_restricted_soup
+
+# Only the issued datetime tag and the section tags are ingested from the page
+DAILY_WEATHER_FORECAST_SECTIONS_STRAINER = SoupStrainer(
+    'div',
+    attrs={
+        'class': ['col-md-12 col-lg-12', 'col-md-12 col-lg-12 issue']
+    }
+)
 
 def create_subdir(
 ) -> None:
@@ -29,6 +46,34 @@ def create_subdir(
     if not os.path.exists('data/raw/daily_weather_forecasts'):
         os.makedirs('data/raw/daily_weather_forecasts')
 
+def parse_soup_from_html(
+        html: str | None
+) -> BeautifulSoup | None:
+    """
+    Parse BeautifulSoup object of the ingested subtree
+    with the configured parser backend from the
+    fetched HTML of the daily weather forecast page of the
+    PAGASA-DOST website.
+
+    :param html: HTML of the fetched page, or
+        NoneType if the page does not allow scraping
+    :type html: str | None
+
+    :return: A BeautifulSoup object representing
+        the parsed HTML of the page, or NoneType if
+        the page does not allow scraping
+    :rtype: BeautifulSoup | None
+    """
+    if html is None:
+        return None
+
+    soup = build_restricted_soup(
+        html,
+        DAILY_WEATHER_FORECAST_SECTIONS_STRAINER
+    )
+
+    return soup
+
 def ingest_and_parse_soup_from_url(
         url: str
 ) -> BeautifulSoup | None:
@@ -46,42 +91,125 @@ def ingest_and_parse_soup_from_url(
         if the page does not allow scraping
     :rtype: BeautifulSoup | None
     """
-    response = requests.get(url)
+    fetched_page = fetch_page(
+        url
+    )
+    soup = parse_soup_from_html(
+        fetched_page['html']
+    )
+
+    return soup
+
+def is_daily_weather_forecast_section_tag(
+        tag: Tag
+) -> bool:
+    """
+    Check if an HTML tag is the issued datetime tag or one of
+    the section tags of the daily weather forecast page of the
+    PAGASA-DOST website.
 
-    if response.status_code != 200:
-        return None
+    :param tag: HTML tag of the page
+    :type tag: Tag
 
-    soup = BeautifulSoup(response.text, 'html.parser')
+    :return: True if the HTML tag is the issued datetime tag or
+        a section tag, otherwise False
+    :rtype: bool
+    """
+    if tag.name != 'div':
+        return False
 
-    return soup
+    class_name = ' '.join(tag.get('class', []))
 
-def ingest_issued_datetime(
+    return class_name in ('col-md-12 col-lg-12', 'col-md-12 col-lg-12 issue')
+
+def index_daily_weather_forecast_sections(
         soup: BeautifulSoup | None
-) -> str:
+) -> dict[str, Tag | None]:
     """
-    Ingest the issued datetime from the daily weather
-    forecast page of the PAGASA-DOST website.
+    Index the section tags of the daily weather forecast page
+    of the PAGASA-DOST website in a single pass over the page,
+    so the ingest functions do not search the whole page again.
 
     :param soup: A BeautifulSoup object representing
         the parsed HTML of the page, or NoneType
         if the page does not allow scraping
     :type soup: BeautifulSoup | None
 
+    :return: Dictionary containing section names and corresponding
+        section tags, or NoneType for sections missing from the page
+    :rtype: dict[str, Tag | None]
+    """
+    sections = {
+        'issued_datetime': None,
+        'synopsis': None,
+        'tropical_cyclone_informations': None,
+        'forecast_weather_conditions': None,
+        'forecast_wind_and_coastal_water_conditions': None,
+        'temperature_and_relative_humidity': None
+    }
+
+    if soup is None:
+        return sections
+
+    list_of_all_daily_weather_forecasts_tags = []
+
+    for tag in soup.find_all(is_daily_weather_forecast_section_tag):
+        if 'issue' in tag.get('class', []):
+            if sections['issued_datetime'] is None:
+                sections['issued_datetime'] = tag
+
+            continue
+
+        list_of_all_daily_weather_forecasts_tags.append(
+            tag
+        )
+
+    # Use if statement to check if there's 4 or 5 instances of a certain div tag.
+    # If 5 instances are present, it means the tropical cyclone information tag is present
+    if len(list_of_all_daily_weather_forecasts_tags) == 4:
+        section_names = [
+            'synopsis',
+            'forecast_weather_conditions',
+            'forecast_wind_and_coastal_water_conditions',
+            'temperature_and_relative_humidity'
+        ]
+
+    else:
+        section_names = [
+            'synopsis',
+            'tropical_cyclone_informations',
+            'forecast_weather_conditions',
+            'forecast_wind_and_coastal_water_conditions',
+            'temperature_and_relative_humidity'
+        ]
+
+    for section_name, section_tag in zip(section_names, list_of_all_daily_weather_forecasts_tags):
+        sections[section_name] = section_tag
+
+    return sections
+
+def ingest_issued_datetime(
+        sections: dict[str, Tag | None]
+) -> str:
+    """
+    Ingest the issued datetime from the daily weather
+    forecast page of the PAGASA-DOST website.
+
+    :param sections: Section tags of the daily weather
+        forecast page of the PAGASA-DOST website
+    :type sections: dict[str, Tag | None]
+
     :return: Issued datetime from the daily weather forecast
         page of the PAGASA-DOST website
     :rtype: str
     """
     issued_datetime = ''
 
-    if soup is None:
+    issued_datetimes_tag = sections['issued_datetime']
+
+    if issued_datetimes_tag is None:
         return issued_datetime
 
-    issued_datetimes_tag = soup.find(
-        'div',
-        attrs={
-            'class': 'col-md-12 col-lg-12 issue'
-        }
-    )
     issued_datetime = issued_datetimes_tag.text
     issued_datetime = str(issued_datetime)
 
@@ -106,23 +234,21 @@ def save_ingested_issued_datetime(
         }
     ]
 
-    with open(
-        'data/raw/daily_weather_forecasts/issued_datetime.json',
-        'w'
-    ) as json_file:
-        json.dump(ingested_data, json_file, indent=4)
+    save_ingested_json(
+        ingested_data,
+        'data/raw/daily_weather_forecasts/issued_datetime.json'
+    )
 
 def ingest_synopsis(
-        soup: BeautifulSoup | None
+        sections: dict[str, Tag | None]
 ) -> str:
     """
     Ingest the synopsis from the daily weather
     forecast page of the PAGASA-DOST website.
 
-    :param soup: A BeautifulSoup object representing
-        the parsed HTML of the page, or NoneType
-        if the page does not allow scraping
-    :type soup: BeautifulSoup | None
+    :param sections: Section tags of the daily weather
+        forecast page of the PAGASA-DOST website
+    :type sections: dict[str, Tag | None]
 
     :return: Synopsis from the daily weather forecast
         page of the PAGASA-DOST website
@@ -130,15 +256,11 @@ def ingest_synopsis(
     """
     synopsis = ''
 
-    if soup is None:
+    synopses_tag = sections['synopsis']
+
+    if synopses_tag is None:
         return synopsis
 
-    synopses_tag = soup.find(
-        'div',
-        attrs={
-            'class': 'col-md-12 col-lg-12'
-        }
-    )
     paragraph_tag = synopses_tag.find(
         'p'
     )
@@ -165,24 +287,22 @@ def save_ingesed_synopsis(
         }
     ]
 
-    with open(
-        'data/raw/daily_weather_forecasts/synopsis.json',
-        'w'
-    ) as json_file:
-        json.dump(ingested_data, json_file, indent=4)
+    save_ingested_json(
+        ingested_data,
+        'data/raw/daily_weather_forecasts/synopsis.json'
+    )
 
 def ingest_tropical_cyclone_informations(
-        soup: BeautifulSoup | None
+        sections: dict[str, Tag | None]
 ) -> dict[str, str]:
     """
     Ingest tropical cyclone informations from the
     daily weather forecast page of the PAGASA-DOST
     website.
 
-    :param soup: A BeautifulSoup object representing
-        the parsed HTML of the page, or NoneType
-        if the page does not allow scraping
-    :type soup: BeautifulSoup | None
+    :param sections: Section tags of the daily weather
+        forecast page of the PAGASA-DOST website
+    :type sections: dict[str, Tag | None]
 
     :return: Tropical cyclone informations from the
         daily weather forecast page of the PAGASA-DOST
@@ -204,17 +324,16 @@ def save_ingested_tropical_cyclone_informations(
     """
 
 def ingest_forecast_weather_conditions(
-        soup: BeautifulSoup | None
+        sections: dict[str, Tag | None]
 ) -> dict[str, list]:
     """
     Ingest forecast weather conditions from the
     daily weather forecast page of the PAGASA-DOST
     website.
 
-    :param soup: A BeautifulSoup object representing
-        the parsed HTML of the page, or NoneType if the
-        page does not allow scraping
-    :type soup: BeautifulSoup | None
+    :param sections: Section tags of the daily weather
+        forecast page of the PAGASA-DOST website
+    :type sections: dict[str, Tag | None]
 
     :return: Forecast weather conditions from the daily
         weather forecast page of the PAGASA-DOST website
@@ -227,23 +346,10 @@ def ingest_forecast_weather_conditions(
         'impact': []
     }
 
-    if soup is None:
-        return forecast_weather_conditions
-
-    list_of_all_daily_weather_forecasts_tags = soup.find_all(
-        'div',
-        attrs={
-            'class': 'col-md-12 col-lg-12'
-        }
-    )
-
-    # Use if statement to check if there's 4 or 5 instances of a certain div tag.
-    # If 5 instances are present, it means the tropical cyclone information tag is present
-    if len(list_of_all_daily_weather_forecasts_tags) == 4:
-        forecast_weather_conditions_tag = list_of_all_daily_weather_forecasts_tags[1]
+    forecast_weather_conditions_tag = sections['forecast_weather_conditions']
 
-    else:
-        forecast_weather_conditions_tag = list_of_all_daily_weather_forecasts_tags[2]
+    if forecast_weather_conditions_tag is None:
+        return forecast_weather_conditions
 
     tbody_tag = forecast_weather_conditions_tag.find(
         'tbody'
@@ -301,24 +407,29 @@ def save_ingested_forecast_weather_conditions(
     """
     ingested_data = forecast_weather_conditions
 
-    with open(
-        'data/raw/daily_weather_forecasts/forecast_weather_conditions.json',
-        'w'
-    ) as json_file:
-        json.dump(ingested_data, json_file, indent=4)
+    save_ingested_json(
+        ingested_data,
+        'data/raw/daily_weather_forecasts/forecast_weather_conditions.json'
+    )
+
+    # Save a tidy table of one row per place next to the JSON artifact
+    if is_parquet_output_enabled():
+        save_ingested_parquet(
+            build_place_columns(ingested_data),
+            'data/raw/daily_weather_forecasts/forecast_weather_conditions.parquet'
+        )
 
 def ingest_forecast_wind_and_coastal_water_conditions(
-        soup: BeautifulSoup | None
+        sections: dict[str, Tag | None]
 ) -> dict[str, list]:
     """
     Ingest forecast wind and coastal water conditions from
     the daily weather forecast page of the PAGASA-DOST
     website.
 
-    :param soup: A BeautifulSoup object representing the parsed
-        HTML of the page, or NoneType if the page does not allow
-        scraping
-    :type soup: BeautifulSoup | None
+    :param sections: Section tags of the daily weather
+        forecast page of the PAGASA-DOST website
+    :type sections: dict[str, Tag | None]
 
     :return: Forecast wind and coastal water conditions from the daily
         weather forecast page of the PAGASA-DOST website
@@ -331,24 +442,11 @@ def ingest_forecast_wind_and_coastal_water_conditions(
         'coastal_water': []
     }
 
-    if soup is None:
-        return forecast_wind_and_coastal_water_conditions
-
-    list_of_all_daily_weather_forecasts_tags = soup.find_all(
-        'div',
-        attrs={
-            'class': 'col-md-12 col-lg-12'
-        }
-    )
+    forecast_wind_and_coastal_water_conditions_tag = sections['forecast_wind_and_coastal_water_conditions']
 
-    # Use if statement to check if there's 4 or 5 instances of a certain div tag.
-    # If 5 instances are present, it means the tropical cyclone information tag is present
-    if len(list_of_all_daily_weather_forecasts_tags) == 4:
-        forecast_wind_and_coastal_water_conditions_tag = list_of_all_daily_weather_forecasts_tags[2]
+    if forecast_wind_and_coastal_water_conditions_tag is None:
+        return forecast_wind_and_coastal_water_conditions
 
-    else:
-        forecast_wind_and_coastal_water_conditions_tag = list_of_all_daily_weather_forecasts_tags[3]
-    
     tbody_tag = forecast_wind_and_coastal_water_conditions_tag.find(
         'tbody'
     )
@@ -403,24 +501,29 @@ def save_ingested_forecast_wind_and_coastal_water_conditions(
     """
     ingested_data = forecast_wind_and_coastal_water_conditions
 
-    with open(
-        'data/raw/daily_weather_forecasts/forecast_wind_and_coastal_water_conditions.json',
-        'w'
-    ) as json_file:
-        json.dump(ingested_data, json_file, indent=4)
+    save_ingested_json(
+        ingested_data,
+        'data/raw/daily_weather_forecasts/forecast_wind_and_coastal_water_conditions.json'
+    )
+
+    # Save a tidy table of one row per place next to the JSON artifact
+    if is_parquet_output_enabled():
+        save_ingested_parquet(
+            build_place_columns(ingested_data),
+            'data/raw/daily_weather_forecasts/forecast_wind_and_coastal_water_conditions.parquet'
+        )
 
 def ingest_temperature_and_relative_humidity(
-        soup: BeautifulSoup | None
+        sections: dict[str, Tag | None]
 ) -> dict[str, dict]:
     """
     Ingest the temperature and relative humidity from
     the daily weather forecast page of the PAGASA-DOST
     website..
 
-    :param soup: A BeautifulSoup object representing the parsed
-        HTML of the page, or NoneType if the page does not allow
-        scraping
-    :type soup: BeautifulSoup | None
+    :param sections: Section tags of the daily weather
+        forecast page of the PAGASA-DOST website
+    :type sections: dict[str, Tag | None]
 
     :return: Temperature and relative humidity from the daily
         weather forecast page of the PAGASA-DOST website
@@ -437,23 +540,10 @@ def ingest_temperature_and_relative_humidity(
         }
     }
 
-    if soup is None:
-        return temperature_and_relative_humidity
+    temperature_and_relative_humidity_tag = sections['temperature_and_relative_humidity']
 
-    list_of_all_daily_weather_forecasts_tags = soup.find_all(
-        'div',
-        attrs={
-            'class': 'col-md-12 col-lg-12'
-        }
-    )
-
-    # Use if statement to check if there's 4 or 5 instances of a certain div tag.
-    # If 5 instances are present, it means the tropical cyclone information tag is present
-    if len(list_of_all_daily_weather_forecasts_tags) == 4:
-        temperature_and_relative_humidity_tag = list_of_all_daily_weather_forecasts_tags[3]
-    
-    else:
-        temperature_and_relative_humidity_tag = list_of_all_daily_weather_forecasts_tags[4]
+    if temperature_and_relative_humidity_tag is None:
+        return temperature_and_relative_humidity
 
     tbody_tag = temperature_and_relative_humidity_tag.find(
         'tbody'
@@ -528,8 +618,7 @@ def save_ingested_temperature_and_relative_humidity(
     """
     ingested_data = temperature_and_relative_humidity
 
-    with open(
-        'data/raw/daily_weather_forecasts/temperature_and_relative_humidity.json',
-        'w'
-    ) as json_file:
-        json.dump(ingested_data, json_file, indent=4)
\ No newline at end of file
+    save_ingested_json(
+        ingested_data,
+        'data/raw/daily_weather_forecasts/temperature_and_relative_humidity.json'
+    )
\ No newline at end of file
@@ -9,9 +9,10 @@ Ingested data:
 - TBA
 """
 import os
-import requests
 import json
 from bs4 import BeautifulSoup
+from ingest.fetch_pages import fetch_page
+from ingest.parser_backends import build_soup
 
 def create_subdir(
 ) -> None:
@@ -23,6 +24,32 @@ def create_subdir(
     if not os.path.exists('data/raw/weather_advisories'):
         os.makedirs('data/raw/weather_advisories')
 
+def parse_soup_from_html(
+        html: str | None
+) -> BeautifulSoup | None:
+    """
+    Parse BeautifulSoup object with the configured
+    parser backend from the fetched HTML of the
+    weather advisories page of the PAGASA-DOST website.
+
+    :param html: HTML of the fetched page, or
+        NoneType if the page does not allow scraping
+    :type html: str | None
+
+    :return: A BeautifulSoup object representing
+        the parsed HTML of the page, or NoneType if
+        the page does not allow scraping
+    :rtype: BeautifulSoup | None
+    """
+    if html is None:
+        return None
+
+    soup = build_soup(
+        html
+    )
+
+    return soup
+
 def ingest_and_parse_soup_from_url(
         url: str
 ) -> BeautifulSoup | None:
@@ -40,11 +67,11 @@ def ingest_and_parse_soup_from_url(
         the page does not allow scraping
     :rtype: BeautifulSoup | None
     """
-    response = requests.get(url)
-
-    if response.status_code != 200:
-        return None
-
-    soup = BeautifulSoup(response.text, 'html.parser')
+    fetched_page = fetch_page(
+        url
+    )
+    soup = parse_soup_from_html(
+        fetched_page['html']
+    )
 
     return soup
\ No newline at end of file
@@ -17,9 +17,22 @@ Ingested data:
 - Weather outlook for Philippine cities
 """
 import os
-import requests
-import json
 from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
+from ingest.fetch_pages import fetch_page
+from ingest.json_output import save_ingested_json
+from ingest.parquet_output import is_parquet_output_enabled
+from ingest.parquet_output import build_weather_outlook_columns
+from ingest.parquet_output import save_ingested_parquet
+from ingest.parser_backends import build_restricted_soup
+
+# Only the `row weather-page` subtree is ingested from the page
+WEATHER_PAGE_STRAINER = SoupStrainer(
+    'div',
+    attrs={
+        'class': 'row weather-page'
+    }
+)
 
 def create_subdir(
 ) -> None:
@@ -31,6 +44,34 @@ def create_subdir(
     if not os.path.exists('data/raw/weather_outlooks_for_ph_cities'):
         os.makedirs('data/raw/weather_outlooks_for_ph_cities')
 
+def parse_soup_from_html(
+        html: str | None
+) -> BeautifulSoup | None:
+    """
+    Parse BeautifulSoup object of the ingested subtree
+    with the configured parser backend from the
+    fetched HTML of the weather outlook for selected Philippine
+    cities page of the PAGASA-DOST website.
+
+    :param html: HTML of the fetched page, or
+        NoneType if the page does not allow scraping
+    :type html: str | None
+
+    :return: A BeautifulSoup object representing
+        the parsed HTML of the page, or NoneType if
+        the page does not allow scraping
+    :rtype: BeautifulSoup | None
+    """
+    if html is None:
+        return None
+
+    soup = build_restricted_soup(
+        html,
+        WEATHER_PAGE_STRAINER
+    )
+
+    return soup
+
 def ingest_and_parse_soup_from_url(
         url: str
 ) -> BeautifulSoup | None:
@@ -50,12 +91,12 @@ def ingest_and_parse_soup_from_url(
         does not allow scraping
     :rtype: BeautifulSoup | None
     """
-    response = requests.get(url)
-
-    if response.status_code != 200:
-        return None
-
-    soup = BeautifulSoup(response.text, 'html.parser')
+    fetched_page = fetch_page(
+        url
+    )
+    soup = parse_soup_from_html(
+        fetched_page['html']
+    )
 
     return soup
 
@@ -121,11 +162,10 @@ def save_ingested_issued_datetime(
         }
     ]
 
-    with open(
-        'data/raw/weather_outlooks_for_ph_cities/issued_datetime.json',
-        'w'
-    ) as json_file:
-        json.dump(ingested_data, json_file, indent=4)
+    save_ingested_json(
+        ingested_data,
+        'data/raw/weather_outlooks_for_ph_cities/issued_datetime.json'
+    )
 
 def ingest_time_validity(
     soup: BeautifulSoup | None
@@ -189,11 +229,10 @@ def save_ingested_time_validity(
         }
     ]
 
-    with open(
-        'data/raw/weather_outlooks_for_ph_cities/time_validity.json',
-        'w'
-    ) as json_file:
-        json.dump(ingested_data, json_file, indent=4)
+    save_ingested_json(
+        ingested_data,
+        'data/raw/weather_outlooks_for_ph_cities/time_validity.json'
+    )
 
 def ingest_and_parse_list_of_all_ph_city_tags(
     soup: BeautifulSoup | None
@@ -237,37 +276,6 @@ def ingest_and_parse_list_of_all_ph_city_tags(
 
     return list_of_all_ph_city_tags
 
-def ingest_ph_city_names(
-        list_of_all_ph_city_tags: list[BeautifulSoup]
-) -> dict[str, dict]:
-    """
-    Ingest selected Philippine city names from the HTML
-    tags of selected Philippine cities to get their weather
-    outlooks from the PAGASA-DOST website.
-
-    :param list_of_all_ph_city_tags: HTML tags of selected
-        Philippine cities to get their weather outlooks
-        from the PAGASA-DOST website
-    :type list_of_all_ph_city_tags: list[BeautifulSoup]
-
-    :return: Selected Philippine city names dictionary
-    :rtype: dict[str, dict]
-    """
-    result = {}
-
-    if list_of_all_ph_city_tags == []:
-        return result
-
-    for ph_city_tag in list_of_all_ph_city_tags:
-        ph_city_name_tag = ph_city_tag.find(
-            'a'
-        )
-        ph_city_name = ph_city_name_tag.text
-        ph_city_name = str(ph_city_name)
-        result[ph_city_name] = {}
-
-    return result
-
 def ingest_weather_dates(
         list_of_all_ph_city_tags: list[BeautifulSoup]
 ) -> list[str]:
@@ -320,248 +328,127 @@ def ingest_weather_dates(
 
     return list_of_all_weather_dates
 
-def map_ph_city_names_to_weather_dates(
-        ph_city_names_dict: dict[str, dict],
-        list_of_all_weather_dates: list[str]
-) -> dict[str, dict]:
+def ingest_ph_city_weather_outlook(
+        ph_city_tag: BeautifulSoup
+) -> tuple[str, list[list], list[str]]:
     """
-    Map selected Philippine city names to their
-    corresponding weather dates to get their
-    weather outlooks from the PAGASA-DOST website.
-
-    :param ph_city_names_dict: Selected Philippine city
-        names dictionary
-    :type ph_city_names_dict: dict[str, dict]
-
-    :param list_of_all_weather_dates: List of all weather
-        dates for selected Philippine cities
-    :type list_of_all_weather_dates: list[str]
-
-    :return: Selected Philippine city names with weather
-        dates
-    :rtype: dict[str, dict]
-    """
-    result = ph_city_names_dict
-
-    if ph_city_names_dict == {} or list_of_all_weather_dates == []:
-        return result
-
-    list_of_all_ph_city_names = list(ph_city_names_dict.keys())
-
-    # Map selected Philippine city name to it's corresponding weather dates
-    for ph_city_name in list_of_all_ph_city_names:
-        result[ph_city_name]['weather_date'] = list_of_all_weather_dates
+    Ingest the name, temperature ranges and chance of rain
+    percentages of a selected Philippine city from its HTML
+    tag in a single pass over its weather dates.
 
-    return result
+    :param ph_city_tag: HTML tag of a selected Philippine city
+        to get its weather outlook from the PAGASA-DOST website
+    :type ph_city_tag: BeautifulSoup
 
-def ingest_temperature_ranges(
-        list_of_all_ph_city_tags: list[BeautifulSoup]
-) -> list[list]:
+    :return: Philippine city name, temperature ranges and
+        chance of rain percentages
+    :rtype: tuple[str, list[list], list[str]]
     """
-    Ingest temperature ranges from the HTML tags of selected
-    Philippine cities to get their weather outlooks from the
-    PAGASA-DOST website.
-
-    :param list_of_all_ph_city_tags: HTML tags of selected
-        Philippine cities to get their weather outlooks
-        from the PAGASA-DOST website
-    :type list_of_all_ph_city_tags: list[BeautifulSoup]
+    ph_city_name_tag = ph_city_tag.find(
+        'a'
+    )
+    ph_city_name = str(ph_city_name_tag.text)
 
-    :return: List of all temperature ranges for selected
-        Philippine cities
-    :rtype: list[list]
-    """
-    list_of_all_temperature_ranges = []
+    table_tag = ph_city_tag.find(
+        'table',
+        attrs={
+            'class': 'table'
+        }
+    )
+    table_row_tag = table_tag.find(
+        'tr',
+        attrs={
+            'class': 'desktop-view-tr'
+        }
+    )
+    list_of_all_table_data_tags = table_row_tag.find_all(
+        'td'
+    )
 
-    if list_of_all_ph_city_tags == []:
-        return temperature_ranges
+    temperature_ranges = []
+    chance_of_rain_percentages = []
 
-    for ph_city_tag in list_of_all_ph_city_tags:
-        table_tag = ph_city_tag.find(
-            'table',
+    # Every table data tag holds the temperature range and chance of rain of a weather date
+    for table_data_tag in list_of_all_table_data_tags:
+        minimum_temperature_tag = table_data_tag.find(
+            'span',
             attrs={
-                'class': 'table'
+                'class': 'min'
             }
         )
-        table_row_tag = table_tag.find(
-            'tr',
+        maximum_temperature_tag = table_data_tag.find(
+            'span',
             attrs={
-                'class': 'desktop-view-tr'
+                'class': 'max'
             }
         )
-        list_of_all_table_data_tags = table_row_tag.find_all(
-            'td'
+        temperature_ranges.append(
+            [str(minimum_temperature_tag.text), str(maximum_temperature_tag.text)]
         )
 
-        temperature_ranges = []
-
-        for table_data_tag in list_of_all_table_data_tags:
-            minimum_temperature_tag = table_data_tag.find(
-                'span',
-                attrs={
-                    'class': 'min'
-                }
-            )
-            minimum_temperature = minimum_temperature_tag.text
-            minimum_temperature = str(minimum_temperature)
-
-            maximum_temperature_tag = table_data_tag.find(
-                'span',
-                attrs={
-                    'class': 'max'
-                }
-            )
-            maximum_temperature = maximum_temperature_tag.text
-            maximum_temperature = str(maximum_temperature)
-
-            temperature_ranges.append(
-                [minimum_temperature, maximum_temperature]
-            )
-
-        list_of_all_temperature_ranges.append(
-            temperature_ranges
+        span_tag = table_data_tag.find(
+            'span',
+            attrs={
+                'style': 'font-weight:bold; color: rgb(9, 73, 156);'
+            }
+        )
+        chance_of_rain_percentages.append(
+            str(span_tag.text)
         )
 
-    return list_of_all_temperature_ranges
-
-def map_ph_city_names_to_temperature_ranges(
-        ph_city_names_with_weather_dates: dict[str, dict],
-        list_of_all_temperature_ranges: list[list]
-) -> dict[str, dict]:
-    """
-    Map selected Philippine city names with weather dates to their
-    corresponding temperature ranges to get their weather outlooks
-    from the PAGASA-DOST website.
-
-    :param ph_city_names_with_weather_dates: Selected Philippine
-        city names with weather dates
-    :type ph_city_names_with_weather_dates: dict[str, dict]
-
-    :param list_of_all_temperature_ranges: List of all temperature
-        ranges for selected Philippine cities
-    :type list_of_all_temperature_ranges: list[list]
-
-    :return: Selected Philippine city names with their corresponding
-        weather dates and temperature ranges
-    :rtype: dict[str, dict]
-    """
-    result = ph_city_names_with_weather_dates
-
-    list_of_all_ph_city_names = list(ph_city_names_with_weather_dates.keys())
-
-    if ph_city_names_with_weather_dates == {} or list_of_all_temperature_ranges == []:
-        return result
-
-    # Map temperature ranges to cities in sequential order (1-to-1 mapping)
-    # The ingested temperature ranges maintain the same order as the city names in the HTML structure
-    for temperature_ranges in list_of_all_temperature_ranges:
-        for ph_city_name in list_of_all_ph_city_names:
-            # Map selected Philippine city name to it's corresponding temperature ranges if its missing
-            if 'temperature_range' in result[ph_city_name]:
-                continue
-
-            result[ph_city_name]['temperature_range'] = temperature_ranges
-            break
-
-    return result
+    return ph_city_name, temperature_ranges, chance_of_rain_percentages
 
-def ingest_chance_of_rain_percentages(
+def build_weather_outlook_for_ph_cities(
         list_of_all_ph_city_tags: list[BeautifulSoup]
-) -> list[list]:
+) -> dict[str, dict]:
     """
-    Ingest chance of rain percentages from the HTML tags
-    of selected Philippine cities to get their weather
-    outlooks from the PAGASA-DOST website.
+    Build the weather outlook for selected Philippine cities
+    in a single traversal of the HTML tags of the cities,
+    ingesting the name, temperature ranges and chance of rain
+    percentages of a city together.
 
     :param list_of_all_ph_city_tags: HTML tags of selected
-        Philippine cities to get their weather outlooks from
-        the PAGASA-DOST website
+        Philippine cities to get their weather outlooks
+        from the PAGASA-DOST website
     :type list_of_all_ph_city_tags: list[BeautifulSoup]
 
-    :return: List of all chance of rain percentages for
-        selected Philippine cities
-    :rtype: list[list]
+    :return: Weather outlook for selected Philippine cities
+    :rtype: dict[str, dict]
+
+    :raises ValueError: If a city is listed twice, or its
+        values do not match the weather dates of the page
     """
-    list_of_all_chance_of_rain_percentages = []
+    result = {}
 
     if list_of_all_ph_city_tags == []:
-        return list_of_all_chance_of_rain_percentages
+        return result
+
+    # Every city shares the weather dates of the first city tag
+    list_of_all_weather_dates = ingest_weather_dates(
+        list_of_all_ph_city_tags
+    )
 
     for ph_city_tag in list_of_all_ph_city_tags:
-        table_tag = ph_city_tag.find(
-            'table',
-            attrs={
-                'class': 'table'
-            }
-        )
-        table_row_tag = table_tag.find(
-            'tr',
-            attrs={
-                'class': 'desktop-view-tr'
-            }
+        ph_city_name, temperature_ranges, chance_of_rain_percentages = ingest_ph_city_weather_outlook(
+            ph_city_tag
         )
-        list_of_all_table_data_tags = table_row_tag.find_all(
-            'td'
-        )
-
-        chance_of_rain_percentages = []
 
-        for table_data_tag in list_of_all_table_data_tags:
-            span_tag = table_data_tag.find(
-                'span',
-                attrs={
-                    'style': 'font-weight:bold; color: rgb(9, 73, 156);'
-                }
+        if ph_city_name in result:
+            raise ValueError(
+                f'Philippine city {" ".join(ph_city_name.split())!r} is listed more than once'
             )
-            chance_of_rain_percentage = span_tag.text
-            chance_of_rain_percentage = str(chance_of_rain_percentage)
-            chance_of_rain_percentages.append(
-                chance_of_rain_percentage
-            )
-
-        list_of_all_chance_of_rain_percentages.append(
-            chance_of_rain_percentages
-        )
-
-    return list_of_all_chance_of_rain_percentages
-
-def map_ph_city_names_to_chance_of_rain_percentages(
-        weather_outlooks_for_ph_cities: dict[str, dict],
-        list_of_all_chance_of_rain_percentages: list[list]
-) -> dict[str, dict]:
-    """
-    Map selected Philippine city names with weather dates and
-    temperature ranges to their corresponding chance of rain
-    percentages to get their weather outlooks from the PAGASA-
-    DOST website.
 
-    :param weather_outlooks_for_ph_cities: Selected Philippine
-        city names with their corresponding weather dates and
-        temperature ranges
-    :type weather_outlooks_for_ph_cities: dict[str, dict]
-
-    :param list_of_all_chance_of_rain_percentages: List of all
-        chance of rain percentages for selected Philippine cities
-    :type list_of_all_chance_of_rain_percentages: list[list]
-
-    :return: Weather outlook for selected Philippine cities
-    :rtype: dict[str, dict]
-    """
-    result = weather_outlooks_for_ph_cities
-
-    list_of_all_ph_city_names = list(weather_outlooks_for_ph_cities.keys())
-
-    if weather_outlooks_for_ph_cities == {} or list_of_all_chance_of_rain_percentages == []:
-        return result
+        if len(temperature_ranges) != len(list_of_all_weather_dates):
+            raise ValueError(
+                f'Philippine city {" ".join(ph_city_name.split())!r} has {len(temperature_ranges)} '
+                f'weather outlooks, expected {len(list_of_all_weather_dates)} weather dates'
+            )
 
-    # Map chance of rain percentages to cities in sequential order (1-to-1 mapping)
-    # The ingested chance of rain percentages maintain the same order as the city names in the HTML structure
-    for chance_of_rain_percentages in list_of_all_chance_of_rain_percentages:
-        for ph_city_name in list_of_all_ph_city_names:
-            # Map selected Philippine city name to it's corresponding temperature ranges if its missing
-            if 'chance_of_rain_percentage' not in result[ph_city_name]:
-                result[ph_city_name]['chance_of_rain_percentage'] = chance_of_rain_percentages
-                break
+        result[ph_city_name] = {
+            'weather_date': list_of_all_weather_dates,
+            'temperature_range': temperature_ranges,
+            'chance_of_rain_percentage': chance_of_rain_percentages
+        }
 
     return result
 
@@ -579,8 +466,15 @@ def save_ingested_weather_outlook_for_ph_cities(
     """
     ingested_data = weather_outlook_for_ph_cities
 
-    with open(
+    save_ingested_json(
+        ingested_data,
         'data/raw/weather_outlooks_for_ph_cities/weather_outlook_for_ph_cities.json',
-        'w'
-    ) as json_file:
-        json.dump(ingested_data, json_file, indent=4)
\ No newline at end of file
+        shared_weather_dates=True
+    )
+
+    # Save a tidy table of one row per city per weather date next to the JSON artifact
+    if is_parquet_output_enabled():
+        save_ingested_parquet(
+            build_weather_outlook_columns(ingested_data, 'city'),
+            'data/raw/weather_outlooks_for_ph_cities/weather_outlook_for_ph_cities.parquet'
+        )
\ No newline at end of file
@@ -16,9 +16,22 @@ Ingested data:
 - Weather outlook for Philippine tourist areas
 """
 import os
-import requests
-import json
 from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
+from ingest.fetch_pages import fetch_page
+from ingest.json_output import save_ingested_json
+from ingest.parquet_output import is_parquet_output_enabled
+from ingest.parquet_output import build_weather_outlook_columns
+from ingest.parquet_output import save_ingested_parquet
+from ingest.parser_backends import build_restricted_soup
+
+# Only the `row weather-page` subtree is ingested from the page
+WEATHER_PAGE_STRAINER = SoupStrainer(
+    'div',
+    attrs={
+        'class': 'row weather-page'
+    }
+)
 
 def create_subdir(
 ) -> None:
@@ -30,6 +43,34 @@ def create_subdir(
     if not os.path.exists('data/raw/weather_outlooks_for_ph_tourist_areas'):
         os.makedirs('data/raw/weather_outlooks_for_ph_tourist_areas')
 
+def parse_soup_from_html(
+        html: str | None
+) -> BeautifulSoup | None:
+    """
+    Parse BeautifulSoup object of the ingested subtree
+    with the configured parser backend from the
+    fetched HTML of the weather outlook for selected Philippine
+    tourist areas page of the PAGASA-DOST website.
+
+    :param html: HTML of the fetched page, or
+        NoneType if the page does not allow scraping
+    :type html: str | None
+
+    :return: A BeautifulSoup object representing
+        the parsed HTML of the page, or NoneType if
+        the page does not allow scraping
+    :rtype: BeautifulSoup | None
+    """
+    if html is None:
+        return None
+
+    soup = build_restricted_soup(
+        html,
+        WEATHER_PAGE_STRAINER
+    )
+
+    return soup
+
 def ingest_and_parse_soup_from_url(
         url: str
 ) -> BeautifulSoup | None:
@@ -49,12 +90,12 @@ def ingest_and_parse_soup_from_url(
         the page does not allow scraping
     :rtype: BeautifulSoup | None
     """
-    response = requests.get(url)
-
-    if response.status_code != 200:
-        return None
-
-    soup = BeautifulSoup(response.text, 'html.parser')
+    fetched_page = fetch_page(
+        url
+    )
+    soup = parse_soup_from_html(
+        fetched_page['html']
+    )
 
     return soup
 
@@ -121,11 +162,10 @@ def save_ingested_issued_datetime(
         }
     ]
 
-    with open(
-        'data/raw/weather_outlooks_for_ph_tourist_areas/issued_datetime.json',
-        'w'
-    ) as json_file:
-        json.dump(ingested_data, json_file, indent=4)
+    save_ingested_json(
+        ingested_data,
+        'data/raw/weather_outlooks_for_ph_tourist_areas/issued_datetime.json'
+    )
 
 def ingest_time_validity(
         soup: BeautifulSoup | None
@@ -190,36 +230,27 @@ def save_ingested_time_validity(
         }
     ]
 
-    with open(
-        'data/raw/weather_outlooks_for_ph_tourist_areas/time_validity.json',
-        'w'
-    ) as json_file:
-        json.dump(ingested_data, json_file, indent=4)
+    save_ingested_json(
+        ingested_data,
+        'data/raw/weather_outlooks_for_ph_tourist_areas/time_validity.json'
+    )
 
-def ingest_ph_tourist_area_names(
-        soup: BeautifulSoup | None       
-) -> dict[str, dict]:
+def find_weather_outlook_table_tag(
+        soup: BeautifulSoup
+) -> BeautifulSoup:
     """
-    Ingest selected Philippine tourist area names
-    using the BeautifulSoup object representing the
-    parsed HTML of the page consisting the selected
-    Philippine tourist areas to get their weather
-    outlooks from the PAGASA-DOST website.
+    Find the desktop table of the weather outlook for selected
+    Philippine tourist areas, holding the weather dates in its
+    header and a row per tourist area in its body.
 
-    :param soup: A BeautifulSoup object representing
-        the parsed HTML of the page, or NoneType if
-        the page does not allow scraping
-    :type soup: BeautifulSoup | None
+    :param soup: A BeautifulSoup object representing the
+        parsed HTML of the page
+    :type soup: BeautifulSoup
 
-    :return: Selected Philippine tourist area names
-        dictionary
-    :rtype: dict[str, dict]
+    :return: Table tag of the weather outlook for selected
+        Philippine tourist areas
+    :rtype: BeautifulSoup
     """
-    result = {}
-
-    if soup is None:
-        return result
-
     div_tag_with_row_weather_page_class = soup.find(
         'div',
         attrs={
@@ -238,37 +269,19 @@ def ingest_ph_tourist_area_names(
             'class': 'table desktop'
         }
     )
-    tbody_tag = table_tag_with_table_desktop_class.find(
-        'tbody'
-    )
-    list_of_all_table_row_tags = tbody_tag.find_all(
-        'tr'
-    )
 
-    for table_row_tag in list_of_all_table_row_tags:
-        table_data_tag = table_row_tag.find(
-            'td'
-        )
-        ph_tourist_area_name = table_data_tag.text
-        ph_tourist_area_name = str(ph_tourist_area_name)
-        result[ph_tourist_area_name] = {}
-
-    return result
+    return table_tag_with_table_desktop_class
 
 def ingest_weather_dates(
-        soup: BeautifulSoup | None
+        table_tag_with_table_desktop_class: BeautifulSoup
 ) -> list[str]:
     """
-    Ingest weather dates using the BeautifulSoup
-    object representing the parsed HTML of the page
-    consisting the selected Philippine tourist areas
-    to get their weather outlooks from the PAGASA-DOST
-    website.
+    Ingest weather dates from the header of the table of the
+    weather outlook for selected Philippine tourist areas.
 
-    :param soup: A BeautifulSoup object representing the
-        parsed HTML of the page, or NoneType if the page
-        does not allow scraping
-    :type soup: BeautifulSoup | None
+    :param table_tag_with_table_desktop_class: Table tag of the
+        weather outlook for selected Philippine tourist areas
+    :type table_tag_with_table_desktop_class: BeautifulSoup
 
     :return: List of all weather dates for selected
         Philippine tourist areas
@@ -276,27 +289,6 @@ def ingest_weather_dates(
     """
     list_of_all_weather_dates = []
 
-    if soup is None:
-        return list_of_all_weather_dates
-
-    div_tag_with_row_weather_page_class = soup.find(
-        'div',
-        attrs={
-            'class': 'row weather-page'
-        }
-    )
-    weather_outlooks_for_ph_tourist_areas_tag = div_tag_with_row_weather_page_class.find(
-        'div',
-        attrs={
-            'class': 'col-md-12 col-lg-12'
-        }
-    )
-    table_tag_with_table_desktop_class = weather_outlooks_for_ph_tourist_areas_tag.find(
-        'table',
-        attrs={
-            'class': 'table desktop'
-        }
-    )
     thead_tag = table_tag_with_table_desktop_class.find(
         'thead'
     )
@@ -311,164 +303,105 @@ def ingest_weather_dates(
 
     return list_of_all_weather_dates
 
-def map_ph_tourist_area_names_to_weather_dates(
-        ph_tourist_area_names_dict: dict[str, dict],
-        list_of_all_weather_dates: list[str]
-) -> dict[str, dict]:
+def ingest_ph_tourist_area_weather_outlook(
+        table_row_tag: BeautifulSoup
+) -> tuple[str, list[list]]:
     """
-    Map selected Philippine tourist area names to their
-    corresponding weather dates to get their weather outlooks
-    from the PAGASA-DOST website.
+    Ingest the name and temperature ranges of a selected
+    Philippine tourist area from its table row in a single
+    pass over the table data tags of the row.
 
-    :param ph_tourist_area_names_dict: Selected Philippine
-        tourist area names dictionary
-    :type ph_tourist_area_names_dict: dict[str, dict]
-
-    :param list_of_all_weather_dates: List of all weather dates
-        for selected Philippine tourist areas
-    :type list_of_all_weather_dates: list[str]
+    :param table_row_tag: Table row tag of a selected
+        Philippine tourist area
+    :type table_row_tag: BeautifulSoup
 
-    :return: Selected Philippine tourist area names with weather
-        dates
-    :rtype: dict[str, dict]
+    :return: Philippine tourist area name and temperature ranges
+    :rtype: tuple[str, list[list]]
     """
-    result = ph_tourist_area_names_dict
-
-    if ph_tourist_area_names_dict == {} or list_of_all_weather_dates == []:
-        return result
+    list_of_all_table_data_tags = table_row_tag.find_all(
+        'td'
+    )
+    ph_tourist_area_name = str(list_of_all_table_data_tags[0].text)
 
-    list_of_all_ph_tourist_area_names = list(ph_tourist_area_names_dict.keys())
+    temperature_ranges = []
 
-    # Map selected Philippine tourist area name to it's corresponding weather dates
-    for ph_tourist_area_name in list_of_all_ph_tourist_area_names:
-        result[ph_tourist_area_name]['weather_date'] = list_of_all_weather_dates
+    # The table data tags after the name hold the temperature range of every weather date
+    for table_data_tag in list_of_all_table_data_tags[1:]:
+        minimum_temperature_tag = table_data_tag.find(
+            'span',
+            attrs={
+                'class': 'min'
+            }
+        )
+        maximum_temperature_tag = table_data_tag.find(
+            'span',
+            attrs={
+                'class': 'max'
+            }
+        )
+        temperature_ranges.append(
+            [str(minimum_temperature_tag.text), str(maximum_temperature_tag.text)]
+        )
 
-    return result
+    return ph_tourist_area_name, temperature_ranges
 
-def ingest_temperature_ranges(
+def build_weather_outlook_for_ph_tourist_areas(
         soup: BeautifulSoup | None
-) -> list[list]:
+) -> dict[str, dict]:
     """
-    Ingest temperature ranges using the BeautifulSoup
-    object representing the parsed HTML of the page
-    consisting the selected Philippine tourist areas
-    to get their weather outlooks from the PAGASA-DOST
-    website.
+    Build the weather outlook for selected Philippine tourist
+    areas in a single traversal of the table of the page,
+    ingesting the weather dates from its header and the name
+    and temperature ranges of a tourist area from its row.
 
     :param soup: A BeautifulSoup object representing the
         parsed HTML of the page, or NoneType if the page
         does not allow scraping
     :type soup: BeautifulSoup | None
 
-    :return List of all temperature ranges for selected
-        Philippine tourist areas
-    :rtype: list[list]
+    :return: Weather outlook for selected Philippine tourist areas
+    :rtype: dict[str, dict]
+
+    :raises ValueError: If a tourist area is listed twice, or
+        its temperature ranges do not match the weather dates
+        of the page
     """
-    list_of_all_temperature_ranges = []
+    result = {}
 
     if soup is None:
-        return list_of_all_temperature_ranges
+        return result
 
-    div_tag_with_row_weather_page_class = soup.find(
-        'div',
-        attrs={
-            'class': 'row weather-page'
-        }
-    )
-    weather_outlooks_for_ph_tourist_areas_tag = div_tag_with_row_weather_page_class.find(
-        'div',
-        attrs={
-            'class': 'col-md-12 col-lg-12'
-        }
+    table_tag_with_table_desktop_class = find_weather_outlook_table_tag(
+        soup
     )
-    table_tag_with_table_desktop_class = weather_outlooks_for_ph_tourist_areas_tag.find(
-        'table',
-        attrs={
-            'class': 'table desktop'
-        }
+    list_of_all_weather_dates = ingest_weather_dates(
+        table_tag_with_table_desktop_class
     )
+
     tbody_tag = table_tag_with_table_desktop_class.find(
         'tbody'
     )
-    list_of_all_table_row_tags = tbody_tag.find_all(
-        'tr'
-    )
 
-    for table_row_tag in list_of_all_table_row_tags:
-        list_of_all_table_data_tags = table_row_tag.find_all(
-            'td'
-        )[1:]
-
-        temperature_ranges = []
+    for table_row_tag in tbody_tag.find_all('tr'):
+        ph_tourist_area_name, temperature_ranges = ingest_ph_tourist_area_weather_outlook(
+            table_row_tag
+        )
 
-        for table_data_tag in list_of_all_table_data_tags:
-            minimum_temperature_tag = table_data_tag.find(
-                'span',
-                attrs={
-                    'class': 'min'
-                }
+        if ph_tourist_area_name in result:
+            raise ValueError(
+                f'Philippine tourist area {" ".join(ph_tourist_area_name.split())!r} is listed more than once'
             )
-            minimum_temperature = minimum_temperature_tag.text
-            minimum_temperature = str(minimum_temperature)
-
-            maximum_temperature = table_data_tag.find(
-                'span',
-                attrs={
-                    'class': 'max'
-                }
-            )
-            maximum_temperature = maximum_temperature.text
-            maximum_temperature = str(maximum_temperature)
 
-            temperature_ranges.append(
-                [minimum_temperature, maximum_temperature]
+        if len(temperature_ranges) != len(list_of_all_weather_dates):
+            raise ValueError(
+                f'Philippine tourist area {" ".join(ph_tourist_area_name.split())!r} has {len(temperature_ranges)} '
+                f'temperature ranges, expected {len(list_of_all_weather_dates)} weather dates'
             )
 
-        list_of_all_temperature_ranges.append(
-            temperature_ranges
-        )
-
-    return list_of_all_temperature_ranges
-
-def map_ph_tourist_area_names_to_temperature_ranges(
-    ph_tourist_area_names_with_weather_dates: dict[str, dict],
-    list_of_all_temperature_ranges: list[list]
-) -> dict[str, dict]:
-    """
-    Map selected Philippine tourist area names to their corresponding
-    temperature ranges to get their weather outlooks
-    from the PAGASA-DOST website.
-
-    :param ph_tourist_area_names_with_weather_dates: Selected Philippine
-        tourist area names with weather dates
-    :type ph_tourist_area_names_with_weather_dates: dict[str, dict]
-    
-    :param list_of_all_temperature_ranges: List of all temperature ranges
-        for selected Philippine tourist areas
-    :type list_of_all_temperature_ranges: list[list]
-
-    :return: Weather outlook for selected Philippine tourist areas
-    :rtype: dict[str, dict]
-    """
-    result = ph_tourist_area_names_with_weather_dates
-
-    list_of_all_ph_tourist_area_names = list(ph_tourist_area_names_with_weather_dates.keys())
-
-    if ph_tourist_area_names_with_weather_dates == {} or list_of_all_temperature_ranges == []:
-        return result
-
-    # Map temperature ranges to cities in sequential order (1-to-1 mapping)
-    # Map temperature ranges to tourist areas in sequential order (1-to-1 mapping)
-    # The ingested temperature ranges maintain the same order as the tourist area names in the HTML structure
-    for temperature_ranges in list_of_all_temperature_ranges:
-        for ph_tourist_area_name in list_of_all_ph_tourist_area_names:
-            # Map selected Philippine tourist area name to it's corresponding temperature ranges if its missing
-            if 'temperature_range' in result[ph_tourist_area_name]:
-                continue
-
-            else:
-                result[ph_tourist_area_name]['temperature_range'] = temperature_ranges
-                break
+        result[ph_tourist_area_name] = {
+            'weather_date': list_of_all_weather_dates,
+            'temperature_range': temperature_ranges
+        }
 
     return result
 
@@ -486,8 +419,15 @@ def save_ingested_weather_outlook_for_ph_tourist_areas(
     """
     ingested_data = weather_outlook_for_ph_tourist_areas
 
-    with open(
+    save_ingested_json(
+        ingested_data,
         'data/raw/weather_outlooks_for_ph_tourist_areas/weather_outlook_for_ph_tourist_areas.json',
-        'w'
-    ) as json_file:
-        json.dump(ingested_data, json_file, indent=4)
\ No newline at end of file
+        shared_weather_dates=True
+    )
+
+    # Save a tidy table of one row per tourist area per weather date next to the JSON artifact
+    if is_parquet_output_enabled():
+        save_ingested_parquet(
+            build_weather_outlook_columns(ingested_data, 'tourist_area'),
+            'data/raw/weather_outlooks_for_ph_tourist_areas/weather_outlook_for_ph_tourist_areas.parquet'
+        )
\ No newline at end of file
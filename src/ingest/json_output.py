@@ -0,0 +1,173 @@
+"""
+Output modes of the JSON artifacts saved by the ingest workflows.
+
+This module contains the function used by the `save_ingested_*`
+functions to write the ingested artifacts under `data/raw/`, in one
+of two output modes:
+
+- `pretty` - The ingested text is saved as extracted from the page and
+    indented by 4 spaces (default)
+- `compact` - The whitespace of every ingested string (including the
+    newlines, indentation and non-breaking spaces around city names and
+    weather dates) is collapsed, the artifact is saved without
+    indentation, and the weather outlooks save their weather dates once
+    in a shared header instead of once per city or tourist area
+
+The readers of `etl.extract.raw_artifacts` accept both layouts. Every
+saved artifact is also archived by `ingest.raw_archive`.
+
+Configuration (environment variables):
+- `PAGASA_JSON_OUTPUT` - `pretty` (default) or `compact`
+
+Main functions:
+- `normalize_whitespace()` - Collapse the whitespace of a string
+- `build_shared_weather_date_layout()` - Share the weather dates of
+    weather outlooks
+- `save_ingested_json()` - Save an ingested artifact
+"""
+import os
+import json
+from ingest.raw_archive import archive_raw_artifact
+from logs.instrumentation import instrument
+
+JSON_OUTPUT_MODES = ('pretty', 'compact')
+
+def get_json_output_mode(
+) -> str:
+    """
+    Get the output mode configured by `PAGASA_JSON_OUTPUT`.
+
+    :return: `pretty` or `compact`
+    :rtype: str
+    """
+    json_output_mode = os.getenv('PAGASA_JSON_OUTPUT', 'pretty')
+
+    if json_output_mode not in JSON_OUTPUT_MODES:
+        raise ValueError(
+            f'Unknown JSON output mode {json_output_mode!r}, expected one of {list(JSON_OUTPUT_MODES)}'
+        )
+
+    return json_output_mode
+
+def normalize_whitespace(
+        ingested_data: object
+) -> object:
+    """
+    Collapse the whitespace of every string of ingested data,
+    including the keys of dictionaries.
+
+    :param ingested_data: Ingested data (strings, lists and
+        dictionaries)
+    :type ingested_data: object
+
+    :return: Ingested data with normalized whitespace
+    :rtype: object
+    """
+    if isinstance(ingested_data, str):
+        return ' '.join(ingested_data.split())
+
+    if isinstance(ingested_data, list):
+        return [normalize_whitespace(value) for value in ingested_data]
+
+    if isinstance(ingested_data, dict):
+        normalized_data = {}
+
+        for key, value in ingested_data.items():
+            normalized_data[normalize_whitespace(key)] = normalize_whitespace(value)
+
+        return normalized_data
+
+    return ingested_data
+
+def build_shared_weather_date_layout(
+        weather_outlooks: dict[str, dict]
+) -> dict[str, object]:
+    """
+    Move the weather dates shared by every city or tourist area
+    of weather outlooks into a header.
+
+    :param weather_outlooks: Dictionary containing city or tourist
+        area names and corresponding weather outlooks
+    :type weather_outlooks: dict[str, dict]
+
+    :return: Dictionary containing the shared `weather_date` header
+        and the `weather_outlooks` without weather dates, or the
+        weather outlooks unchanged if their weather dates differ
+    :rtype: dict[str, object]
+    """
+    list_of_all_weather_dates = []
+
+    for weather_outlook in weather_outlooks.values():
+        weather_dates = weather_outlook.get('weather_date')
+
+        if weather_dates not in list_of_all_weather_dates:
+            list_of_all_weather_dates.append(
+                weather_dates
+            )
+
+    if len(list_of_all_weather_dates) != 1 or list_of_all_weather_dates[0] is None:
+        return weather_outlooks
+
+    weather_outlooks_without_weather_dates = {}
+
+    for name, weather_outlook in weather_outlooks.items():
+        weather_outlook_without_weather_dates = {}
+
+        for key, value in weather_outlook.items():
+            if key != 'weather_date':
+                weather_outlook_without_weather_dates[key] = value
+
+        weather_outlooks_without_weather_dates[name] = weather_outlook_without_weather_dates
+
+    return {
+        'weather_date': list_of_all_weather_dates[0],
+        'weather_outlooks': weather_outlooks_without_weather_dates
+    }
+
+def save_ingested_json(
+        ingested_data: object,
+        json_filepath: str,
+        shared_weather_dates: bool = False
+) -> None:
+    """
+    Save an ingested artifact in the configured output mode.
+
+    :param ingested_data: Ingested data (strings, lists and
+        dictionaries)
+    :type ingested_data: object
+
+    :param json_filepath: Filepath of the JSON artifact
+    :type json_filepath: str
+
+    :param shared_weather_dates: Save the weather dates of weather
+        outlooks once in a header in `compact` mode
+    :type shared_weather_dates: bool
+    """
+    if get_json_output_mode() == 'pretty':
+        content = json.dumps(ingested_data, indent=4)
+
+    else:
+        ingested_data = normalize_whitespace(
+            ingested_data
+        )
+
+        if shared_weather_dates:
+            ingested_data = build_shared_weather_date_layout(
+                ingested_data
+            )
+
+        content = json.dumps(ingested_data, ensure_ascii=False, separators=(',', ':'))
+
+    content = content.encode('utf-8')
+
+    with instrument('save_ingested_json', {'artifact': json_filepath}) as measurement:
+        with open(json_filepath, 'wb') as json_file:
+            json_file.write(content)
+
+        measurement['bytes_written'] = len(content)
+
+        # Keep the history of the artifact, the flat file is only its latest version
+        archive_raw_artifact(
+            json_filepath,
+            content
+        )
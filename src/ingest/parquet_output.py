@@ -0,0 +1,173 @@
+"""
+Optional columnar Parquet snapshots of the ingested artifacts.
+
+This module contains the functions used by the `save_ingested_*`
+functions to write, next to a JSON artifact, a tidy columnar table of
+the same data as a Parquet file, e.g. one row per city per weather date
+for the weather outlooks, or one row per place for the forecast
+weather conditions. Every string is whitespace-normalized, and the
+extract stages can memory-map the tables instead of re-parsing and
+reshaping the nested JSON. Every snapshot is also archived by
+`ingest.raw_archive`.
+
+The `pyarrow` package is optional and only imported when the Parquet
+output is enabled.
+
+Configuration (environment variables):
+- `PAGASA_PARQUET_OUTPUT` - Set to `1` to write the Parquet snapshots
+    (default: 0)
+
+Main functions:
+- `build_weather_outlook_columns()` - Tidy the weather outlooks
+- `build_place_columns()` - Tidy the conditions per place
+- `save_ingested_parquet()` - Save a tidy table as a Parquet file
+"""
+import os
+from ingest.json_output import normalize_whitespace
+from ingest.raw_archive import archive_raw_artifact
+from logs.instrumentation import instrument
+
+def is_parquet_output_enabled(
+) -> bool:
+    """
+    Check if the Parquet snapshots are enabled.
+
+    :return: True if the Parquet snapshots are enabled, otherwise False
+    :rtype: bool
+    """
+    return os.getenv('PAGASA_PARQUET_OUTPUT', '0') == '1'
+
+def build_weather_outlook_columns(
+        weather_outlooks: dict[str, dict],
+        name_column: str
+) -> dict[str, list]:
+    """
+    Tidy weather outlooks into one row per city or tourist area
+    per weather date.
+
+    :param weather_outlooks: Dictionary containing city or tourist
+        area names and corresponding weather outlooks
+    :type weather_outlooks: dict[str, dict]
+
+    :param name_column: Name of the column of the city or tourist
+        area names (e.g. `city`)
+    :type name_column: str
+
+    :return: Dictionary containing column names and corresponding
+        values, with a `chance_of_rain_percentage` column only if the
+        weather outlooks have chance of rain percentages
+    :rtype: dict[str, list]
+    """
+    has_chance_of_rain_percentages = False
+
+    for weather_outlook in weather_outlooks.values():
+        if 'chance_of_rain_percentage' in weather_outlook:
+            has_chance_of_rain_percentages = True
+
+    columns = {
+        name_column: [],
+        'weather_date': [],
+        'minimum_temperature': [],
+        'maximum_temperature': []
+    }
+
+    if has_chance_of_rain_percentages:
+        columns['chance_of_rain_percentage'] = []
+
+    for name, weather_outlook in weather_outlooks.items():
+        weather_dates = weather_outlook.get('weather_date', [])
+        temperature_ranges = weather_outlook.get('temperature_range', [])
+        chance_of_rain_percentages = weather_outlook.get('chance_of_rain_percentage', [])
+
+        for index, weather_date in enumerate(weather_dates):
+            minimum_temperature = None
+            maximum_temperature = None
+
+            if index < len(temperature_ranges) and len(temperature_ranges[index]) == 2:
+                minimum_temperature, maximum_temperature = temperature_ranges[index]
+
+            columns[name_column].append(name)
+            columns['weather_date'].append(weather_date)
+            columns['minimum_temperature'].append(minimum_temperature)
+            columns['maximum_temperature'].append(maximum_temperature)
+
+            if has_chance_of_rain_percentages:
+                chance_of_rain_percentage = None
+
+                if index < len(chance_of_rain_percentages):
+                    chance_of_rain_percentage = chance_of_rain_percentages[index]
+
+                columns['chance_of_rain_percentage'].append(
+                    chance_of_rain_percentage
+                )
+
+    return normalize_whitespace(
+        columns
+    )
+
+def build_place_columns(
+        conditions: dict[str, list]
+) -> dict[str, list]:
+    """
+    Tidy conditions ingested as lists per field (e.g. `place`,
+    `weather_condition`) into one row per place.
+
+    :param conditions: Dictionary containing field names and
+        corresponding values per place
+    :type conditions: dict[str, list]
+
+    :return: Dictionary containing column names and corresponding
+        values
+    :rtype: dict[str, list]
+    """
+    number_of_places = len(conditions.get('place', []))
+    columns = {}
+
+    for field, values in conditions.items():
+        if len(values) != number_of_places:
+            raise ValueError(
+                f'Expected {number_of_places} values of {field!r}, got {len(values)}'
+            )
+
+        columns[field] = values
+
+    return normalize_whitespace(
+        columns
+    )
+
+def save_ingested_parquet(
+        columns: dict[str, list],
+        parquet_filepath: str
+) -> None:
+    """
+    Save a tidy table as a Parquet file.
+
+    :param columns: Dictionary containing column names and
+        corresponding values
+    :type columns: dict[str, list]
+
+    :param parquet_filepath: Filepath of the Parquet file
+    :type parquet_filepath: str
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    with instrument('save_ingested_parquet', {'artifact': parquet_filepath}) as measurement:
+        table = pa.table(
+            columns
+        )
+        pq.write_table(
+            table,
+            parquet_filepath
+        )
+
+        with open(parquet_filepath, 'rb') as parquet_file:
+            content = parquet_file.read()
+
+        measurement['bytes_written'] = len(content)
+        measurement['rows'] = table.num_rows
+
+        archive_raw_artifact(
+            parquet_filepath,
+            content
+        )
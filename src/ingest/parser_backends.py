@@ -0,0 +1,160 @@
+"""
+Selectable HTML parser backends for the ingest workflows.
+
+This module contains the function used by the ingest modules to build
+the BeautifulSoup object of a fetched page with the parser backend
+chosen by configuration, so the `ingest_*` functions work unchanged on
+every backend.
+
+Parser backends:
+- `html.parser` - Python's built-in HTML parser (default)
+- `lxml` - The C-based lxml HTML parser
+
+The ingest modules can restrict parsing to the subtree of the page they
+ingest from with a `SoupStrainer`, which skips building the site chrome,
+navigation and scripts. When the restricted parse finds nothing, e.g.
+after a layout change of the website, the whole page is parsed instead.
+
+Configuration (environment variables):
+- `PAGASA_PARSER_BACKEND` - Parser backend to use (default: html.parser)
+- `PAGASA_RESTRICTED_PARSE` - Set to `0` to always parse the whole page
+    (default: 1)
+
+Main functions:
+- `build_soup()` - Build a BeautifulSoup object with a parser backend
+- `build_restricted_soup()` - Build a BeautifulSoup object of a subtree
+"""
+import os
+from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
+from logs.instrumentation import instrument
+
+PARSER_BACKENDS = ('html.parser', 'lxml')
+
+def get_parser_backend(
+) -> str:
+    """
+    Get the parser backend chosen by configuration.
+
+    :return: Name of the parser backend
+    :rtype: str
+    """
+    parser_backend = os.getenv('PAGASA_PARSER_BACKEND', 'html.parser')
+
+    if parser_backend not in PARSER_BACKENDS:
+        raise ValueError(
+            f'Unknown parser backend {parser_backend!r}, expected one of {PARSER_BACKENDS}'
+        )
+
+    return parser_backend
+
+def is_restricted_parse_enabled(
+) -> bool:
+    """
+    Check if restricted parsing is enabled.
+
+    :return: True if restricted parsing is enabled, otherwise False
+    :rtype: bool
+    """
+    return os.getenv('PAGASA_RESTRICTED_PARSE', '1') != '0'
+
+def build_soup(
+        html: str,
+        parser_backend: str | None = None,
+        parse_only: SoupStrainer | None = None
+) -> BeautifulSoup:
+    """
+    Build a BeautifulSoup object from the HTML of a page
+    with a parser backend.
+
+    :param html: HTML of the page
+    :type html: str
+
+    :param parser_backend: Name of the parser backend, or NoneType
+        to use the parser backend chosen by configuration
+    :type parser_backend: str | None
+
+    :param parse_only: Strainer of the tags to parse, or NoneType
+        to parse the whole page
+    :type parse_only: SoupStrainer | None
+
+    :return: A BeautifulSoup object representing the parsed HTML
+        of the page
+    :rtype: BeautifulSoup
+    """
+    if parser_backend is None:
+        parser_backend = get_parser_backend()
+
+    with instrument('build_soup', {'parser_backend': parser_backend}):
+        return build_soup_with_parser_backend(
+            html,
+            parser_backend,
+            parse_only
+        )
+
+def build_soup_with_parser_backend(
+        html: str,
+        parser_backend: str,
+        parse_only: SoupStrainer | None = None
+) -> BeautifulSoup:
+    """
+    Build a BeautifulSoup object from the HTML of a page
+    with a given parser backend.
+
+    :param html: HTML of the page
+    :type html: str
+
+    :param parser_backend: Name of the parser backend
+    :type parser_backend: str
+
+    :param parse_only: Strainer of the tags to parse, or NoneType
+        to parse the whole page
+    :type parse_only: SoupStrainer | None
+
+    :return: A BeautifulSoup object representing the parsed HTML
+        of the page
+    :rtype: BeautifulSoup
+    """
+    if parser_backend == 'html.parser':
+        return BeautifulSoup(html, 'html.parser', parse_only=parse_only)
+
+    if parser_backend == 'lxml':
+        return BeautifulSoup(html, 'lxml', parse_only=parse_only)
+
+    raise ValueError(
+        f'Unknown parser backend {parser_backend!r}, expected one of {PARSER_BACKENDS}'
+    )
+
+def build_restricted_soup(
+        html: str,
+        parse_only: SoupStrainer,
+        parser_backend: str | None = None
+) -> BeautifulSoup:
+    """
+    Build a BeautifulSoup object of only the tags matched by a
+    strainer, falling back to the whole page when the restricted
+    parse finds nothing or restricted parsing is disabled.
+
+    :param html: HTML of the page
+    :type html: str
+
+    :param parse_only: Strainer of the tags to parse
+    :type parse_only: SoupStrainer
+
+    :param parser_backend: Name of the parser backend, or NoneType
+        to use the parser backend chosen by configuration
+    :type parser_backend: str | None
+
+    :return: A BeautifulSoup object representing the parsed HTML
+        of the matched tags, or of the whole page
+    :rtype: BeautifulSoup
+    """
+    if not is_restricted_parse_enabled():
+        return build_soup(html, parser_backend)
+
+    soup = build_soup(html, parser_backend, parse_only)
+
+    if soup.find() is None:
+        soup = build_soup(html, parser_backend)
+
+    return soup
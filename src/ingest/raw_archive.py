@@ -0,0 +1,401 @@
+"""
+Time-partitioned archive of the raw artifacts of the ingest workflows.
+
+This module keeps the history of every raw artifact saved under
+`data/raw/<page>/` instead of losing it when the flat artifact is
+overwritten by the next ingest. The flat artifacts stay the latest
+version read by the extract stages, and every new version is archived
+as follows:
+
+- `objects/<sha256>.<ext>` - The artifact stored once by the SHA-256
+    hash of its content, so identical snapshots are never stored twice
+- `dt=YYYY-MM-DD/hh=HH/index.json` - Index of the snapshots archived
+    during the hour (UTC) of the partition
+- `latest.json` - Pointer to the latest snapshot of every artifact
+
+A snapshot identical to the latest snapshot of the same artifact is
+not indexed again, so the archive only grows when the page changes.
+The indexes and the latest pointer are updated under an exclusive file
+lock of the page (where `fcntl` is available) and replaced atomically,
+so concurrent ingests never lose each other's snapshots. The archive
+is read back by `pipeline.archive_replay` to replay the snapshots of a
+time range into the SILVER tables: the listed index entries carry the
+filepath of their object, which is a raw artifact readable by the
+extract modules.
+
+Configuration (environment variables):
+- `PAGASA_RAW_ARCHIVE` - Set to `0` to disable the archive (default: 1)
+
+Main functions:
+- `archive_raw_artifact()` - Archive a snapshot of a raw artifact
+- `load_latest_pointer()` - Load the latest snapshots of a page
+- `list_archived_snapshots()` - List the snapshots of a time range
+- `find_archived_snapshot_before()` - Find the snapshot of an artifact
+    current at a time
+"""
+import os
+import glob
+import json
+import hashlib
+import tempfile
+import datetime
+
+try:
+    import fcntl
+
+except ImportError: # fcntl is not available on Windows
+    fcntl = None
+
+def is_raw_archive_enabled(
+) -> bool:
+    """
+    Check if the raw archive is enabled.
+
+    :return: True if the raw archive is enabled, otherwise False
+    :rtype: bool
+    """
+    return os.getenv('PAGASA_RAW_ARCHIVE', '1') != '0'
+
+def get_partition_dir(
+        page_dir: str,
+        archived_at: datetime.datetime
+) -> str:
+    """
+    Get the directory of the partition of a snapshot.
+
+    :param page_dir: Directory of the raw artifacts of the page
+        (e.g. `data/raw/daily_weather_forecasts`)
+    :type page_dir: str
+
+    :param archived_at: Time (UTC) the snapshot was archived
+    :type archived_at: datetime.datetime
+
+    :return: Directory of the partition of the snapshot
+    :rtype: str
+    """
+    return os.path.join(
+        page_dir,
+        'dt=' + archived_at.strftime('%Y-%m-%d'),
+        'hh=' + archived_at.strftime('%H')
+    )
+
+def write_file_atomically(
+        filepath: str,
+        content: bytes
+) -> None:
+    """
+    Write a file through a unique temporary file in the same
+    directory, replacing the previous file atomically.
+
+    :param filepath: Filepath of the file
+    :type filepath: str
+
+    :param content: Content of the file
+    :type content: bytes
+    """
+    file_descriptor, temporary_filepath = tempfile.mkstemp(
+        dir=os.path.dirname(filepath),
+        prefix=os.path.basename(filepath) + '.',
+        suffix='.tmp'
+    )
+
+    try:
+        with os.fdopen(file_descriptor, 'wb') as temporary_file:
+            temporary_file.write(content)
+
+        os.replace(
+            temporary_filepath,
+            filepath
+        )
+
+    except BaseException:
+        os.remove(temporary_filepath)
+        raise
+
+def load_json(
+        json_filepath: str,
+        default: object
+) -> object:
+    """
+    Load a JSON file of the archive.
+
+    :param json_filepath: Filepath of the JSON file
+    :type json_filepath: str
+
+    :param default: Data to return if the JSON file does not exist
+    :type default: object
+
+    :return: Data of the JSON file, or the default
+    :rtype: object
+    """
+    if not os.path.exists(json_filepath):
+        return default
+
+    with open(json_filepath, 'r') as json_file:
+        return json.load(json_file)
+
+def load_latest_pointer(
+        page_dir: str
+) -> dict[str, dict]:
+    """
+    Load the pointer to the latest snapshots of a page.
+
+    :param page_dir: Directory of the raw artifacts of the page
+        (e.g. `data/raw/daily_weather_forecasts`)
+    :type page_dir: str
+
+    :return: Dictionary containing artifact filenames and
+        corresponding index entries of their latest snapshots
+    :rtype: dict[str, dict]
+    """
+    return load_json(
+        os.path.join(page_dir, 'latest.json'),
+        {}
+    )
+
+def archive_raw_artifact(
+        raw_artifact_filepath: str,
+        content: bytes,
+        archived_at: datetime.datetime | None = None
+) -> dict | None:
+    """
+    Archive a snapshot of a raw artifact, unless it is identical to
+    the latest snapshot of the artifact.
+
+    :param raw_artifact_filepath: Filepath of the flat raw artifact
+        (e.g. `data/raw/daily_weather_forecasts/synopsis.json`)
+    :type raw_artifact_filepath: str
+
+    :param content: Content of the raw artifact
+    :type content: bytes
+
+    :param archived_at: Time (UTC) of the snapshot, or NoneType
+        to use the current time
+    :type archived_at: datetime.datetime | None
+
+    :return: Index entry of the archived snapshot, or NoneType if the
+        archive is disabled or the snapshot is unchanged
+    :rtype: dict | None
+    """
+    if not is_raw_archive_enabled():
+        return None
+
+    if archived_at is None:
+        archived_at = datetime.datetime.now(datetime.timezone.utc)
+
+    page_dir = os.path.dirname(raw_artifact_filepath)
+    filename = os.path.basename(raw_artifact_filepath)
+    content_sha256 = hashlib.sha256(content).hexdigest()
+    latest_pointer_filepath = os.path.join(page_dir, 'latest.json')
+
+    # Hold the lock of the page across the read-modify-write of its indexes
+    with open(os.path.join(page_dir, '.archive.lock'), 'a') as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+
+        latest_pointer = load_latest_pointer(
+            page_dir
+        )
+
+        if latest_pointer.get(filename, {}).get('sha256') == content_sha256:
+            return None
+
+        # Store the content once by its hash, whichever partitions index it
+        extension = os.path.splitext(filename)[1]
+        object_filepath = os.path.join('objects', content_sha256 + extension)
+
+        if not os.path.exists(os.path.join(page_dir, object_filepath)):
+            os.makedirs(os.path.join(page_dir, 'objects'), exist_ok=True)
+            write_file_atomically(
+                os.path.join(page_dir, object_filepath),
+                content
+            )
+
+        partition_dir = get_partition_dir(
+            page_dir,
+            archived_at
+        )
+        os.makedirs(partition_dir, exist_ok=True)
+        index_filepath = os.path.join(partition_dir, 'index.json')
+        index = load_json(
+            index_filepath,
+            []
+        )
+
+        index_entry = {
+            'filename': filename,
+            'sha256': content_sha256,
+            'object': object_filepath,
+            'size_bytes': len(content),
+            'archived_at': archived_at.isoformat()
+        }
+        index.append(
+            index_entry
+        )
+        write_file_atomically(
+            index_filepath,
+            json.dumps(index, indent=4).encode('utf-8')
+        )
+
+        latest_pointer[filename] = dict(
+            index_entry,
+            partition=os.path.relpath(partition_dir, page_dir)
+        )
+        write_file_atomically(
+            latest_pointer_filepath,
+            json.dumps(latest_pointer, indent=4).encode('utf-8')
+        )
+
+    return index_entry
+
+def list_partitions(
+        page_dir: str
+) -> list[tuple[datetime.datetime, str]]:
+    """
+    List the partitions of the archive of a page in chronological
+    order.
+
+    :param page_dir: Directory of the raw artifacts of the page
+    :type page_dir: str
+
+    :return: Start times (UTC) and corresponding index filepaths
+        of the partitions
+    :rtype: list[tuple[datetime.datetime, str]]
+    """
+    partitions = []
+
+    for index_filepath in glob.glob(os.path.join(page_dir, 'dt=*', 'hh=*', 'index.json')):
+        partition_dir = os.path.dirname(index_filepath)
+        date_partition = os.path.basename(os.path.dirname(partition_dir))[len('dt='):]
+        hour_partition = os.path.basename(partition_dir)[len('hh='):]
+        partition_start = datetime.datetime.strptime(
+            date_partition + ' ' + hour_partition,
+            '%Y-%m-%d %H'
+        ).replace(tzinfo=datetime.timezone.utc)
+        partitions.append(
+            (partition_start, index_filepath)
+        )
+
+    return sorted(partitions)
+
+def load_partition_index(
+        page_dir: str,
+        index_filepath: str
+) -> list[dict]:
+    """
+    Load the index of a partition in chronological order, with the
+    `object` filepath of every entry relative to the working directory.
+
+    :param page_dir: Directory of the raw artifacts of the page
+    :type page_dir: str
+
+    :param index_filepath: Filepath of the index of the partition
+    :type index_filepath: str
+
+    :return: Index entries of the partition
+    :rtype: list[dict]
+    """
+    index_entries = []
+
+    for index_entry in load_json(index_filepath, []):
+        index_entries.append(
+            dict(
+                index_entry,
+                object=os.path.join(page_dir, index_entry['object'])
+            )
+        )
+
+    return sorted(index_entries, key=lambda index_entry: index_entry['archived_at'])
+
+def list_archived_snapshots(
+        page_dir: str,
+        start: datetime.datetime | None = None,
+        end: datetime.datetime | None = None,
+        filename: str | None = None
+) -> list[dict]:
+    """
+    List the archived snapshots of a page in chronological order,
+    reading only the indexes of the partitions of the time range.
+
+    :param page_dir: Directory of the raw artifacts of the page
+    :type page_dir: str
+
+    :param start: Earliest time (UTC) of the snapshots, or NoneType
+        for no lower bound
+    :type start: datetime.datetime | None
+
+    :param end: Latest time (UTC) of the snapshots (exclusive), or
+        NoneType for no upper bound
+    :type end: datetime.datetime | None
+
+    :param filename: Filename of the artifact to list (e.g.
+        `synopsis.json`), or NoneType to list every artifact
+    :type filename: str | None
+
+    :return: Index entries of the snapshots, with the `object`
+        filepath relative to the working directory
+    :rtype: list[dict]
+    """
+    archived_snapshots = []
+
+    for partition_start, index_filepath in list_partitions(page_dir):
+        # Skip the partitions outside of the time range without reading their index
+        if start is not None and partition_start + datetime.timedelta(hours=1) <= start:
+            continue
+
+        if end is not None and partition_start >= end:
+            break
+
+        for index_entry in load_partition_index(page_dir, index_filepath):
+            archived_at = datetime.datetime.fromisoformat(index_entry['archived_at'])
+
+            if start is not None and archived_at < start:
+                continue
+
+            if end is not None and archived_at >= end:
+                continue
+
+            if filename is not None and index_entry['filename'] != filename:
+                continue
+
+            archived_snapshots.append(
+                index_entry
+            )
+
+    return archived_snapshots
+
+def find_archived_snapshot_before(
+        page_dir: str,
+        filename: str,
+        before: datetime.datetime
+) -> dict | None:
+    """
+    Find the latest snapshot of an artifact archived before a time,
+    i.e. the version of the artifact current at that time, reading the
+    indexes of the partitions from the time backwards.
+
+    :param page_dir: Directory of the raw artifacts of the page
+    :type page_dir: str
+
+    :param filename: Filename of the artifact (e.g. `synopsis.json`)
+    :type filename: str
+
+    :param before: Time (UTC) the snapshot was current at (exclusive)
+    :type before: datetime.datetime
+
+    :return: Index entry of the snapshot, or NoneType if the artifact
+        was not archived before the time
+    :rtype: dict | None
+    """
+    for partition_start, index_filepath in reversed(list_partitions(page_dir)):
+        if partition_start >= before:
+            continue
+
+        for index_entry in reversed(load_partition_index(page_dir, index_filepath)):
+            if index_entry['filename'] != filename:
+                continue
+
+            if datetime.datetime.fromisoformat(index_entry['archived_at']) < before:
+                return index_entry
+
+    return None
@@ -1 +1,2 @@
-from . import logs
\ No newline at end of file
+from . import logs
+from . import instrumentation
\ No newline at end of file
@@ -0,0 +1,421 @@
+"""
+Structured instrumentation of the ETL pipeline.
+
+This module records a measurement of every instrumented block of the
+ETL pipeline (the stages and the hot functions underneath them, e.g.
+the HTTP fetch, the parse, the JSON save, the warehouse connection and
+the warehouse write), in addition to the free-text messages of
+`logs.logs`. A measurement contains:
+
+- `wall_seconds` - Elapsed wall-clock time
+- `cpu_seconds` - CPU time of the thread running the block
+- `process_peak_rss_bytes` - High-water mark of the resident set size
+    of the whole process when the block finished, not of the block alone
+- `bytes_fetched`, `bytes_written` and `rows` - Counters set by the
+    instrumented block
+- `status` - `ok`, or `error` if the block raised
+
+Every measurement is appended as a JSON line to the metrics file as
+soon as its block finishes, tagged with the run id shared by every
+thread and process of a pipeline run, and the metrics file is rotated
+like the logs file of `logs.logs`. The measurements are also collected
+in memory, and the calls run in worker processes hand theirs back with
+their result through `run_collecting_measurements()`, so at the end of
+a run the measurements of the run are summed per name into a Prometheus
+text file for the textfile collector of the node exporter without
+reading the metrics file back.
+
+Configuration (environment variables):
+- `PAGASA_INSTRUMENTATION` - Set to `0` to disable the instrumentation
+    (default: 1)
+- `PAGASA_METRICS_FILEPATH` - JSON lines file of the measurements
+    (default: data/metrics/metrics.jsonl)
+- `PAGASA_METRICS_MAX_BYTES` - Size limit of the metrics file in bytes
+    (default: 5242880), rotated segments are compressed unless
+    `PAGASA_LOGS_GZIP` is `0`
+- `PAGASA_PROMETHEUS_FILEPATH` - Prometheus text file of the last run
+    (default: data/metrics/pagasa.prom)
+- `PAGASA_RUN_ID` - Id of the run (default: a random id per run)
+
+Main functions:
+- `instrument()` - Context manager measuring a block
+- `run_collecting_measurements()` - Run a call of a worker process,
+    handing back its measurements
+- `get_run_measurements()` - Get the collected measurements of a run
+- `export_prometheus_textfile()` - Export a run as a Prometheus text file
+"""
+import os
+import sys
+import json
+import time
+import uuid
+import threading
+from typing import Callable
+from typing import Iterator
+from contextlib import contextmanager
+from logs.logs import open_locked_logs_file
+from logs.logs import rotate_logs
+from logs.logs import compress_rotated_logs
+
+try:
+    import resource
+
+except ImportError: # resource is not available on Windows
+    resource = None
+
+COUNTERS = ('bytes_fetched', 'bytes_written', 'rows')
+
+# Appends of concurrent threads are serialized, processes are serialized by the file lock
+METRICS_FILE_LOCK = threading.Lock()
+
+# Measurements collected by the process, for the export at the end of the run
+RUN_MEASUREMENTS = []
+
+def is_instrumentation_enabled(
+) -> bool:
+    """
+    Check if the instrumentation is enabled.
+
+    :return: True if the instrumentation is enabled, otherwise False
+    :rtype: bool
+    """
+    return os.getenv('PAGASA_INSTRUMENTATION', '1') != '0'
+
+def get_metrics_filepath(
+) -> str:
+    """
+    Get the filepath of the JSON lines file of the measurements.
+
+    :return: Filepath of the metrics file
+    :rtype: str
+    """
+    return os.getenv('PAGASA_METRICS_FILEPATH', 'data/metrics/metrics.jsonl')
+
+def get_run_id(
+) -> str:
+    """
+    Get the id of the current pipeline run, creating it on first
+    use. The id is kept in the environment, so the worker processes
+    of a run inherit it.
+
+    :return: Id of the current run
+    :rtype: str
+    """
+    return os.environ.setdefault('PAGASA_RUN_ID', uuid.uuid4().hex)
+
+def get_process_peak_rss_bytes(
+) -> int | None:
+    """
+    Get the high-water mark of the resident set size of the
+    process since it started.
+
+    :return: Peak resident set size in bytes, or NoneType if it
+        cannot be measured on this platform
+    :rtype: int | None
+    """
+    if resource is None:
+        return None
+
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # Linux reports kilobytes, macOS reports bytes
+    if sys.platform == 'darwin':
+        return peak_rss
+
+    return peak_rss * 1024
+
+def append_measurement(
+        measurement: dict
+) -> None:
+    """
+    Append a measurement to the metrics file as a JSON line,
+    rotating the metrics file when it grows past its size limit.
+
+    :param measurement: Measurement of an instrumented block
+    :type measurement: dict
+    """
+    metrics_filepath = get_metrics_filepath()
+    metrics_dir = os.path.dirname(metrics_filepath)
+
+    if metrics_dir != '':
+        os.makedirs(metrics_dir, exist_ok=True)
+
+    max_bytes = int(os.getenv('PAGASA_METRICS_MAX_BYTES', '5242880'))
+    rotated_metrics_filepath = None
+
+    with METRICS_FILE_LOCK:
+        metrics_file = open_locked_logs_file(
+            metrics_filepath
+        )
+
+        try:
+            metrics_file.write(json.dumps(measurement) + '\n')
+            metrics_file.flush()
+
+            if metrics_file.tell() >= max_bytes:
+                rotated_metrics_filepath = rotate_logs(
+                    metrics_filepath
+                )
+
+        finally:
+            metrics_file.close() # Closing the metrics file releases the lock
+
+    if rotated_metrics_filepath is not None and os.getenv('PAGASA_LOGS_GZIP', '1') != '0':
+        compress_rotated_logs(rotated_metrics_filepath)
+
+@contextmanager
+def instrument(
+        name: str,
+        labels: dict[str, str] | None = None
+) -> Iterator[dict]:
+    """
+    Context manager measuring the wall time, CPU time and process
+    peak RSS of a block. The block sets its counters (`bytes_fetched`,
+    `bytes_written` and `rows`) on the yielded measurement.
+
+    :param name: Name of the instrumented block (e.g. `fetch_page`)
+    :type name: str
+
+    :param labels: Dictionary containing label names and
+        corresponding values of the block (e.g. the page), or NoneType
+    :type labels: dict[str, str] | None
+
+    :return: Measurement of the block
+    :rtype: Iterator[dict]
+    """
+    measurement = {
+        'name': name,
+        'labels': labels or {},
+        'bytes_fetched': 0,
+        'bytes_written': 0,
+        'rows': 0
+    }
+
+    if not is_instrumentation_enabled():
+        yield measurement
+        return
+
+    status = 'ok'
+    started_at = time.time()
+    start = time.perf_counter()
+    cpu_start = time.thread_time()
+
+    try:
+        yield measurement
+
+    except BaseException:
+        status = 'error'
+        raise
+
+    finally:
+        measurement.update({
+            'run_id': get_run_id(),
+            'pid': os.getpid(),
+            'started_at': started_at,
+            'wall_seconds': time.perf_counter() - start,
+            'cpu_seconds': time.thread_time() - cpu_start,
+            'process_peak_rss_bytes': get_process_peak_rss_bytes(),
+            'status': status
+        })
+
+        with METRICS_FILE_LOCK:
+            RUN_MEASUREMENTS.append(
+                measurement
+            )
+
+        append_measurement(
+            measurement
+        )
+
+def run_collecting_measurements(
+        function: Callable,
+        *args: object
+) -> tuple[object, list[dict], Exception | None]:
+    """
+    Run a call submitted to an executor, moving the measurements
+    recorded by the call out of the collected measurements of the
+    process running it. The caller adds them back with
+    `add_run_measurements()`, so the measurements of the calls run in
+    worker processes reach the process exporting the run.
+
+    :param function: Function to call
+    :type function: Callable
+
+    :param args: Arguments of the function
+    :type args: object
+
+    :return: Result of the call (NoneType if the call raised), its
+        measurements and the error it raised (or NoneType)
+    :rtype: tuple[object, list[dict], Exception | None]
+    """
+    first_measurement_index = len(RUN_MEASUREMENTS)
+    result = None
+    error = None
+
+    try:
+        result = function(*args)
+
+    except Exception as exception:
+        error = exception
+
+    with METRICS_FILE_LOCK:
+        measurements = RUN_MEASUREMENTS[first_measurement_index:]
+        del RUN_MEASUREMENTS[first_measurement_index:]
+
+    return result, measurements, error
+
+def add_run_measurements(
+        measurements: list[dict]
+) -> None:
+    """
+    Add the measurements handed back by `run_collecting_measurements()`
+    to the collected measurements of the process.
+
+    :param measurements: Measurements of instrumented blocks
+    :type measurements: list[dict]
+    """
+    with METRICS_FILE_LOCK:
+        RUN_MEASUREMENTS.extend(
+            measurements
+        )
+
+def get_run_measurements(
+        run_id: str | None = None
+) -> list[dict]:
+    """
+    Get the collected measurements of a pipeline run.
+
+    :param run_id: Id of the run, or NoneType for the current run
+    :type run_id: str | None
+
+    :return: Measurements of the run
+    :rtype: list[dict]
+    """
+    if run_id is None:
+        run_id = get_run_id()
+
+    measurements = []
+
+    with METRICS_FILE_LOCK:
+        for measurement in RUN_MEASUREMENTS:
+            if measurement['run_id'] == run_id:
+                measurements.append(
+                    measurement
+                )
+
+    return measurements
+
+def format_prometheus_labels(
+        labels: dict[str, str]
+) -> str:
+    """
+    Format labels as the label set of a Prometheus sample.
+
+    :param labels: Dictionary containing label names and
+        corresponding values
+    :type labels: dict[str, str]
+
+    :return: Label set (e.g. `{name="fetch_page"}`)
+    :rtype: str
+    """
+    formatted_labels = []
+
+    for label_name, label_value in sorted(labels.items()):
+        label_value = str(label_value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+        formatted_labels.append(
+            f'{label_name}="{label_value}"'
+        )
+
+    return '{' + ','.join(formatted_labels) + '}'
+
+def export_prometheus_textfile(
+        run_id: str | None = None,
+        prometheus_filepath: str | None = None
+) -> str | None:
+    """
+    Export the measurements of a pipeline run, summed per name and
+    labels, as a Prometheus text file. The file is replaced
+    atomically, so the node exporter never reads a partial file.
+
+    :param run_id: Id of the run, or NoneType for the current run
+    :type run_id: str | None
+
+    :param prometheus_filepath: Filepath of the Prometheus text file,
+        or NoneType to use `PAGASA_PROMETHEUS_FILEPATH`
+    :type prometheus_filepath: str | None
+
+    :return: Filepath of the Prometheus text file, or NoneType if
+        the instrumentation is disabled
+    :rtype: str | None
+    """
+    if not is_instrumentation_enabled():
+        return None
+
+    if prometheus_filepath is None:
+        prometheus_filepath = os.getenv('PAGASA_PROMETHEUS_FILEPATH', 'data/metrics/pagasa.prom')
+
+    samples = {}
+
+    for measurement in get_run_measurements(run_id):
+        labels = dict(measurement['labels'], name=measurement['name'])
+        key = format_prometheus_labels(labels)
+        sample = samples.setdefault(key, {
+            'calls': 0,
+            'errors': 0,
+            'wall_seconds': 0.0,
+            'cpu_seconds': 0.0,
+            'process_peak_rss_bytes': 0,
+            'bytes_fetched': 0,
+            'bytes_written': 0,
+            'rows': 0
+        })
+        sample['calls'] += 1
+        sample['wall_seconds'] += measurement['wall_seconds']
+        sample['cpu_seconds'] += measurement['cpu_seconds']
+        sample['process_peak_rss_bytes'] = max(sample['process_peak_rss_bytes'], measurement['process_peak_rss_bytes'] or 0)
+
+        if measurement['status'] == 'error':
+            sample['errors'] += 1
+
+        for counter in COUNTERS:
+            sample[counter] += measurement[counter]
+
+    metrics = {
+        'calls': 'Number of calls of the instrumented block in the last run',
+        'errors': 'Number of calls of the instrumented block that raised in the last run',
+        'wall_seconds': 'Wall-clock seconds of the instrumented block in the last run',
+        'cpu_seconds': 'CPU seconds of the instrumented block in the last run',
+        'process_peak_rss_bytes': 'High-water mark of the resident set size in bytes of the process running the block, not of the block alone',
+        'bytes_fetched': 'Bytes fetched by the instrumented block in the last run',
+        'bytes_written': 'Bytes written by the instrumented block in the last run',
+        'rows': 'Rows processed by the instrumented block in the last run'
+    }
+    lines = []
+
+    for metric, description in metrics.items():
+        lines.append(f'# HELP pagasa_{metric} {description}')
+        lines.append(f'# TYPE pagasa_{metric} gauge')
+
+        for key, sample in samples.items():
+            lines.append(f'pagasa_{metric}{key} {sample[metric]}')
+
+    lines.append('# HELP pagasa_last_run_timestamp_seconds Time the last run was exported')
+    lines.append('# TYPE pagasa_last_run_timestamp_seconds gauge')
+    lines.append(f'pagasa_last_run_timestamp_seconds {time.time()}')
+
+    prometheus_dir = os.path.dirname(prometheus_filepath)
+
+    if prometheus_dir != '':
+        os.makedirs(prometheus_dir, exist_ok=True)
+
+    temporary_filepath = prometheus_filepath + '.tmp'
+
+    with open(temporary_filepath, 'w', encoding='utf-8') as prometheus_file:
+        prometheus_file.write('\n'.join(lines) + '\n')
+
+    os.replace(
+        temporary_filepath,
+        prometheus_filepath
+    )
+
+    return prometheus_filepath
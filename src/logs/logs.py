@@ -5,6 +5,24 @@ These utilities generate log messages while processing data
 from the PAGASA-DOST website. They are intended to support
 monitoring and troubleshooting of ETL jobs.
 
+Log messages are appended to `src/logs/logs.csv` one line at a time
+under an exclusive file lock (where `fcntl` is available), so the cost
+of a log message does not grow with the log history and concurrent
+pipeline processes do not clobber each other. When the logs file grows
+past its size limit it is rotated to a timestamped segment, which is
+gzip-compressed by default.
+
+Configuration (environment variables):
+- `PAGASA_LOGS_MAX_BYTES` - Size limit of the logs file in bytes
+    (default: 5242880)
+- `PAGASA_LOGS_GZIP` - Set to `0` to keep rotated segments uncompressed
+    (default: 1)
+
+Running this module runs the ETL pipeline through the command-line
+runner of `pipeline.pipeline` (every stage when no arguments are given).
+The stages are imported lazily, so importing this module only loads the
+standard library.
+
 Main function:
 - `generate_logs()` - Generate logs for ETL pipeline jobs
 """
@@ -12,15 +30,87 @@ import sys
 import os
 sys.path.insert(0, os.path.abspath('src'))
 
-import pandas as pd
+import csv
+import gzip
+import shutil
+from typing import TextIO
 from datetime import datetime
 
-from executor.ingest.execute_ingest_daily_weather_forecast import ingest_daily_weather_forecast
-from executor.ingest.execute_ingest_weather_outlook_for_ph_cities import ingest_weather_outlook_for_ph_cities
-from executor.ingest.execute_ingest_weather_outlook_for_ph_tourist_areas import ingest_weather_outlook_for_ph_tourist_areas
-from executor.ingest.execute_ingest_weather_advisory import ingest_weather_advisory
+try:
+    import fcntl
+
+except ImportError: # fcntl is not available on Windows
+    fcntl = None
+
+LOGS_FILEPATH = 'src/logs/logs.csv'
 
-from executor.extract.execute_extract_daily_weather_forecast import extract_daily_weather_forecast
+LOGS_COLUMNS = ['messages', 'timestamps']
+
+def open_locked_logs_file(
+        logs_filepath: str = LOGS_FILEPATH
+) -> TextIO:
+    """
+    Open a logs file for appending under an exclusive lock, which
+    is released when the file is closed.
+
+    :param logs_filepath: Filepath of the logs file
+    :type logs_filepath: str
+
+    :return: Logs file opened for appending
+    :rtype: TextIO
+    """
+    while True:
+        logs_file = open(logs_filepath, 'a', newline='', encoding='utf-8')
+
+        if fcntl is None:
+            return logs_file
+
+        fcntl.flock(logs_file, fcntl.LOCK_EX)
+
+        # Reopen the logs file if another process rotated it while waiting for the lock
+        if os.path.exists(logs_filepath) and os.path.samestat(os.fstat(logs_file.fileno()), os.stat(logs_filepath)):
+            return logs_file
+
+        logs_file.close()
+
+def rotate_logs(
+        logs_filepath: str = LOGS_FILEPATH
+) -> str:
+    """
+    Rotate a logs file to a timestamped segment. The caller
+    must hold the lock of the logs file.
+
+    :param logs_filepath: Filepath of the logs file
+    :type logs_filepath: str
+
+    :return: Filepath of the rotated segment
+    :rtype: str
+    """
+    format = '%Y%m%d%H%M%S%f' # Format: YYYYMMDDHHMMSSffffff
+    now = datetime.now()
+    root, extension = os.path.splitext(logs_filepath)
+    rotated_logs_filepath = root + '.' + now.strftime(format) + extension
+    os.replace(
+        logs_filepath,
+        rotated_logs_filepath
+    )
+
+    return rotated_logs_filepath
+
+def compress_rotated_logs(
+        rotated_logs_filepath: str
+) -> None:
+    """
+    Compress a rotated segment of the logs file with gzip.
+
+    :param rotated_logs_filepath: Filepath of the rotated segment
+    :type rotated_logs_filepath: str
+    """
+    with open(rotated_logs_filepath, 'rb') as logs_file:
+        with gzip.open(rotated_logs_filepath + '.gz', 'wb') as compressed_logs_file:
+            shutil.copyfileobj(logs_file, compressed_logs_file)
+
+    os.remove(rotated_logs_filepath)
 
 def generate_logs(
     log_message: str
@@ -36,39 +126,31 @@ def generate_logs(
     now = datetime.now()
     timestamp = now.strftime(format)
 
-    # Generate logs using pandas for logs dataset (csv format)
-    logs = pd.read_csv('src/logs/logs.csv')
-    logs = pd.concat([
-        logs,
-        pd.DataFrame({
-            'messages': [log_message],
-            'timestamps': [timestamp]
-        })
-    ], ignore_index=True)
-    logs.to_csv('src/logs/logs.csv', index=False)
+    max_bytes = int(os.getenv('PAGASA_LOGS_MAX_BYTES', '5242880'))
+    rotated_logs_filepath = None
+    logs_file = open_locked_logs_file()
 
-if __name__ == '__main__':
-    ingest_daily_weather_forecast()
-    generate_logs(
-        '(DEV): Ingest the daily weather forecast data.'
-    )
+    try:
+        writer = csv.writer(logs_file, lineterminator='\n')
 
-    ingest_weather_outlook_for_ph_cities()
-    generate_logs(
-        '(DEV): Ingest the weather outlook for selected Philippine cities data.'
-    )
+        if logs_file.tell() == 0:
+            writer.writerow(LOGS_COLUMNS)
 
-    ingest_weather_outlook_for_ph_tourist_areas()
-    generate_logs(
-        '(DEV): Ingest the weather outlook for selected Philippine tourist areas data.'
-    )
+        writer.writerow([log_message, timestamp])
+        logs_file.flush()
 
-    ingest_weather_advisory()
-    generate_logs(
-        '(DEV): Ingest the weather advisory data'
-    )
+        if logs_file.tell() >= max_bytes:
+            rotated_logs_filepath = rotate_logs()
+
+    finally:
+        logs_file.close() # Closing the logs file releases the lock
+
+    if rotated_logs_filepath is not None and os.getenv('PAGASA_LOGS_GZIP', '1') != '0':
+        compress_rotated_logs(rotated_logs_filepath)
+
+if __name__ == '__main__':
+    # Import the runner lazily so each stage only loads its own dependencies
+    from pipeline.pipeline import main
 
-    extract_daily_weather_forecast()
-    generate_logs(
-        '(DEV): Extract the daily weather forecast data.'
-    )
\ No newline at end of file
+    # Without arguments every stage runs one after another
+    sys.exit(main(sys.argv[1:] or ['run']))
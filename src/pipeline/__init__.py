@@ -0,0 +1,5 @@
+from . import stages
+from . import manifest
+from . import pipeline
+from . import backfill
+from . import profiling
\ No newline at end of file
@@ -0,0 +1,332 @@
+"""
+Replay of the raw archive into the SILVER tables.
+
+This module rebuilds the SILVER tables from the time-partitioned
+archive of `ingest.raw_archive` instead of the flat raw artifacts, so a
+range of ingested snapshots (e.g. the history of a week) is extracted
+in bulk without fetching or parsing a page again. Only the partitions
+of the time range are read. Every snapshot of a page in the range is
+cleaned by the extract module of the page, reading its archived
+objects as raw artifacts, and written through the warehouse selected by
+`PAGASA_WAREHOUSE` in chronological batches, so the merge keeps the
+rows of the latest snapshot.
+
+The artifacts of a page are archived separately and only when they
+change, so a snapshot of the daily weather forecast pairs the issued
+datetime and the synopsis current at the time either of them changed,
+starting from the versions current at the start of the range.
+
+Usage:
+    pagasa-pipeline replay-archive [--raw-dir data/raw] [--pages daily_weather_forecast,...] [--start 2026-01-28T00:00:00+00:00] [--end ...] [--batch-size 50]
+
+Main functions:
+- `list_archived_page_snapshots()` - List the snapshots of a page in a
+    time range
+- `replay_archived_snapshots()` - Replay the archive into the SILVER tables
+"""
+from __future__ import annotations
+
+import os
+import datetime
+from typing import TYPE_CHECKING
+from logs.logs import generate_logs
+from logs.instrumentation import get_run_id
+from logs.instrumentation import export_prometheus_textfile
+from ingest.raw_archive import list_archived_snapshots
+from ingest.raw_archive import find_archived_snapshot_before
+from pipeline.backfill import write_batch
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+def clean_daily_weather_forecast_objects(
+        object_filepaths: dict[str, str]
+) -> dict[str, pd.DataFrame]:
+    """
+    Clean an archived snapshot of the daily weather forecast.
+
+    :param object_filepaths: Dictionary containing artifact filenames
+        and corresponding filepaths of their archived objects
+    :type object_filepaths: dict[str, str]
+
+    :return: Dictionary containing SILVER table names and
+        corresponding cleaned DataFrames
+    :rtype: dict[str, pd.DataFrame]
+    """
+    from etl.extract.extract_daily_weather_forecast import extract_issued_datetime
+    from etl.extract.extract_daily_weather_forecast import clean_issued_datetime
+    from etl.extract.extract_daily_weather_forecast import extract_synopsis
+    from etl.extract.extract_daily_weather_forecast import clean_synopsis
+
+    issued_datetime_dataframe = clean_issued_datetime(
+        extract_issued_datetime(object_filepaths['issued_datetime.json'])
+    )
+    synopsis_dataframe = clean_synopsis(
+        extract_synopsis(object_filepaths['synopsis.json']),
+        issued_datetime_dataframe
+    )
+
+    return {
+        'ISSUED_DATETIMES': issued_datetime_dataframe,
+        'SYNOPSES': synopsis_dataframe
+    }
+
+def clean_weather_outlook_for_ph_cities_objects(
+        object_filepaths: dict[str, str]
+) -> dict[str, pd.DataFrame]:
+    """
+    Clean an archived snapshot of the weather outlook for selected
+    Philippine cities.
+
+    :param object_filepaths: Dictionary containing artifact filenames
+        and corresponding filepaths of their archived objects
+    :type object_filepaths: dict[str, str]
+
+    :return: Dictionary containing SILVER table names and
+        corresponding cleaned DataFrames
+    :rtype: dict[str, pd.DataFrame]
+    """
+    from etl.extract.extract_weather_outlook_for_ph_cities import extract_ph_city_weather_outlooks
+    from etl.extract.extract_weather_outlook_for_ph_cities import clean_ph_city_weather_outlooks
+
+    return {
+        'CITY_WEATHER_OUTLOOKS': clean_ph_city_weather_outlooks(
+            extract_ph_city_weather_outlooks(object_filepaths['weather_outlook_for_ph_cities.json'])
+        )
+    }
+
+def clean_weather_outlook_for_ph_tourist_areas_objects(
+        object_filepaths: dict[str, str]
+) -> dict[str, pd.DataFrame]:
+    """
+    Clean an archived snapshot of the weather outlook for selected
+    Philippine tourist areas.
+
+    :param object_filepaths: Dictionary containing artifact filenames
+        and corresponding filepaths of their archived objects
+    :type object_filepaths: dict[str, str]
+
+    :return: Dictionary containing SILVER table names and
+        corresponding cleaned DataFrames
+    :rtype: dict[str, pd.DataFrame]
+    """
+    from etl.extract.extract_weather_outlook_for_ph_tourist_areas import extract_ph_tourist_area_weather_outlooks
+    from etl.extract.extract_weather_outlook_for_ph_tourist_areas import clean_ph_tourist_area_weather_outlooks
+
+    return {
+        'TOURIST_AREA_WEATHER_OUTLOOKS': clean_ph_tourist_area_weather_outlooks(
+            extract_ph_tourist_area_weather_outlooks(object_filepaths['weather_outlook_for_ph_tourist_areas.json'])
+        )
+    }
+
+# Raw artifact directory, archived artifacts and cleaning of every replayed page
+ARCHIVE_PAGES = {
+    'daily_weather_forecast': {
+        'raw_dir': 'daily_weather_forecasts',
+        'filenames': ['issued_datetime.json', 'synopsis.json'],
+        'clean': clean_daily_weather_forecast_objects
+    },
+    'weather_outlook_for_ph_cities': {
+        'raw_dir': 'weather_outlooks_for_ph_cities',
+        'filenames': ['weather_outlook_for_ph_cities.json'],
+        'clean': clean_weather_outlook_for_ph_cities_objects
+    },
+    'weather_outlook_for_ph_tourist_areas': {
+        'raw_dir': 'weather_outlooks_for_ph_tourist_areas',
+        'filenames': ['weather_outlook_for_ph_tourist_areas.json'],
+        'clean': clean_weather_outlook_for_ph_tourist_areas_objects
+    }
+}
+
+def list_archived_page_snapshots(
+        page_dir: str,
+        filenames: list[str],
+        start: datetime.datetime | None = None,
+        end: datetime.datetime | None = None
+) -> list[tuple[str, dict[str, str]]]:
+    """
+    List the snapshots of a page archived in a time range, as the
+    archived objects of every artifact of the page current when one
+    of them changed.
+
+    :param page_dir: Directory of the raw artifacts of the page
+        (e.g. `data/raw/daily_weather_forecasts`)
+    :type page_dir: str
+
+    :param filenames: Filenames of the artifacts of the page
+    :type filenames: list[str]
+
+    :param start: Earliest time (UTC) of the snapshots, or NoneType
+        for no lower bound
+    :type start: datetime.datetime | None
+
+    :param end: Latest time (UTC) of the snapshots (exclusive), or
+        NoneType for no upper bound
+    :type end: datetime.datetime | None
+
+    :return: Archive times and corresponding dictionaries containing
+        artifact filenames and filepaths of their archived objects,
+        in chronological order
+    :rtype: list[tuple[str, dict[str, str]]]
+    """
+    object_filepaths = {}
+
+    # Start from the versions of the artifacts current at the start of the range
+    if start is not None:
+        for filename in filenames:
+            index_entry = find_archived_snapshot_before(
+                page_dir,
+                filename,
+                start
+            )
+
+            if index_entry is not None:
+                object_filepaths[filename] = index_entry['object']
+
+    page_snapshots = []
+
+    for index_entry in list_archived_snapshots(page_dir, start, end):
+        if index_entry['filename'] not in filenames:
+            continue
+
+        object_filepaths[index_entry['filename']] = index_entry['object']
+
+        # A snapshot needs a version of every artifact of the page
+        if len(object_filepaths) < len(filenames):
+            continue
+
+        page_snapshots.append(
+            (index_entry['archived_at'], dict(object_filepaths))
+        )
+
+    return page_snapshots
+
+def replay_archived_snapshots(
+        raw_dir: str = 'data/raw',
+        page_names: list[str] | None = None,
+        start: datetime.datetime | None = None,
+        end: datetime.datetime | None = None,
+        batch_size: int = 50,
+        load_mode: str | None = None
+) -> dict[str, object]:
+    """
+    Replay the snapshots of the raw archive of a time range into the
+    SILVER tables, writing the cleaned rows in chronological batches
+    of snapshots.
+
+    A snapshot that fails to clean is logged and skipped instead of
+    stopping the replay.
+
+    :param raw_dir: Directory of the raw artifacts of every page
+    :type raw_dir: str
+
+    :param page_names: Names of the pages to replay, or NoneType
+        to replay every page
+    :type page_names: list[str] | None
+
+    :param start: Earliest time (UTC) of the snapshots, or NoneType
+        for no lower bound
+    :type start: datetime.datetime | None
+
+    :param end: Latest time (UTC) of the snapshots (exclusive), or
+        NoneType for no upper bound
+    :type end: datetime.datetime | None
+
+    :param batch_size: Number of snapshots written per load
+    :type batch_size: int
+
+    :param load_mode: `merge` or `append`, or NoneType to use
+        `PAGASA_LOAD_MODE`
+    :type load_mode: str | None
+
+    :return: Summary of the replay containing the number of replayed
+        snapshots, the failed snapshots and corresponding errors, and
+        the number of written rows per SILVER table
+    :rtype: dict[str, object]
+    """
+    from dotenv import load_dotenv
+    from etl.extract.warehouse import get_warehouse_backend
+
+    if batch_size < 1:
+        raise ValueError(
+            f'Expected a batch size of at least 1, got {batch_size}'
+        )
+
+    if page_names is None:
+        page_names = list(ARCHIVE_PAGES.keys())
+
+    for page_name in page_names:
+        if page_name not in ARCHIVE_PAGES:
+            raise ValueError(
+                f'Unknown page {page_name!r}, expected one of {list(ARCHIVE_PAGES.keys())}'
+            )
+
+    summary = {
+        'replayed_snapshots': 0,
+        'failed_snapshots': {},
+        'row_counts': {}
+    }
+
+    # Load environment variables from .env file
+    load_dotenv()
+
+    get_run_id()
+
+    # Load the warehouse selected by `PAGASA_WAREHOUSE` (Snowflake by default)
+    warehouse = get_warehouse_backend()
+
+    with warehouse.warehouse_connection() as conn:
+        warehouse.create_tables(
+            conn
+        )
+
+        for page_name in page_names:
+            archive_page = ARCHIVE_PAGES[page_name]
+            page_snapshots = list_archived_page_snapshots(
+                os.path.join(raw_dir, archive_page['raw_dir']),
+                archive_page['filenames'],
+                start,
+                end
+            )
+            batch = {}
+            number_of_batched_snapshots = 0
+
+            for archived_at, object_filepaths in page_snapshots:
+                try:
+                    dataframes = archive_page['clean'](
+                        object_filepaths
+                    )
+
+                except Exception as error:
+                    summary['failed_snapshots'][f'{page_name}@{archived_at}'] = repr(error)
+                    generate_logs(
+                        f'(DEV): Fail to replay the {page_name} snapshot archived at {archived_at}: {error!r}'
+                    )
+                    continue
+
+                for table_name, dataframe in dataframes.items():
+                    batch.setdefault(table_name, []).append(
+                        dataframe
+                    )
+
+                summary['replayed_snapshots'] += 1
+                number_of_batched_snapshots += 1
+
+                if number_of_batched_snapshots < batch_size:
+                    continue
+
+                for table_name, row_count in write_batch(warehouse, conn, batch, load_mode).items():
+                    summary['row_counts'][table_name] = summary['row_counts'].get(table_name, 0) + row_count
+
+                batch = {}
+                number_of_batched_snapshots = 0
+
+            for table_name, row_count in write_batch(warehouse, conn, batch, load_mode).items():
+                summary['row_counts'][table_name] = summary['row_counts'].get(table_name, 0) + row_count
+
+    generate_logs(
+        f"(DEV): Replay {summary['replayed_snapshots']} archived snapshots from {raw_dir}."
+    )
+    export_prometheus_textfile()
+
+    return summary
@@ -0,0 +1,426 @@
+"""
+Backfill of the SILVER tables from saved HTML snapshots.
+
+This module rebuilds the SILVER tables from a directory of saved HTML
+snapshots of the PAGASA-DOST pages instead of the live website. The
+snapshots of every page are parsed by the `ingest_*` functions of its
+ingest module and cleaned by its extract module on a process pool, so
+every core parses a snapshot at once. The cleaned DataFrames are
+streamed back to the main process as they complete and written through
+the warehouse selected by `PAGASA_WAREHOUSE` in batches of snapshots,
+so only one batch is held in memory. Nothing is saved under `data/raw/`.
+
+The snapshots are read from one subdirectory per page, named as the
+pages of `ingest.fetch_pages` (nested subdirectories are searched too):
+
+    <snapshot_dir>/daily_weather_forecast/**/*.html
+    <snapshot_dir>/weather_outlook_for_ph_cities/**/*.html
+    <snapshot_dir>/weather_outlook_for_ph_tourist_areas/**/*.html
+
+The snapshots of a page are written in filepath order whichever worker
+finishes parsing first, so when snapshots are named by the time they
+were saved (as `benchmarks.fixture_corpus` records them), the merge
+keeps the rows of the latest snapshot.
+
+Usage:
+    pagasa-pipeline backfill SNAPSHOT_DIR [--pages daily_weather_forecast,...] [--workers 8] [--batch-size 50]
+
+Main functions:
+- `parse_snapshot()` - Parse and clean a saved HTML snapshot
+- `find_snapshots()` - Find the saved HTML snapshots of every page
+- `backfill_snapshots()` - Backfill the SILVER tables from snapshots
+"""
+from __future__ import annotations
+
+import os
+import glob
+from typing import TYPE_CHECKING
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import as_completed
+from logs.logs import generate_logs
+from logs.instrumentation import get_run_id
+from logs.instrumentation import run_collecting_measurements
+from logs.instrumentation import add_run_measurements
+from logs.instrumentation import export_prometheus_textfile
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+def parse_daily_weather_forecast_snapshot(
+        html: str
+) -> dict[str, pd.DataFrame]:
+    """
+    Parse and clean a saved snapshot of the daily weather
+    forecast page.
+
+    :param html: HTML of the snapshot
+    :type html: str
+
+    :return: Dictionary containing SILVER table names and
+        corresponding cleaned DataFrames
+    :rtype: dict[str, pd.DataFrame]
+    """
+    from ingest.ingest_daily_weather_forecast import parse_soup_from_html
+    from ingest.ingest_daily_weather_forecast import index_daily_weather_forecast_sections
+    from ingest.ingest_daily_weather_forecast import ingest_issued_datetime
+    from ingest.ingest_daily_weather_forecast import ingest_synopsis
+    from etl.extract.extract_daily_weather_forecast import clean_issued_datetime
+    from etl.extract.extract_daily_weather_forecast import clean_synopsis
+
+    soup = parse_soup_from_html(
+        html
+    )
+    sections = index_daily_weather_forecast_sections(
+        soup
+    )
+
+    issued_datetime = ingest_issued_datetime(
+        sections
+    )
+    synopsis = ingest_synopsis(
+        sections
+    )
+
+    issued_datetime_dataframe = clean_issued_datetime(
+        [{'issued_datetime': issued_datetime}]
+    )
+
+    return {
+        'ISSUED_DATETIMES': issued_datetime_dataframe,
+        'SYNOPSES': clean_synopsis([{'synopsis': synopsis}], issued_datetime_dataframe)
+    }
+
+def parse_weather_outlook_for_ph_cities_snapshot(
+        html: str
+) -> dict[str, pd.DataFrame]:
+    """
+    Parse and clean a saved snapshot of the weather outlook
+    for selected Philippine cities page.
+
+    :param html: HTML of the snapshot
+    :type html: str
+
+    :return: Dictionary containing SILVER table names and
+        corresponding cleaned DataFrames
+    :rtype: dict[str, pd.DataFrame]
+    """
+    from ingest.ingest_weather_outlook_for_ph_cities import parse_soup_from_html
+    from ingest.ingest_weather_outlook_for_ph_cities import ingest_and_parse_list_of_all_ph_city_tags
+    from ingest.ingest_weather_outlook_for_ph_cities import build_weather_outlook_for_ph_cities
+    from etl.extract.extract_weather_outlook_for_ph_cities import clean_ph_city_weather_outlooks
+
+    soup = parse_soup_from_html(
+        html
+    )
+    list_of_all_ph_city_tags = ingest_and_parse_list_of_all_ph_city_tags(
+        soup
+    )
+
+    weather_outlook_for_ph_cities = build_weather_outlook_for_ph_cities(
+        list_of_all_ph_city_tags
+    )
+
+    return {
+        'CITY_WEATHER_OUTLOOKS': clean_ph_city_weather_outlooks(weather_outlook_for_ph_cities)
+    }
+
+def parse_weather_outlook_for_ph_tourist_areas_snapshot(
+        html: str
+) -> dict[str, pd.DataFrame]:
+    """
+    Parse and clean a saved snapshot of the weather outlook
+    for selected Philippine tourist areas page.
+
+    :param html: HTML of the snapshot
+    :type html: str
+
+    :return: Dictionary containing SILVER table names and
+        corresponding cleaned DataFrames
+    :rtype: dict[str, pd.DataFrame]
+    """
+    from ingest.ingest_weather_outlook_for_ph_tourist_areas import parse_soup_from_html
+    from ingest.ingest_weather_outlook_for_ph_tourist_areas import build_weather_outlook_for_ph_tourist_areas
+    from etl.extract.extract_weather_outlook_for_ph_tourist_areas import clean_ph_tourist_area_weather_outlooks
+
+    soup = parse_soup_from_html(
+        html
+    )
+
+    weather_outlook_for_ph_tourist_areas = build_weather_outlook_for_ph_tourist_areas(
+        soup
+    )
+
+    return {
+        'TOURIST_AREA_WEATHER_OUTLOOKS': clean_ph_tourist_area_weather_outlooks(weather_outlook_for_ph_tourist_areas)
+    }
+
+BACKFILL_PAGES = {
+    'daily_weather_forecast': parse_daily_weather_forecast_snapshot,
+    'weather_outlook_for_ph_cities': parse_weather_outlook_for_ph_cities_snapshot,
+    'weather_outlook_for_ph_tourist_areas': parse_weather_outlook_for_ph_tourist_areas_snapshot
+}
+
+def parse_snapshot(
+        page_name: str,
+        snapshot_filepath: str
+) -> dict[str, pd.DataFrame]:
+    """
+    Parse and clean a saved HTML snapshot of a page, in a worker
+    process of the backfill.
+
+    :param page_name: Name of the page of the snapshot (e.g.
+        `daily_weather_forecast`)
+    :type page_name: str
+
+    :param snapshot_filepath: Filepath of the HTML snapshot
+    :type snapshot_filepath: str
+
+    :return: Dictionary containing SILVER table names and
+        corresponding cleaned DataFrames
+    :rtype: dict[str, pd.DataFrame]
+    """
+    with open(snapshot_filepath, 'r', encoding='utf-8') as html_file:
+        html = html_file.read()
+
+    return BACKFILL_PAGES[page_name](
+        html
+    )
+
+def find_snapshots(
+        snapshot_dir: str,
+        page_names: list[str] | None = None
+) -> list[tuple[str, str]]:
+    """
+    Find the saved HTML snapshots of every page in a snapshot
+    directory.
+
+    :param snapshot_dir: Directory containing a subdirectory of
+        HTML snapshots per page
+    :type snapshot_dir: str
+
+    :param page_names: Names of the pages to backfill, or NoneType
+        to backfill every page
+    :type page_names: list[str] | None
+
+    :return: Page names and corresponding snapshot filepaths, in
+        filename order per page
+    :rtype: list[tuple[str, str]]
+    """
+    if page_names is None:
+        page_names = list(BACKFILL_PAGES.keys())
+
+    snapshots = []
+
+    for page_name in page_names:
+        if page_name not in BACKFILL_PAGES:
+            raise ValueError(
+                f'Unknown page {page_name!r}, expected one of {list(BACKFILL_PAGES.keys())}'
+            )
+
+        snapshot_filepaths = glob.glob(
+            os.path.join(snapshot_dir, page_name, '**', '*.html'),
+            recursive=True
+        )
+
+        for snapshot_filepath in sorted(snapshot_filepaths):
+            snapshots.append(
+                (page_name, snapshot_filepath)
+            )
+
+    return snapshots
+
+def write_batch(
+        warehouse: object,
+        conn: object,
+        batch: dict[str, list],
+        load_mode: str | None = None
+) -> dict[str, int]:
+    """
+    Write a batch of cleaned DataFrames through the warehouse,
+    concatenating the DataFrames of every table into one load.
+
+    :param warehouse: Warehouse backend of `etl.extract.warehouse`
+    :type warehouse: object
+
+    :param conn: Connection of the warehouse backend
+    :type conn: object
+
+    :param batch: Dictionary containing SILVER table names and
+        corresponding cleaned DataFrames of the batch
+    :type batch: dict[str, list]
+
+    :param load_mode: `merge` or `append`, or NoneType to use
+        `PAGASA_LOAD_MODE`
+    :type load_mode: str | None
+
+    :return: Dictionary containing SILVER table names and
+        corresponding numbers of written rows
+    :rtype: dict[str, int]
+    """
+    import pandas as pd
+
+    dataframes = {}
+    row_counts = {}
+
+    for table_name, table_dataframes in batch.items():
+        if table_dataframes == []:
+            continue
+
+        dataframes[table_name] = pd.concat(
+            table_dataframes,
+            ignore_index=True
+        )
+        row_counts[table_name] = len(dataframes[table_name])
+
+    if dataframes != {}:
+        warehouse.write_dataframes(
+            conn,
+            dataframes,
+            load_mode=load_mode
+        )
+
+    return row_counts
+
+def backfill_snapshots(
+        snapshot_dir: str,
+        page_names: list[str] | None = None,
+        workers: int | None = None,
+        batch_size: int = 50,
+        load_mode: str | None = None
+) -> dict[str, object]:
+    """
+    Backfill the SILVER tables from the saved HTML snapshots of a
+    snapshot directory, parsing the snapshots on a process pool and
+    writing the cleaned rows in batches of snapshots.
+
+    A snapshot that fails to parse (e.g. a page saved during an
+    outage of the website) is logged and skipped instead of stopping
+    the backfill.
+
+    :param snapshot_dir: Directory containing a subdirectory of
+        HTML snapshots per page
+    :type snapshot_dir: str
+
+    :param page_names: Names of the pages to backfill, or NoneType
+        to backfill every page
+    :type page_names: list[str] | None
+
+    :param workers: Number of worker processes, or NoneType to use
+        every core
+    :type workers: int | None
+
+    :param batch_size: Number of parsed snapshots written per load
+    :type batch_size: int
+
+    :param load_mode: `merge` or `append`, or NoneType to use
+        `PAGASA_LOAD_MODE`
+    :type load_mode: str | None
+
+    :return: Summary of the backfill containing the number of parsed
+        snapshots, the failed snapshot filepaths and corresponding
+        errors, and the number of written rows per SILVER table
+    :rtype: dict[str, object]
+    """
+    from dotenv import load_dotenv
+    from etl.extract.warehouse import get_warehouse_backend
+
+    if batch_size < 1:
+        raise ValueError(
+            f'Expected a batch size of at least 1, got {batch_size}'
+        )
+
+    snapshots = find_snapshots(
+        snapshot_dir,
+        page_names
+    )
+    summary = {
+        'parsed_snapshots': 0,
+        'failed_snapshots': {},
+        'row_counts': {}
+    }
+
+    if snapshots == []:
+        return summary
+
+    # Load environment variables from .env file
+    load_dotenv()
+
+    # Share the run id of the measurements with the worker processes
+    get_run_id()
+
+    # Load the warehouse selected by `PAGASA_WAREHOUSE` (Snowflake by default)
+    warehouse = get_warehouse_backend()
+
+    with warehouse.warehouse_connection() as conn, ProcessPoolExecutor(max_workers=workers) as executor:
+        warehouse.create_tables(
+            conn
+        )
+
+        futures = {}
+
+        for snapshot_index, (page_name, snapshot_filepath) in enumerate(snapshots):
+            future = executor.submit(
+                run_collecting_measurements,
+                parse_snapshot,
+                page_name,
+                snapshot_filepath
+            )
+            futures[future] = snapshot_index
+
+        completed_futures = {}
+        next_snapshot_index = 0
+        batch = {}
+        number_of_batched_snapshots = 0
+
+        for future in as_completed(futures):
+            completed_futures[futures.pop(future)] = future
+
+            # Write the snapshots in the order they were submitted, so the merge keeps
+            # the rows of the latest snapshot whichever worker finishes parsing last
+            while next_snapshot_index in completed_futures:
+                future = completed_futures.pop(next_snapshot_index)
+                snapshot_filepath = snapshots[next_snapshot_index][1]
+                next_snapshot_index += 1
+
+                try:
+                    dataframes, measurements, error = future.result()
+                    add_run_measurements(
+                        measurements
+                    )
+
+                    if error is not None:
+                        raise error
+
+                except Exception as error:
+                    summary['failed_snapshots'][snapshot_filepath] = repr(error)
+                    generate_logs(
+                        f'(DEV): Fail to backfill the {snapshot_filepath} snapshot: {error!r}'
+                    )
+                    continue
+
+                for table_name, dataframe in dataframes.items():
+                    batch.setdefault(table_name, []).append(
+                        dataframe
+                    )
+
+                summary['parsed_snapshots'] += 1
+                number_of_batched_snapshots += 1
+
+                if number_of_batched_snapshots < batch_size:
+                    continue
+
+                for table_name, row_count in write_batch(warehouse, conn, batch, load_mode).items():
+                    summary['row_counts'][table_name] = summary['row_counts'].get(table_name, 0) + row_count
+
+                batch = {}
+                number_of_batched_snapshots = 0
+
+        for table_name, row_count in write_batch(warehouse, conn, batch, load_mode).items():
+            summary['row_counts'][table_name] = summary['row_counts'].get(table_name, 0) + row_count
+
+    generate_logs(
+        f"(DEV): Backfill {summary['parsed_snapshots']} snapshots from {snapshot_dir}."
+    )
+    export_prometheus_textfile()
+
+    return summary
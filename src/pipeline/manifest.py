@@ -0,0 +1,185 @@
+"""
+Run manifest for incremental re-execution of the ETL pipeline.
+
+This module records the SHA-256 hashes of the input and output files of
+every stage after its last successful run in
+`data/manifests/pipeline_manifest.json`, with the settings the run
+depended on (e.g. the warehouse, its target and the load mode of the
+extract stages). A stage whose input files and output files still have
+the recorded hashes, run with the same settings, is up to date and can
+be skipped, e.g. the extract of the daily weather forecast does not
+reload Snowflake when its ingest produced identical JSON files, but
+does load a local database selected after a Snowflake run.
+
+Main functions:
+- `compute_files_hashes()` - Hash the files matched by glob patterns
+- `is_stage_up_to_date()` - Check if a stage can be skipped
+- `record_stage_run()` - Record the successful run of a stage
+"""
+import os
+import glob
+import json
+import hashlib
+import tempfile
+
+MANIFEST_FILEPATH = 'data/manifests/pipeline_manifest.json'
+
+def compute_files_hashes(
+        patterns: list[str]
+) -> dict[str, str]:
+    """
+    Compute the SHA-256 hashes of the files matched by glob patterns.
+
+    :param patterns: Glob patterns of the files to hash
+    :type patterns: list[str]
+
+    :return: Dictionary containing filepaths and corresponding
+        hexadecimal SHA-256 hashes
+    :rtype: dict[str, str]
+    """
+    files_hashes = {}
+
+    for pattern in patterns:
+        for filepath in sorted(glob.glob(pattern, recursive=True)):
+            with open(filepath, 'rb') as file:
+                files_hashes[filepath] = hashlib.sha256(file.read()).hexdigest()
+
+    return files_hashes
+
+def load_manifest(
+) -> dict[str, dict]:
+    """
+    Load the run manifest of the ETL pipeline.
+
+    :return: Dictionary containing stage names and corresponding
+        recorded input and output hashes
+    :rtype: dict[str, dict]
+    """
+    if not os.path.exists(MANIFEST_FILEPATH):
+        return {}
+
+    with open(MANIFEST_FILEPATH, 'r') as json_file:
+        manifest = json.load(json_file)
+
+    return manifest
+
+def save_manifest(
+        manifest: dict[str, dict]
+) -> None:
+    """
+    Save the run manifest of the ETL pipeline, replacing the previous
+    manifest atomically so an interrupted run never leaves it corrupted.
+
+    :param manifest: Dictionary containing stage names and corresponding
+        recorded input and output hashes
+    :type manifest: dict[str, dict]
+    """
+    manifest_dir = os.path.dirname(MANIFEST_FILEPATH)
+
+    if not os.path.exists(manifest_dir):
+        os.makedirs(manifest_dir)
+
+    # A unique temporary file per save, so overlapping runs never write the same file
+    file_descriptor, temporary_filepath = tempfile.mkstemp(
+        dir=manifest_dir,
+        prefix=os.path.basename(MANIFEST_FILEPATH) + '.',
+        suffix='.tmp'
+    )
+
+    try:
+        with os.fdopen(file_descriptor, 'w') as json_file:
+            json.dump(manifest, json_file, indent=4)
+
+        os.replace(
+            temporary_filepath,
+            MANIFEST_FILEPATH
+        )
+
+    except BaseException:
+        os.remove(temporary_filepath)
+        raise
+
+def is_stage_up_to_date(
+        manifest: dict[str, dict],
+        stage_name: str,
+        input_hashes: dict[str, str],
+        output_patterns: list[str],
+        settings: dict[str, str | None] | None = None
+) -> bool:
+    """
+    Check if a stage is up to date, i.e. its input files did not change
+    since its last successful run, its output files are unchanged and
+    it runs with the same settings. Stages without input files (e.g. the ingest stages, which read from
+    the PAGASA-DOST website) are never up to date.
+
+    :param manifest: Run manifest of the ETL pipeline
+    :type manifest: dict[str, dict]
+
+    :param stage_name: Name of the stage
+    :type stage_name: str
+
+    :param input_hashes: Current hashes of the input files of the stage
+    :type input_hashes: dict[str, str]
+
+    :param output_patterns: Glob patterns of the output files of the stage
+    :type output_patterns: list[str]
+
+    :param settings: Current settings of the stage, or NoneType
+        if the stage depends on no settings
+    :type settings: dict[str, str | None] | None
+
+    :return: True if the stage can be skipped, otherwise False
+    :rtype: bool
+    """
+    if input_hashes == {} or stage_name not in manifest:
+        return False
+
+    stage_manifest = manifest[stage_name]
+
+    if stage_manifest['input_hashes'] != input_hashes:
+        return False
+
+    # Entries recorded before the settings were recorded have no settings
+    if stage_manifest.get('settings', {}) != (settings or {}):
+        return False
+
+    output_hashes = compute_files_hashes(
+        output_patterns
+    )
+
+    return stage_manifest['output_hashes'] == output_hashes
+
+def record_stage_run(
+        manifest: dict[str, dict],
+        stage_name: str,
+        input_hashes: dict[str, str],
+        output_patterns: list[str],
+        settings: dict[str, str | None] | None = None
+) -> None:
+    """
+    Record the successful run of a stage in the run manifest.
+
+    :param manifest: Run manifest of the ETL pipeline
+    :type manifest: dict[str, dict]
+
+    :param stage_name: Name of the stage
+    :type stage_name: str
+
+    :param input_hashes: Hashes of the input files of the stage
+        when it started
+    :type input_hashes: dict[str, str]
+
+    :param output_patterns: Glob patterns of the output files of the stage
+    :type output_patterns: list[str]
+
+    :param settings: Settings of the stage when it started, or
+        NoneType if the stage depends on no settings
+    :type settings: dict[str, str | None] | None
+    """
+    manifest[stage_name] = {
+        'input_hashes': input_hashes,
+        'output_hashes': compute_files_hashes(
+            output_patterns
+        ),
+        'settings': settings or {}
+    }
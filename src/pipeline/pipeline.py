@@ -0,0 +1,712 @@
+"""
+Command-line runner of the ETL pipeline.
+
+This module runs selected stages of the ETL pipeline as a dependency
+graph: the pages of the selected ingest stages are fetched concurrently,
+then every stage starts as soon as the stages it depends on (e.g. the
+extract of the daily weather forecast depends on its ingest) have
+finished, running independent stages in parallel on threads or
+processes. Stages whose input files did not change since their last
+successful run (recorded in the manifest of `pipeline.manifest`) are
+skipped. The duration of every stage is logged and reported.
+
+Usage:
+    pagasa-pipeline run [--stages daily,cities] [--parallel 4] [--executor thread|process] [--force] [--profile]
+    pagasa-pipeline backfill SNAPSHOT_DIR [--pages daily_weather_forecast,...] [--workers 8] [--batch-size 50]
+    pagasa-pipeline replay-archive [--raw-dir data/raw] [--pages daily_weather_forecast,...] [--start 2026-01-28T00:00:00] [--end ...] [--batch-size 50]
+
+With `--profile`, the fetch and every stage that runs are profiled by
+`pipeline.profiling`, and the profiles are saved under
+`src/logs/profiles/<run>/`.
+
+The `backfill` command rebuilds the SILVER tables from saved HTML
+snapshots with `pipeline.backfill`, and the `replay-archive` command
+replays the snapshots of the raw archive of a time range (naive times
+are UTC) with `pipeline.archive_replay`.
+
+The runner is invoked with `python src/pipeline/pipeline.py` (or through
+`python src/logs/logs.py`) from the root of the repository.
+
+Main functions:
+- `run_pipeline()` - Run stages of the ETL pipeline
+- `backfill()` - Run the backfill command
+- `replay_archive()` - Run the replay-archive command
+- `main()` - Command-line entry point
+"""
+import sys
+import os
+sys.path.insert(0, os.path.abspath('src'))
+
+import time
+import argparse
+import datetime
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import wait
+from concurrent.futures import FIRST_COMPLETED
+from logs.logs import generate_logs
+from logs.instrumentation import get_run_id
+from logs.instrumentation import run_collecting_measurements
+from logs.instrumentation import add_run_measurements
+from logs.instrumentation import export_prometheus_textfile
+from pipeline.stages import STAGES
+from pipeline.stages import fetch_stage_pages
+from pipeline.stages import run_stage
+from pipeline.stages import get_stage_settings
+from pipeline.manifest import compute_files_hashes
+from pipeline.manifest import load_manifest
+from pipeline.manifest import save_manifest
+from pipeline.manifest import is_stage_up_to_date
+from pipeline.manifest import record_stage_run
+from pipeline.backfill import backfill_snapshots
+from pipeline.archive_replay import replay_archived_snapshots
+from pipeline.profiling import create_profile_dir
+from pipeline.profiling import profile_stage
+
+def parse_stage_names(
+        stages_argument: str | None
+) -> list[str]:
+    """
+    Parse the comma-separated stage names of the command line.
+
+    :param stages_argument: Comma-separated stage names, or
+        NoneType to select every stage
+    :type stages_argument: str | None
+
+    :return: Names of the selected stages in pipeline order
+    :rtype: list[str]
+    """
+    if stages_argument is None:
+        return list(STAGES.keys())
+
+    requested_stage_names = []
+
+    for stage_name in stages_argument.split(','):
+        stage_name = stage_name.strip()
+
+        if stage_name == '':
+            continue
+
+        if stage_name not in STAGES:
+            raise ValueError(
+                f'Unknown stage {stage_name!r}, expected one of {list(STAGES.keys())}'
+            )
+
+        requested_stage_names.append(
+            stage_name
+        )
+
+    stage_names = []
+
+    for stage_name in STAGES.keys():
+        if stage_name in requested_stage_names:
+            stage_names.append(
+                stage_name
+            )
+
+    return stage_names
+
+def positive_int(
+        value: str
+) -> int:
+    """
+    Parse a positive integer argument of the command line.
+
+    :param value: Value of the argument
+    :type value: str
+
+    :return: Parsed positive integer
+    :rtype: int
+    """
+    try:
+        number = int(value)
+
+    except ValueError:
+        raise argparse.ArgumentTypeError(f'invalid int value: {value!r}')
+
+    if number < 1:
+        raise argparse.ArgumentTypeError(f'expected a positive integer, got {number}')
+
+    return number
+
+def utc_datetime(
+        value: str
+) -> datetime.datetime:
+    """
+    Parse an ISO 8601 datetime argument of the command line, as UTC
+    if it has no timezone.
+
+    :param value: Value of the argument
+    :type value: str
+
+    :return: Parsed timezone-aware datetime
+    :rtype: datetime.datetime
+    """
+    try:
+        parsed_datetime = datetime.datetime.fromisoformat(value)
+
+    except ValueError:
+        raise argparse.ArgumentTypeError(f'invalid ISO 8601 datetime: {value!r}')
+
+    if parsed_datetime.tzinfo is None:
+        parsed_datetime = parsed_datetime.replace(tzinfo=datetime.timezone.utc)
+
+    return parsed_datetime
+
+def parse_page_names(
+        pages: str | None
+) -> list[str] | None:
+    """
+    Parse the comma-separated pages of the command line.
+
+    :param pages: Comma-separated page names, or NoneType for every page
+    :type pages: str | None
+
+    :return: Page names, or NoneType for every page
+    :rtype: list[str] | None
+    """
+    if pages is None:
+        return None
+
+    page_names = []
+
+    for page_name in pages.split(','):
+        if page_name.strip() != '':
+            page_names.append(
+                page_name.strip()
+            )
+
+    return page_names
+
+def time_stage(
+        stage_name: str,
+        fetched_pages: dict[str, dict],
+        profile_dir: str | None = None
+) -> tuple[bool, float]:
+    """
+    Run a stage and measure its duration.
+
+    :param stage_name: Name of the stage
+    :type stage_name: str
+
+    :param fetched_pages: Dictionary containing page names and
+        corresponding fetched pages
+    :type fetched_pages: dict[str, dict]
+
+    :param profile_dir: Profile directory of the run, or NoneType
+        to run the stage without profiling
+    :type profile_dir: str | None
+
+    :return: Processed flag of the stage and its duration in seconds
+    :rtype: tuple[bool, float]
+    """
+    start = time.perf_counter()
+
+    if profile_dir is None:
+        is_processed = run_stage(
+            stage_name,
+            fetched_pages
+        )
+
+    else:
+        with profile_stage(stage_name, profile_dir):
+            is_processed = run_stage(
+                stage_name,
+                fetched_pages
+            )
+
+    duration_seconds = time.perf_counter() - start
+
+    return is_processed, duration_seconds
+
+def run_pipeline(
+        stage_names: list[str],
+        parallel: int = 1,
+        executor_type: str = 'thread',
+        force: bool = False,
+        profile: bool = False
+) -> dict[str, dict]:
+    """
+    Run stages of the ETL pipeline as a dependency graph, running
+    independent stages in parallel.
+
+    Dependencies on stages that are not selected are ignored, so a
+    stage can be re-run on its own. An ingest stage whose page could
+    not be fetched fails without running, and a stage whose dependency
+    failed is not run. A stage whose input files did not change since its last
+    successful run is skipped unless forced.
+
+    :param stage_names: Names of the stages to run
+    :type stage_names: list[str]
+
+    :param parallel: Maximum number of stages running at once
+    :type parallel: int
+
+    :param executor_type: Run the stages on `thread`s or `process`es
+    :type executor_type: str
+
+    :param force: Run the stages even if they are up to date
+    :type force: bool
+
+    :param profile: Profile the fetch and every stage that runs
+    :type profile: bool
+
+    :return: Dictionary containing stage names and corresponding
+        results with the status (`processed`, `unchanged`, `up_to_date`,
+        `failed` or `upstream_failed`), the duration in seconds and
+        the error
+    :rtype: dict[str, dict]
+    """
+    results = {}
+
+    if stage_names == []:
+        return results
+
+    # Share the run id of the measurements with the stages running on processes
+    get_run_id()
+
+    profile_dir = None
+
+    if profile:
+        profile_dir = create_profile_dir()
+
+    # Fetch the pages of the ingest stages concurrently before running the stages
+    if profile_dir is None:
+        fetched_pages = fetch_stage_pages(
+            stage_names
+        )
+
+    else:
+        # The pages are fetched on the threads of a thread pool
+        with profile_stage('fetch', profile_dir, profile_started_threads=True):
+            fetched_pages = fetch_stage_pages(
+                stage_names
+            )
+
+    for page_name, fetched_page in fetched_pages.items():
+        if fetched_page['error'] is not None:
+            generate_logs(
+                f"(DEV): Fail to fetch the {page_name} page: {fetched_page['error']!r}"
+            )
+            continue
+
+        generate_logs(
+            f"(DEV): Fetch the {page_name} page in {fetched_page['elapsed_seconds']:.3f} seconds."
+        )
+
+    dependencies = {}
+
+    for stage_name in stage_names:
+        dependencies[stage_name] = []
+
+        for dependency in STAGES[stage_name]['depends_on']:
+            if dependency in stage_names:
+                dependencies[stage_name].append(
+                    dependency
+                )
+
+    if executor_type == 'process':
+        executor = ProcessPoolExecutor(max_workers=parallel)
+
+    else:
+        executor = ThreadPoolExecutor(max_workers=parallel)
+
+    manifest = load_manifest()
+    pending_stage_names = list(stage_names)
+    running_futures = {}
+    running_input_hashes = {}
+    running_settings = {}
+
+    with executor:
+        while pending_stage_names != [] or running_futures != {}:
+            for stage_name in list(pending_stage_names):
+                statuses = [results.get(dependency, {}).get('status') for dependency in dependencies[stage_name]]
+
+                if 'failed' in statuses or 'upstream_failed' in statuses:
+                    pending_stage_names.remove(stage_name)
+                    results[stage_name] = {
+                        'status': 'upstream_failed',
+                        'duration_seconds': 0.0,
+                        'error': None
+                    }
+                    continue
+
+                # Submit the stage once all of its dependencies have finished
+                if None not in statuses:
+                    pending_stage_names.remove(stage_name)
+                    fetch_error = fetched_pages.get(STAGES[stage_name]['page'], {}).get('error')
+
+                    # A page that could not be fetched fails the stage owning it, not the run
+                    if fetch_error is not None:
+                        results[stage_name] = {
+                            'status': 'failed',
+                            'duration_seconds': 0.0,
+                            'error': repr(fetch_error)
+                        }
+                        generate_logs(
+                            f'(DEV): Fail the {stage_name} stage: {fetch_error!r}'
+                        )
+                        continue
+
+                    input_hashes = compute_files_hashes(
+                        STAGES[stage_name]['inputs']
+                    )
+
+                    # Invalid settings (e.g. an unknown load mode) fail the stage, not the run
+                    try:
+                        settings = get_stage_settings(
+                            stage_name
+                        )
+
+                    except Exception as error:
+                        results[stage_name] = {
+                            'status': 'failed',
+                            'duration_seconds': 0.0,
+                            'error': repr(error)
+                        }
+                        generate_logs(
+                            f'(DEV): Fail the {stage_name} stage: {error!r}'
+                        )
+                        continue
+
+                    if not force and is_stage_up_to_date(manifest, stage_name, input_hashes, STAGES[stage_name]['outputs'], settings):
+                        results[stage_name] = {
+                            'status': 'up_to_date',
+                            'duration_seconds': 0.0,
+                            'error': None
+                        }
+                        generate_logs(
+                            STAGES[stage_name]['skip_log_message']
+                        )
+                        continue
+
+                    running_input_hashes[stage_name] = input_hashes
+                    running_settings[stage_name] = settings
+                    future = executor.submit(
+                        run_collecting_measurements,
+                        time_stage,
+                        stage_name,
+                        fetched_pages,
+                        profile_dir
+                    )
+                    running_futures[future] = stage_name
+
+            if running_futures == {}:
+                continue
+
+            done_futures, _ = wait(running_futures, return_when=FIRST_COMPLETED)
+
+            for future in done_futures:
+                stage_name = running_futures.pop(future)
+
+                try:
+                    stage_result, measurements, error = future.result()
+                    add_run_measurements(
+                        measurements
+                    )
+
+                    if error is not None:
+                        raise error
+
+                    is_processed, duration_seconds = stage_result
+
+                except Exception as error:
+                    results[stage_name] = {
+                        'status': 'failed',
+                        'duration_seconds': 0.0,
+                        'error': repr(error)
+                    }
+                    generate_logs(
+                        f'(DEV): Fail the {stage_name} stage: {error!r}'
+                    )
+                    continue
+
+                if is_processed:
+                    status = 'processed'
+                    log_message = STAGES[stage_name]['log_message']
+
+                else:
+                    status = 'unchanged'
+                    log_message = STAGES[stage_name]['skip_log_message']
+
+                results[stage_name] = {
+                    'status': status,
+                    'duration_seconds': duration_seconds,
+                    'error': None
+                }
+                record_stage_run(
+                    manifest,
+                    stage_name,
+                    running_input_hashes[stage_name],
+                    STAGES[stage_name]['outputs'],
+                    running_settings[stage_name]
+                )
+                save_manifest(
+                    manifest
+                )
+                generate_logs(
+                    f'{log_message} ({duration_seconds:.3f} seconds)'
+                )
+
+    export_prometheus_textfile()
+
+    if profile_dir is not None:
+        generate_logs(
+            f'(DEV): Save the profiles of the run in {profile_dir}.'
+        )
+
+    return results
+
+def backfill(
+        parser: argparse.ArgumentParser,
+        args: argparse.Namespace
+) -> int:
+    """
+    Run the `backfill` command of the command line.
+
+    :param parser: Parser of the command line
+    :type parser: argparse.ArgumentParser
+
+    :param args: Parsed arguments of the `backfill` command
+    :type args: argparse.Namespace
+
+    :return: Exit code, non-zero if a snapshot failed to parse
+    :rtype: int
+    """
+    try:
+        summary = backfill_snapshots(
+            args.snapshot_dir,
+            parse_page_names(args.pages),
+            args.workers,
+            args.batch_size,
+            args.load_mode
+        )
+
+    except ValueError as error:
+        parser.error(str(error))
+
+    print(f"{'table':<32} {'rows':>10}")
+
+    for table_name, row_count in summary['row_counts'].items():
+        print(f"{table_name:<32} {row_count:>10}")
+
+    print(f"Parsed {summary['parsed_snapshots']} snapshots, {len(summary['failed_snapshots'])} failed")
+
+    for snapshot_filepath, error in summary['failed_snapshots'].items():
+        print(f'{snapshot_filepath}: {error}')
+
+    if summary['failed_snapshots'] != {}:
+        return 1
+
+    return 0
+
+def replay_archive(
+        parser: argparse.ArgumentParser,
+        args: argparse.Namespace
+) -> int:
+    """
+    Run the `replay-archive` command of the command line.
+
+    :param parser: Parser of the command line
+    :type parser: argparse.ArgumentParser
+
+    :param args: Parsed arguments of the `replay-archive` command
+    :type args: argparse.Namespace
+
+    :return: Exit code, non-zero if a snapshot failed to replay
+    :rtype: int
+    """
+    try:
+        summary = replay_archived_snapshots(
+            args.raw_dir,
+            parse_page_names(args.pages),
+            args.start,
+            args.end,
+            args.batch_size,
+            args.load_mode
+        )
+
+    except ValueError as error:
+        parser.error(str(error))
+
+    print(f"{'table':<32} {'rows':>10}")
+
+    for table_name, row_count in summary['row_counts'].items():
+        print(f"{table_name:<32} {row_count:>10}")
+
+    print(f"Replayed {summary['replayed_snapshots']} snapshots, {len(summary['failed_snapshots'])} failed")
+
+    for snapshot, error in summary['failed_snapshots'].items():
+        print(f'{snapshot}: {error}')
+
+    if summary['failed_snapshots'] != {}:
+        return 1
+
+    return 0
+
+def main(
+        argv: list[str] | None = None
+) -> int:
+    """
+    Command-line entry point of the ETL pipeline.
+
+    :param argv: Command-line arguments, or NoneType to use
+        the arguments of the process
+    :type argv: list[str] | None
+
+    :return: Exit code, non-zero if a stage failed
+    :rtype: int
+    """
+    parser = argparse.ArgumentParser(
+        prog='pagasa-pipeline',
+        description='Run the PAGASA-DOST weather data pipeline.'
+    )
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = subparsers.add_parser(
+        'run',
+        help='Run stages of the pipeline'
+    )
+    run_parser.add_argument(
+        '--stages',
+        default=None,
+        help=f"Comma-separated stages to run (default: all). Stages: {','.join(STAGES.keys())}"
+    )
+    run_parser.add_argument(
+        '--parallel',
+        type=positive_int,
+        default=1,
+        help='Maximum number of stages running at once (default: 1)'
+    )
+    run_parser.add_argument(
+        '--executor',
+        choices=['thread', 'process'],
+        default='thread',
+        help='Run the stages on threads or processes (default: thread)'
+    )
+
+    run_parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Run the stages even if their inputs did not change'
+    )
+    run_parser.add_argument(
+        '--profile',
+        action='store_true',
+        help='Save a cProfile and a collapsed stack profile per stage under src/logs/profiles/'
+    )
+
+    backfill_parser = subparsers.add_parser(
+        'backfill',
+        help='Rebuild the SILVER tables from saved HTML snapshots'
+    )
+    backfill_parser.add_argument(
+        'snapshot_dir',
+        help='Directory containing a subdirectory of HTML snapshots per page'
+    )
+    backfill_parser.add_argument(
+        '--pages',
+        default=None,
+        help='Comma-separated pages to backfill (default: all). Pages: daily_weather_forecast,weather_outlook_for_ph_cities,weather_outlook_for_ph_tourist_areas'
+    )
+    backfill_parser.add_argument(
+        '--workers',
+        type=positive_int,
+        default=None,
+        help='Number of processes parsing the snapshots (default: number of cores)'
+    )
+    backfill_parser.add_argument(
+        '--batch-size',
+        type=positive_int,
+        default=50,
+        help='Number of parsed snapshots written per load (default: 50)'
+    )
+    backfill_parser.add_argument(
+        '--load-mode',
+        choices=['merge', 'append'],
+        default=None,
+        help='Merge on the natural keys or append the rows (default: PAGASA_LOAD_MODE or merge)'
+    )
+
+    replay_archive_parser = subparsers.add_parser(
+        'replay-archive',
+        help='Replay the snapshots of the raw archive into the SILVER tables'
+    )
+    replay_archive_parser.add_argument(
+        '--raw-dir',
+        default='data/raw',
+        help='Directory of the raw artifacts of every page (default: data/raw)'
+    )
+    replay_archive_parser.add_argument(
+        '--pages',
+        default=None,
+        help='Comma-separated pages to replay (default: all). Pages: daily_weather_forecast,weather_outlook_for_ph_cities,weather_outlook_for_ph_tourist_areas'
+    )
+    replay_archive_parser.add_argument(
+        '--start',
+        type=utc_datetime,
+        default=None,
+        help='Earliest archive time of the snapshots, ISO 8601 (default: no lower bound, UTC if no timezone)'
+    )
+    replay_archive_parser.add_argument(
+        '--end',
+        type=utc_datetime,
+        default=None,
+        help='Latest archive time of the snapshots (exclusive), ISO 8601 (default: no upper bound, UTC if no timezone)'
+    )
+    replay_archive_parser.add_argument(
+        '--batch-size',
+        type=positive_int,
+        default=50,
+        help='Number of snapshots written per load (default: 50)'
+    )
+    replay_archive_parser.add_argument(
+        '--load-mode',
+        choices=['merge', 'append'],
+        default=None,
+        help='Merge on the natural keys or append the rows (default: PAGASA_LOAD_MODE or merge)'
+    )
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'backfill':
+        return backfill(
+            parser,
+            args
+        )
+
+    if args.command == 'replay-archive':
+        return replay_archive(
+            parser,
+            args
+        )
+
+    try:
+        stage_names = parse_stage_names(
+            args.stages
+        )
+
+    except ValueError as error:
+        parser.error(str(error))
+
+    results = run_pipeline(
+        stage_names,
+        args.parallel,
+        args.executor,
+        args.force,
+        args.profile
+    )
+
+    print(f"{'stage':<24} {'status':<16} {'duration_s':>10}")
+
+    for stage_name, result in results.items():
+        print(f"{stage_name:<24} {result['status']:<16} {result['duration_seconds']:>10.3f}")
+
+    for result in results.values():
+        if result['status'] in ('failed', 'upstream_failed'):
+            return 1
+
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,271 @@
+"""
+Opt-in profiling of the stages of the ETL pipeline.
+
+This module profiles a stage of the ETL pipeline when the runner is
+invoked with `--profile`, writing two artifacts per stage next to the
+logs:
+
+- `<stage>.pstats` - Deterministic profile of `cProfile`, readable with
+    `pstats` or `snakeviz` (e.g. to compare the time in `requests.get`,
+    the BeautifulSoup construction, the `find_all` calls or the JSON
+    dump)
+- `<stage>.collapsed` - Stacks of the thread running the stage sampled
+    at a fixed interval, in the collapsed format of `flamegraph.pl`
+    and speedscope (one `frame;frame;frame count` line per stack)
+
+Both profilers only profile the thread running the stage, so stages
+running in parallel on threads get separate profiles. A stage handing
+its work to threads it starts (e.g. the fetch of the pages, whose HTTP
+requests run on the workers of a thread pool) is profiled with
+`profile_started_threads`, which also samples the threads started
+during the stage and merges a `cProfile` profile of every such thread
+into `<stage>.pstats`. Nothing is imported or started unless profiling
+is enabled.
+
+Main functions:
+- `create_profile_dir()` - Create the profile directory of a run
+- `profile_stage()` - Context manager profiling a stage
+"""
+import os
+import sys
+import threading
+from typing import Callable
+from typing import Iterator
+from datetime import datetime
+from contextlib import contextmanager
+
+PROFILES_DIR = 'src/logs/profiles'
+
+def create_profile_dir(
+        profiles_dir: str = PROFILES_DIR
+) -> str:
+    """
+    Create the profile directory of a pipeline run, named by the
+    time the run started.
+
+    :param profiles_dir: Directory of the profiles of every run
+    :type profiles_dir: str
+
+    :return: Profile directory of the run
+    :rtype: str
+    """
+    format = '%Y%m%d%H%M%S' # Format: YYYYMMDDHHMMSS
+    profile_dir = os.path.join(
+        profiles_dir,
+        datetime.now().strftime(format)
+    )
+    os.makedirs(profile_dir, exist_ok=True)
+
+    return profile_dir
+
+def format_stack(
+        frame: object
+) -> str:
+    """
+    Format the stack of a frame as a collapsed stack, from the
+    outermost frame to the frame.
+
+    :param frame: Innermost frame of the stack
+    :type frame: FrameType
+
+    :return: Frames of the stack separated by `;`
+    :rtype: str
+    """
+    frames = []
+
+    while frame is not None:
+        code = frame.f_code
+        frames.append(
+            f'{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})'
+        )
+        frame = frame.f_back
+
+    return ';'.join(reversed(frames))
+
+def sample_stacks(
+        thread_id: int,
+        interval_seconds: float,
+        stop_event: threading.Event,
+        stack_counts: dict[str, int],
+        existing_thread_ids: set[int] | None = None
+) -> None:
+    """
+    Sample the stack of a thread at a fixed interval until stopped.
+
+    :param thread_id: Id of the sampled thread
+    :type thread_id: int
+
+    :param interval_seconds: Interval between two samples in seconds
+    :type interval_seconds: float
+
+    :param stop_event: Event set to stop sampling
+    :type stop_event: threading.Event
+
+    :param stack_counts: Dictionary containing collapsed stacks and
+        corresponding numbers of samples, updated in place
+    :type stack_counts: dict[str, int]
+
+    :param existing_thread_ids: Ids of the threads running before
+        sampling started, to also sample every other thread (i.e. the
+        threads started since), or NoneType to sample the thread only
+    :type existing_thread_ids: set[int] | None
+    """
+    sampler_thread_id = threading.get_ident()
+
+    while not stop_event.wait(interval_seconds):
+        for sampled_thread_id, frame in sys._current_frames().items():
+            if sampled_thread_id != thread_id:
+                if existing_thread_ids is None:
+                    continue
+
+                if sampled_thread_id in existing_thread_ids or sampled_thread_id == sampler_thread_id:
+                    continue
+
+            stack = format_stack(
+                frame
+            )
+            stack_counts[stack] = stack_counts.get(stack, 0) + 1
+
+def save_collapsed_stacks(
+        stack_counts: dict[str, int],
+        collapsed_filepath: str
+) -> None:
+    """
+    Save sampled stacks in the collapsed stack format.
+
+    :param stack_counts: Dictionary containing collapsed stacks and
+        corresponding numbers of samples
+    :type stack_counts: dict[str, int]
+
+    :param collapsed_filepath: Filepath of the collapsed stacks
+    :type collapsed_filepath: str
+    """
+    with open(collapsed_filepath, 'w', encoding='utf-8') as collapsed_file:
+        for stack, count in sorted(stack_counts.items(), key=lambda item: item[1], reverse=True):
+            collapsed_file.write(f'{stack} {count}\n')
+
+def start_thread_profiler(
+        thread_profilers: list,
+        thread_profilers_lock: threading.Lock
+) -> Callable:
+    """
+    Create the profile function of `threading.setprofile`, which
+    replaces itself with a `cProfile` profiler on the first event of
+    every thread started while it is set.
+
+    :param thread_profilers: Profilers of the started threads,
+        updated in place
+    :type thread_profilers: list[cProfile.Profile]
+
+    :param thread_profilers_lock: Lock of the profilers of the
+        started threads
+    :type thread_profilers_lock: threading.Lock
+
+    :return: Profile function of the started threads
+    :rtype: Callable
+    """
+    import cProfile
+
+    def profile_thread(
+            frame: object,
+            event: str,
+            arg: object
+    ) -> None:
+        sys.setprofile(None)
+        profiler = cProfile.Profile()
+
+        # A profiler is already active for every thread (cProfile on Python 3.12+)
+        try:
+            profiler.enable()
+
+        except ValueError:
+            return
+
+        with thread_profilers_lock:
+            thread_profilers.append(
+                profiler
+            )
+
+    return profile_thread
+
+@contextmanager
+def profile_stage(
+        stage_name: str,
+        profile_dir: str,
+        interval_seconds: float = 0.005,
+        profile_started_threads: bool = False
+) -> Iterator[None]:
+    """
+    Context manager profiling the current thread with `cProfile`
+    and a stack sampler, saving `<stage>.pstats` and
+    `<stage>.collapsed` in the profile directory.
+
+    :param stage_name: Name of the stage
+    :type stage_name: str
+
+    :param profile_dir: Profile directory of the run
+    :type profile_dir: str
+
+    :param interval_seconds: Interval between two stack samples
+        in seconds
+    :type interval_seconds: float
+
+    :param profile_started_threads: Also profile the threads
+        started during the stage
+    :type profile_started_threads: bool
+    """
+    import cProfile
+    import pstats
+
+    profiler = cProfile.Profile()
+    stop_event = threading.Event()
+    stack_counts = {}
+    existing_thread_ids = None
+    thread_profilers = []
+
+    if profile_started_threads:
+        existing_thread_ids = set(sys._current_frames().keys())
+
+    sampler_thread = threading.Thread(
+        target=sample_stacks,
+        args=(threading.get_ident(), interval_seconds, stop_event, stack_counts, existing_thread_ids),
+        name=f'profile-{stage_name}',
+        daemon=True
+    )
+    sampler_thread.start()
+
+    # Set after starting the sampler, so the sampler is not profiled
+    if profile_started_threads:
+        threading.setprofile(
+            start_thread_profiler(thread_profilers, threading.Lock())
+        )
+
+    profiler.enable()
+
+    try:
+        yield
+
+    finally:
+        profiler.disable()
+        stop_event.set()
+        sampler_thread.join()
+
+        if profile_started_threads:
+            threading.setprofile(None)
+
+        # Merge the profiles of the started threads into the profile of the stage
+        stats = pstats.Stats(profiler)
+
+        for thread_profiler in thread_profilers:
+            stats.add(
+                thread_profiler
+            )
+
+        os.makedirs(profile_dir, exist_ok=True)
+        stats.dump_stats(
+            os.path.join(profile_dir, f'{stage_name}.pstats')
+        )
+        save_collapsed_stacks(
+            stack_counts,
+            os.path.join(profile_dir, f'{stage_name}.collapsed')
+        )
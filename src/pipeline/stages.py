@@ -0,0 +1,241 @@
+"""
+Lazily loaded stages of the ETL pipeline.
+
+This module declares the stages of the ETL pipeline by the module and
+function of their executor instead of importing the executors, so a
+stage's dependencies (e.g. BeautifulSoup and requests for the ingest
+stages, pandas and the Snowflake connector for the extract stages) are
+only imported when the stage runs. Ingest-only runs therefore never
+import pandas or the Snowflake connector.
+
+Main functions:
+- `load_stage_function()` - Import the executor function of a stage
+- `fetch_stage_pages()` - Fetch the pages of the ingest stages concurrently
+- `get_stage_settings()` - Get the settings a stage's run depends on
+- `run_stage()` - Run a stage
+"""
+import importlib
+from typing import Callable
+from logs.instrumentation import instrument
+
+STAGES = {
+    'daily': {
+        'module': 'executor.ingest.execute_ingest_daily_weather_forecast',
+        'function': 'ingest_daily_weather_forecast',
+        'page': 'daily_weather_forecast',
+        'depends_on': [],
+        'inputs': [],
+        'loads_warehouse': False,
+        'outputs': ['data/raw/daily_weather_forecasts/*.json', 'data/raw/daily_weather_forecasts/*.parquet'],
+        'log_message': '(DEV): Ingest the daily weather forecast data.',
+        'skip_log_message': '(DEV): Skip the unchanged daily weather forecast data.'
+    },
+    'cities': {
+        'module': 'executor.ingest.execute_ingest_weather_outlook_for_ph_cities',
+        'function': 'ingest_weather_outlook_for_ph_cities',
+        'page': 'weather_outlook_for_ph_cities',
+        'depends_on': [],
+        'inputs': [],
+        'loads_warehouse': False,
+        'outputs': ['data/raw/weather_outlooks_for_ph_cities/*.json', 'data/raw/weather_outlooks_for_ph_cities/*.parquet'],
+        'log_message': '(DEV): Ingest the weather outlook for selected Philippine cities data.',
+        'skip_log_message': '(DEV): Skip the unchanged weather outlook for selected Philippine cities data.'
+    },
+    'tourist_areas': {
+        'module': 'executor.ingest.execute_ingest_weather_outlook_for_ph_tourist_areas',
+        'function': 'ingest_weather_outlook_for_ph_tourist_areas',
+        'page': 'weather_outlook_for_ph_tourist_areas',
+        'depends_on': [],
+        'inputs': [],
+        'loads_warehouse': False,
+        'outputs': ['data/raw/weather_outlooks_for_ph_tourist_areas/*.json', 'data/raw/weather_outlooks_for_ph_tourist_areas/*.parquet'],
+        'log_message': '(DEV): Ingest the weather outlook for selected Philippine tourist areas data.',
+        'skip_log_message': '(DEV): Skip the unchanged weather outlook for selected Philippine tourist areas data.'
+    },
+    'advisory': {
+        'module': 'executor.ingest.execute_ingest_weather_advisory',
+        'function': 'ingest_weather_advisory',
+        'page': 'weather_advisory',
+        'depends_on': [],
+        'inputs': [],
+        'loads_warehouse': False,
+        'outputs': ['data/raw/weather_advisories/*.json'],
+        'log_message': '(DEV): Ingest the weather advisory data',
+        'skip_log_message': '(DEV): Skip the unchanged weather advisory data.'
+    },
+    'extract_daily': {
+        'module': 'executor.extract.execute_extract_daily_weather_forecast',
+        'function': 'extract_daily_weather_forecast',
+        'page': None,
+        'depends_on': ['daily'],
+        'inputs': [
+            'data/raw/daily_weather_forecasts/issued_datetime.json',
+            'data/raw/daily_weather_forecasts/synopsis.json'
+        ],
+        'outputs': [],
+        'loads_warehouse': True,
+        'log_message': '(DEV): Extract the daily weather forecast data.',
+        'skip_log_message': '(DEV): Skip the unchanged daily weather forecast data.'
+    },
+    'extract_cities': {
+        'module': 'executor.extract.execute_extract_weather_outlook_for_ph_cities',
+        'function': 'extract_weather_outlook_for_ph_cities',
+        'page': None,
+        'depends_on': ['cities'],
+        'inputs': [
+            'data/raw/weather_outlooks_for_ph_cities/weather_outlook_for_ph_cities.json',
+            'data/raw/weather_outlooks_for_ph_cities/weather_outlook_for_ph_cities.parquet'
+        ],
+        'outputs': [],
+        'loads_warehouse': True,
+        'log_message': '(DEV): Extract the weather outlook for selected Philippine cities data.',
+        'skip_log_message': '(DEV): Skip the unchanged weather outlook for selected Philippine cities data.'
+    },
+    'extract_tourist_areas': {
+        'module': 'executor.extract.execute_extract_weather_outlook_for_ph_tourist_areas',
+        'function': 'extract_weather_outlook_for_ph_tourist_areas',
+        'page': None,
+        'depends_on': ['tourist_areas'],
+        'inputs': [
+            'data/raw/weather_outlooks_for_ph_tourist_areas/weather_outlook_for_ph_tourist_areas.json',
+            'data/raw/weather_outlooks_for_ph_tourist_areas/weather_outlook_for_ph_tourist_areas.parquet'
+        ],
+        'outputs': [],
+        'loads_warehouse': True,
+        'log_message': '(DEV): Extract the weather outlook for selected Philippine tourist areas data.',
+        'skip_log_message': '(DEV): Skip the unchanged weather outlook for selected Philippine tourist areas data.'
+    }
+}
+
+def load_stage_function(
+        stage_name: str
+) -> Callable:
+    """
+    Import the executor function of a stage.
+
+    :param stage_name: Name of the stage
+    :type stage_name: str
+
+    :return: Executor function of the stage
+    :rtype: Callable
+    """
+    stage = STAGES[stage_name]
+    module = importlib.import_module(
+        stage['module']
+    )
+
+    return getattr(module, stage['function'])
+
+def get_stage_settings(
+        stage_name: str
+) -> dict[str, str | None]:
+    """
+    Get the settings the run of a stage depends on besides its input
+    files, i.e. the warehouse settings of the stages loading the
+    warehouse. The `.env` file is loaded first, as the extract
+    executors load it.
+
+    :param stage_name: Name of the stage
+    :type stage_name: str
+
+    :return: Dictionary containing setting names and corresponding
+        values, empty for the stages not loading the warehouse
+    :rtype: dict[str, str | None]
+    """
+    if not STAGES[stage_name]['loads_warehouse']:
+        return {}
+
+    from dotenv import load_dotenv
+    from etl.extract.warehouse import get_warehouse_settings
+
+    load_dotenv()
+
+    return get_warehouse_settings()
+
+def fetch_stage_pages(
+        stage_names: list[str]
+) -> dict[str, dict]:
+    """
+    Fetch the pages of the ingest stages concurrently.
+
+    :param stage_names: Names of the stages to run
+    :type stage_names: list[str]
+
+    :return: Dictionary containing page names and corresponding
+        fetched pages
+    :rtype: dict[str, dict]
+    """
+    page_names = []
+
+    for stage_name in stage_names:
+        if STAGES[stage_name]['page'] is not None:
+            page_names.append(
+                STAGES[stage_name]['page']
+            )
+
+    if page_names == []:
+        return {}
+
+    from ingest.fetch_pages import get_page_urls
+    from ingest.fetch_pages import fetch_pages_concurrently
+
+    page_urls = get_page_urls()
+    selected_page_urls = {}
+
+    for page_name in page_names:
+        selected_page_urls[page_name] = page_urls[page_name]
+
+    return fetch_pages_concurrently(
+        selected_page_urls
+    )
+
+def run_stage(
+        stage_name: str,
+        fetched_pages: dict[str, dict] | None = None
+) -> bool:
+    """
+    Run a stage, importing its executor on first use.
+
+    :param stage_name: Name of the stage
+    :type stage_name: str
+
+    :param fetched_pages: Dictionary containing page names and
+        corresponding fetched pages, or NoneType to let the ingest
+        stages fetch their own page
+    :type fetched_pages: dict[str, dict] | None
+
+    :return: True if the stage processed new data, or False if
+        it was skipped because its data is unchanged
+    :rtype: bool
+
+    :raises Exception: The error of the fetch if the page of an
+        ingest stage could not be fetched
+    """
+    stage = STAGES[stage_name]
+    stage_function = load_stage_function(
+        stage_name
+    )
+
+    with instrument(stage['function'], {'stage': stage_name}):
+        if stage['page'] is None:
+            is_processed = stage_function()
+
+        elif fetched_pages is None or stage['page'] not in fetched_pages:
+            is_processed = stage_function()
+
+        else:
+            fetched_page = fetched_pages[stage['page']]
+
+            # Fail only the stage owning a page that could not be fetched
+            if fetched_page.get('error') is not None:
+                raise fetched_page['error']
+
+            is_processed = stage_function(
+                fetched_page
+            )
+
+    # Executors that always process their data do not return a flag
+    if is_processed is None:
+        return True
+
+    return is_processed
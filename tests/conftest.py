@@ -0,0 +1,36 @@
+"""
+Shared configuration of the tests of the pipeline.
+
+The modules of the pipeline import each other from `src/`, as the
+pipeline runs them, and write their artifacts relative to the working
+directory, so every test runs in a temporary working directory with the
+HTTP cache, the raw archive and the instrumentation disabled.
+"""
+import sys
+import os
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT_DIR, 'src'))
+
+import pytest
+
+@pytest.fixture(autouse=True)
+def isolated_working_dir(
+        tmp_path,
+        monkeypatch
+) -> str:
+    """
+    Run a test in a temporary working directory.
+
+    :return: Temporary working directory
+    :rtype: str
+    """
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv('PAGASA_HTTP_CACHE', '0')
+    monkeypatch.setenv('PAGASA_RAW_ARCHIVE', '0')
+    monkeypatch.setenv('PAGASA_PARQUET_OUTPUT', '0')
+    monkeypatch.setenv('PAGASA_JSON_OUTPUT', 'pretty')
+    monkeypatch.setenv('PAGASA_INSTRUMENTATION', '0')
+    os.makedirs(os.path.join('src', 'logs'))
+
+    return str(tmp_path)
@@ -0,0 +1,105 @@
+"""
+Order of the writes of the backfill of the SILVER tables.
+
+Two snapshots of the weather outlook for selected Philippine cities
+forecast the same cities and weather dates, and the merge must keep the
+rows of the snapshot saved last, whichever worker finishes first.
+"""
+import os
+import shutil
+
+import pytest
+
+from conftest import ROOT_DIR
+from pipeline.backfill import backfill_snapshots
+from etl.extract.schema_registry import SILVER_TABLES
+from etl.extract.warehouse_sqlite import get_local_table_name
+from etl.extract.warehouse_sqlite import warehouse_connection
+
+pytest.importorskip('dotenv')
+
+CITIES_FIXTURE_FILEPATH = os.path.join(
+    ROOT_DIR,
+    'data',
+    'fixtures',
+    'html',
+    'weather_outlook_for_ph_cities',
+    'weather_outlook_for_ph_cities.html'
+)
+
+def save_snapshot(
+        snapshot_dir: str,
+        filename: str,
+        html: str
+) -> None:
+    """
+    Save an HTML snapshot of the weather outlook for selected
+    Philippine cities page in a snapshot directory.
+
+    :param snapshot_dir: Directory of the snapshots
+    :type snapshot_dir: str
+
+    :param filename: Filename of the snapshot
+    :type filename: str
+
+    :param html: HTML of the snapshot
+    :type html: str
+    """
+    page_dir = os.path.join(snapshot_dir, 'weather_outlook_for_ph_cities')
+    os.makedirs(page_dir, exist_ok=True)
+
+    with open(os.path.join(page_dir, filename), 'w', encoding='utf-8') as html_file:
+        html_file.write(html)
+
+def backfill_city_weather_outlooks(
+        snapshot_dir: str
+) -> list[tuple]:
+    """
+    Backfill a fresh SQLite database from a snapshot directory
+    and load the sorted rows of the city weather outlooks.
+
+    :param snapshot_dir: Directory of the snapshots
+    :type snapshot_dir: str
+
+    :return: Sorted rows of the city weather outlooks
+    :rtype: list[tuple]
+    """
+    if os.path.exists(os.path.join('data', 'warehouse')):
+        shutil.rmtree(os.path.join('data', 'warehouse'))
+
+    backfill_snapshots(
+        snapshot_dir,
+        ['weather_outlook_for_ph_cities'],
+        workers=2,
+        batch_size=1,
+        load_mode='merge'
+    )
+    local_table_name = get_local_table_name(
+        'CITY_WEATHER_OUTLOOKS',
+        SILVER_TABLES['CITY_WEATHER_OUTLOOKS']
+    )
+
+    with warehouse_connection() as conn:
+        return sorted(conn.execute(f'SELECT * FROM {local_table_name}').fetchall(), key=repr)
+
+def test_backfill_keeps_the_rows_of_the_latest_snapshot(
+        monkeypatch
+) -> None:
+    monkeypatch.setenv('PAGASA_WAREHOUSE', 'sqlite')
+    monkeypatch.setenv('PAGASA_SQLITE_PATH', os.path.join('data', 'warehouse', 'pagasa.sqlite3'))
+
+    with open(CITIES_FIXTURE_FILEPATH, 'r', encoding='utf-8') as html_file:
+        older_html = html_file.read()
+
+    # The latest snapshot revises the minimum temperature of the first city and weather date
+    newer_html = older_html.replace('<span class="min">25°C</span>', '<span class="min">19°C</span>', 1)
+    assert newer_html != older_html
+
+    save_snapshot('newer_only', 'weather_outlook_for_ph_cities_20260129T000000Z.html', newer_html)
+    expected_rows = backfill_city_weather_outlooks('newer_only')
+
+    save_snapshot('overlapping', 'weather_outlook_for_ph_cities_20260128T000000Z.html', older_html)
+    save_snapshot('overlapping', 'weather_outlook_for_ph_cities_20260129T000000Z.html', newer_html)
+
+    for _ in range(3):
+        assert backfill_city_weather_outlooks('overlapping') == expected_rows
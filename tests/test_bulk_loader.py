@@ -0,0 +1,174 @@
+"""
+Statements of the bulk load of the SILVER tables into Snowflake.
+
+The loads run against the local fake connector, whose connections
+record every executed statement. The Parquet files are written by
+`pyarrow` when it is installed; otherwise only their filenames are
+staged, since the fake connector never reads them.
+"""
+import os
+import importlib.util
+
+import pandas as pd
+import pytest
+
+from etl.extract import bulk_loader
+from etl.extract import warehouse_snowflake
+from etl.extract.bulk_loader import bulk_load_dataframes
+from etl.extract.schema_registry import SILVER_TABLES
+from etl.extract.schema_registry import load_schema_bootstrap_cache
+from etl.extract.fake_snowflake_connector import connect
+from etl.extract.fake_snowflake_connector import FakeSnowflakeError
+
+ISSUED_DATETIMES = pd.DataFrame(
+    {'ISSUED_DATE': ['2026-01-29'], 'ISSUED_TIME': ['04:00:00']}
+)
+
+SYNOPSES = pd.DataFrame(
+    {'ISSUED_DATE': ['2026-01-29'], 'ISSUED_TIME': ['04:00:00'], 'SYNOPSIS': ['Northeast Monsoon']}
+)
+
+def name_parquet_files(
+        dataframes: dict[str, pd.DataFrame],
+        staging_dir: str
+) -> dict[str, str]:
+    """
+    Name the Parquet files of DataFrames after their tables without
+    writing them.
+
+    :param dataframes: Dictionary containing table names and
+        corresponding cleaned data as DataFrame objects
+    :type dataframes: dict[str, pd.DataFrame]
+
+    :param staging_dir: Directory of the Parquet files
+    :type staging_dir: str
+
+    :return: Dictionary containing table names and corresponding
+        Parquet filenames
+    :rtype: dict[str, str]
+    """
+    parquet_filenames = {}
+
+    for table in dataframes.keys():
+        parquet_filenames[table] = table + '.parquet'
+
+    return parquet_filenames
+
+@pytest.fixture(autouse=True)
+def staged_parquet_files(
+        monkeypatch
+) -> None:
+    if importlib.util.find_spec('pyarrow') is None:
+        monkeypatch.setattr(bulk_loader, 'write_dataframes_to_parquet', name_parquet_files)
+
+def open_fake_connection(
+) -> object:
+    """
+    Open a fake Snowflake connection.
+
+    :return: Fake Snowflake connection
+    :rtype: FakeSnowflakeConnection
+    """
+    return connect(
+        user='pagasa',
+        password='secret',
+        account='pagasa-account',
+        warehouse='PAGASA_WH'
+    )
+
+def test_merge_load_stages_copies_and_merges_in_one_transaction(
+) -> None:
+    conn = open_fake_connection()
+
+    bulk_load_dataframes(
+        conn,
+        {'ISSUED_DATETIMES': ISSUED_DATETIMES, 'SYNOPSES': SYNOPSES},
+        load_mode='merge'
+    )
+
+    statements = conn.executed_statements
+    begin_index = statements.index('BEGIN')
+
+    assert statements[0] == 'CREATE TEMPORARY STAGE IF NOT EXISTS SILVER.DAILY_WEATHER_FORECASTS.PAGASA_BULK_LOAD'
+    assert statements[1].startswith('PUT ')
+    assert statements[1].endswith(' @SILVER.DAILY_WEATHER_FORECASTS.PAGASA_BULK_LOAD PARALLEL = 4 AUTO_COMPRESS = FALSE OVERWRITE = TRUE')
+
+    # The temporary staging tables are created before the transaction
+    assert statements[2:begin_index] == [
+        'CREATE OR REPLACE TEMPORARY TABLE SILVER.DAILY_WEATHER_FORECASTS.ISSUED_DATETIMES_STAGING LIKE SILVER.DAILY_WEATHER_FORECASTS.ISSUED_DATETIMES',
+        'CREATE OR REPLACE TEMPORARY TABLE SILVER.DAILY_WEATHER_FORECASTS.SYNOPSES_STAGING LIKE SILVER.DAILY_WEATHER_FORECASTS.SYNOPSES'
+    ]
+
+    copy_statements = statements[begin_index + 1:begin_index + 3]
+    merge_statements = statements[begin_index + 3:-1]
+
+    for table, copy_statement in zip(['ISSUED_DATETIMES', 'SYNOPSES'], copy_statements):
+        assert copy_statement.startswith(f'COPY INTO SILVER.DAILY_WEATHER_FORECASTS.{table}_STAGING ')
+        assert f"FILES = ('{table}.parquet')" in copy_statement
+        assert copy_statement.endswith('MATCH_BY_COLUMN_NAME = CASE_INSENSITIVE PURGE = TRUE')
+
+    for table, merge_statement in zip(['ISSUED_DATETIMES', 'SYNOPSES'], merge_statements):
+        join_condition = ' AND '.join(
+            [f'TARGET.{key} = SOURCE.{key}' for key in SILVER_TABLES[table]['keys']]
+        )
+
+        assert merge_statement.startswith(
+            f'MERGE INTO SILVER.DAILY_WEATHER_FORECASTS.{table} AS TARGET '
+            f'USING SILVER.DAILY_WEATHER_FORECASTS.{table}_STAGING AS SOURCE '
+            f'ON {join_condition} '
+        )
+
+    assert 'WHEN MATCHED THEN UPDATE SET TARGET.SYNOPSIS = SOURCE.SYNOPSIS' in merge_statements[1]
+    assert statements[-1] == 'COMMIT'
+
+def test_append_load_copies_into_the_tables(
+) -> None:
+    conn = open_fake_connection()
+
+    bulk_load_dataframes(
+        conn,
+        {'SYNOPSES': SYNOPSES},
+        load_mode='append'
+    )
+
+    statements = conn.executed_statements
+
+    assert statements[2] == 'BEGIN'
+    assert statements[3].startswith('COPY INTO SILVER.DAILY_WEATHER_FORECASTS.SYNOPSES FROM ')
+    assert statements[4:] == ['COMMIT']
+
+def test_failed_copy_rolls_back_and_invalidates_the_bootstrap(
+        monkeypatch
+) -> None:
+    monkeypatch.setenv('SNOWFLAKE_ACCOUNT', 'pagasa-failed-copy-account')
+    conn = open_fake_connection()
+
+    warehouse_snowflake.create_tables(
+        conn
+    )
+    assert 'pagasa-failed-copy-account' in load_schema_bootstrap_cache()
+
+    conn.failing_statements.append('COPY INTO')
+    conn.executed_statements.clear()
+
+    with pytest.raises(FakeSnowflakeError):
+        warehouse_snowflake.write_dataframes(
+            conn,
+            {'SYNOPSES': SYNOPSES},
+            load_mode='merge'
+        )
+
+    assert conn.executed_statements[-2].startswith('COPY INTO ')
+    assert conn.executed_statements[-1] == 'ROLLBACK'
+    assert 'COMMIT' not in conn.executed_statements
+    assert 'pagasa-failed-copy-account' not in load_schema_bootstrap_cache()
+
+    # The next load bootstraps the tables again
+    conn.failing_statements.clear()
+    conn.executed_statements.clear()
+    warehouse_snowflake.create_tables(
+        conn
+    )
+
+    assert any(statement.startswith('CREATE TABLE IF NOT EXISTS') for statement in conn.executed_statements)
+    assert os.path.exists(os.path.join('data', 'cache', 'schema_bootstrap.json'))
@@ -0,0 +1,155 @@
+"""
+Pool of authenticated Snowflake connections.
+
+The pool runs against the local fake connector
+(`SNOWFLAKE_CONNECTOR=fake`), whose connections record their statements
+and whether they were closed, and is emptied around every test.
+"""
+import os
+import sys
+import subprocess
+
+import pytest
+
+from conftest import ROOT_DIR
+from etl.extract import connection_pool
+from etl.extract import warehouse_snowflake
+from etl.extract.connection_pool import get_connection
+from etl.extract.connection_pool import release_connection
+from etl.extract.connection_pool import pooled_connection
+from etl.extract.connection_pool import close_all_connections
+
+CREDENTIALS = ('pagasa', 'secret', 'pagasa-account', 'PAGASA_WH')
+
+@pytest.fixture(autouse=True)
+def fake_connection_pool(
+        monkeypatch
+) -> None:
+    monkeypatch.setenv('SNOWFLAKE_CONNECTOR', 'fake')
+    monkeypatch.setenv('SNOWFLAKE_USERNAME', CREDENTIALS[0])
+    monkeypatch.setenv('SNOWFLAKE_PASSWORD', CREDENTIALS[1])
+    monkeypatch.setenv('SNOWFLAKE_ACCOUNT', CREDENTIALS[2])
+    monkeypatch.setenv('SNOWFLAKE_WAREHOUSE', CREDENTIALS[3])
+    close_all_connections()
+
+    yield
+
+    close_all_connections()
+
+def run_python(
+        code: str,
+        **environment
+) -> str:
+    """
+    Run Python code in a new process with `src/` importable.
+
+    :param code: Python code to run
+    :type code: str
+
+    :return: Standard output of the process
+    :rtype: str
+    """
+    return subprocess.run(
+        [sys.executable, '-c', f'import sys; sys.path.insert(0, {os.path.join(ROOT_DIR, "src")!r})\n' + code],
+        env=dict(os.environ, **environment),
+        capture_output=True,
+        text=True,
+        check=True
+    ).stdout
+
+def test_extract_stages_reuse_the_pooled_session(
+) -> None:
+    with warehouse_snowflake.warehouse_connection() as daily_conn:
+        daily_conn.cursor().execute('SELECT 1')
+
+    with warehouse_snowflake.warehouse_connection() as cities_conn:
+        cities_conn.cursor().execute('SELECT 2')
+
+    assert cities_conn is daily_conn
+    assert not cities_conn.is_closed()
+    assert cities_conn.options['client_session_keep_alive'] is True
+    assert cities_conn.executed_statements == ['SELECT 1', 'SELECT 2']
+
+def test_failed_connections_are_discarded(
+) -> None:
+    with pytest.raises(RuntimeError):
+        with pooled_connection(*CREDENTIALS) as failed_conn:
+            raise RuntimeError('Load failed')
+
+    assert failed_conn.is_closed()
+
+    with pooled_connection(*CREDENTIALS) as conn:
+        assert conn is not failed_conn
+
+def test_closed_idle_connections_are_not_handed_out(
+) -> None:
+    conn = get_connection(*CREDENTIALS)
+    release_connection(conn)
+    conn.close()
+
+    reopened_conn = get_connection(*CREDENTIALS)
+
+    assert reopened_conn is not conn
+    assert not reopened_conn.is_closed()
+
+def test_idle_connections_are_bounded_by_the_pool_size(
+        monkeypatch
+) -> None:
+    monkeypatch.setenv('SNOWFLAKE_POOL_SIZE', '2')
+
+    connections = [get_connection(*CREDENTIALS) for _ in range(3)]
+
+    for conn in connections:
+        release_connection(conn)
+
+    assert [conn.is_closed() for conn in connections] == [False, False, True]
+    assert len(connection_pool._idle_connections[('pagasa-account', 'pagasa', 'PAGASA_WH')]) == 2
+
+def test_connections_are_pooled_per_credentials(
+) -> None:
+    conn = get_connection(*CREDENTIALS)
+    release_connection(conn)
+
+    other_conn = get_connection('pagasa', 'secret', 'pagasa-account', 'OTHER_WH')
+
+    assert other_conn is not conn
+    assert other_conn.warehouse == 'OTHER_WH'
+
+def test_close_all_connections_closes_the_idle_connections(
+) -> None:
+    checked_out_conn = get_connection(*CREDENTIALS)
+    idle_conn = get_connection(*CREDENTIALS)
+    release_connection(idle_conn)
+
+    close_all_connections()
+
+    assert idle_conn.is_closed()
+    assert not checked_out_conn.is_closed()
+    assert get_connection(*CREDENTIALS) is not idle_conn
+
+def test_idle_connections_are_closed_at_exit(
+) -> None:
+    # Handlers registered before the pool is imported run after its own handler
+    output = run_python(
+        'import atexit\n'
+        'idle_connections = []\n'
+        'atexit.register(lambda: print(idle_connections[0].is_closed()))\n'
+        'from etl.extract.connection_pool import get_connection\n'
+        'from etl.extract.connection_pool import release_connection\n'
+        'conn = get_connection("pagasa", "secret", "pagasa-account", "PAGASA_WH")\n'
+        'release_connection(conn)\n'
+        'idle_connections.append(conn)\n'
+        'print(conn.is_closed())\n',
+        SNOWFLAKE_CONNECTOR='fake'
+    )
+
+    assert output.split() == ['False', 'True']
+
+def test_fake_connector_is_only_imported_when_selected(
+) -> None:
+    output = run_python(
+        'import etl.extract\n'
+        'print("etl.extract.fake_snowflake_connector" in sys.modules)\n'
+    )
+
+    assert output.split() == ['False']
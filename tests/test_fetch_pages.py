@@ -0,0 +1,84 @@
+"""
+Status codes of the fetched PAGASA-DOST pages.
+
+The responses of the website are built locally, so a page answered with
+an error status must fail the stage ingesting it without writing any
+raw artifact.
+"""
+import os
+
+import pytest
+import requests
+
+from ingest import fetch_pages
+from ingest.fetch_pages import fetch_page
+from pipeline.stages import run_stage
+
+URL = 'https://www.pagasa.dost.gov.ph/weather#daily-weather-forecast'
+
+def respond_with(
+        monkeypatch,
+        status_code: int,
+        reason: str,
+        html: str = ''
+) -> None:
+    """
+    Answer the requests of `fetch_page()` with a local response.
+
+    :param status_code: HTTP status code of the response
+    :type status_code: int
+
+    :param reason: Reason phrase of the response
+    :type reason: str
+
+    :param html: HTML of the response
+    :type html: str
+    """
+    response = requests.Response()
+    response.status_code = status_code
+    response.reason = reason
+    response._content = html.encode('utf-8')
+    response.encoding = 'utf-8'
+    response.url = URL
+
+    monkeypatch.setattr(fetch_pages, 'get_with_retries', lambda url, headers: response)
+
+def test_ok_pages_have_html_and_no_error(
+        monkeypatch
+) -> None:
+    respond_with(monkeypatch, 200, 'OK', '<html></html>')
+
+    fetched_page = fetch_page(
+        URL
+    )
+
+    assert fetched_page['html'] == '<html></html>'
+    assert fetched_page['error'] is None
+
+@pytest.mark.parametrize(
+    ('status_code', 'reason'),
+    [(403, 'Forbidden'), (404, 'Not Found'), (503, 'Service Unavailable')]
+)
+def test_error_statuses_fail_the_ingest_stage(
+        monkeypatch,
+        status_code: int,
+        reason: str
+) -> None:
+    respond_with(monkeypatch, status_code, reason)
+
+    fetched_page = fetch_page(
+        URL
+    )
+
+    assert fetched_page['html'] is None
+    assert isinstance(fetched_page['error'], requests.HTTPError)
+    assert fetched_page['error'].response.status_code == status_code
+    assert str(fetched_page['error']) == f'{status_code} Error: {reason} for url: {URL}'
+
+    with pytest.raises(requests.HTTPError):
+        run_stage(
+            'daily',
+            {'daily_weather_forecast': fetched_page}
+        )
+
+    assert not os.path.exists(os.path.join('data', 'raw'))
@@ -0,0 +1,122 @@
+"""
+Replay of the fixture corpus against the committed raw artifacts.
+
+Every fixture of `data/fixtures/html/` is ingested by the ingest
+workflow of its page, and the saved artifacts must equal the committed
+artifacts under `data/raw/`. The daily weather forecast with the
+tropical cyclone section must index and ingest the other sections as
+the daily weather forecast without it.
+"""
+import os
+import json
+
+import pytest
+
+from conftest import ROOT_DIR
+from benchmarks.fixture_corpus import find_fixtures
+from benchmarks.fixture_corpus import replay_fixture
+from ingest.ingest_daily_weather_forecast import parse_soup_from_html
+from ingest.ingest_daily_weather_forecast import index_daily_weather_forecast_sections
+from executor.ingest.execute_ingest_daily_weather_forecast import ingest_daily_weather_forecast
+from executor.ingest.execute_ingest_weather_outlook_for_ph_cities import ingest_weather_outlook_for_ph_cities
+from executor.ingest.execute_ingest_weather_outlook_for_ph_tourist_areas import ingest_weather_outlook_for_ph_tourist_areas
+
+# Ingest workflow and raw artifact directory of every page with committed raw artifacts
+INGEST_WORKFLOWS = {
+    'daily_weather_forecast': (ingest_daily_weather_forecast, 'data/raw/daily_weather_forecasts'),
+    'weather_outlook_for_ph_cities': (ingest_weather_outlook_for_ph_cities, 'data/raw/weather_outlooks_for_ph_cities'),
+    'weather_outlook_for_ph_tourist_areas': (ingest_weather_outlook_for_ph_tourist_areas, 'data/raw/weather_outlooks_for_ph_tourist_areas')
+}
+
+DAILY_WEATHER_FORECAST_FIXTURE_DIR = os.path.join(ROOT_DIR, 'data', 'fixtures', 'html', 'daily_weather_forecast')
+
+FIXTURES = []
+
+for page_name, fixture_filepath in find_fixtures(os.path.join(ROOT_DIR, 'data', 'fixtures', 'html')):
+    if page_name in INGEST_WORKFLOWS:
+        FIXTURES.append(
+            (page_name, fixture_filepath)
+        )
+
+def load_json_artifacts(
+        raw_dir: str
+) -> dict[str, object]:
+    """
+    Load the flat JSON artifacts of a raw artifact directory.
+
+    :param raw_dir: Directory of the raw artifacts of a page
+    :type raw_dir: str
+
+    :return: Dictionary containing artifact filenames and
+        corresponding loaded data
+    :rtype: dict[str, object]
+    """
+    json_artifacts = {}
+
+    for filename in sorted(os.listdir(raw_dir)):
+        if not filename.endswith('.json') or filename == 'latest.json':
+            continue
+
+        with open(os.path.join(raw_dir, filename), 'r', encoding='utf-8') as json_file:
+            json_artifacts[filename] = json.load(json_file)
+
+    return json_artifacts
+
+def test_fixture_corpus_covers_every_ingested_page(
+) -> None:
+    page_names = set()
+
+    for page_name, fixture_filepath in FIXTURES:
+        page_names.add(
+            page_name
+        )
+
+    assert page_names == set(INGEST_WORKFLOWS.keys())
+
+@pytest.mark.parametrize(
+    ('page_name', 'fixture_filepath'),
+    FIXTURES,
+    ids=[os.path.basename(fixture_filepath) for page_name, fixture_filepath in FIXTURES]
+)
+def test_replayed_fixture_equals_committed_raw_artifacts(
+        page_name: str,
+        fixture_filepath: str
+) -> None:
+    ingest_workflow, raw_dir = INGEST_WORKFLOWS[page_name]
+
+    with open(fixture_filepath, 'r', encoding='utf-8') as html_file:
+        fetched_page = {
+            'url': fixture_filepath,
+            'status_code': 200,
+            'html': html_file.read(),
+            'error': None,
+            'etag': None,
+            'last_modified': None,
+            'content_sha256': None,
+            'unchanged': False
+        }
+
+    assert ingest_workflow(fetched_page)
+    assert load_json_artifacts(raw_dir) == load_json_artifacts(os.path.join(ROOT_DIR, raw_dir))
+
+def test_tropical_cyclone_section_keeps_the_other_sections_indexed(
+) -> None:
+    fixture_filepath = os.path.join(DAILY_WEATHER_FORECAST_FIXTURE_DIR, 'daily_weather_forecast.html')
+    tropical_cyclone_fixture_filepath = os.path.join(DAILY_WEATHER_FORECAST_FIXTURE_DIR, 'daily_weather_forecast_with_tropical_cyclone.html')
+
+    with open(tropical_cyclone_fixture_filepath, 'r', encoding='utf-8') as html_file:
+        sections = index_daily_weather_forecast_sections(
+            parse_soup_from_html(html_file.read())
+        )
+
+    assert sections['tropical_cyclone_informations'].h3.get_text() == 'Tropical Cyclone Information'
+    assert sections['synopsis'].h3.get_text() == 'Synopsis'
+    assert sections['forecast_weather_conditions'].h3.get_text() == 'Forecast Weather Conditions'
+    assert sections['forecast_wind_and_coastal_water_conditions'].h3.get_text() == 'Forecast Wind and Coastal Water Conditions'
+    assert sections['temperature_and_relative_humidity'].h3.get_text() == 'Temperature and Relative Humidity'
+
+    # Without the section, the page is indexed by the four-section branch
+    with open(fixture_filepath, 'r', encoding='utf-8') as html_file:
+        assert index_daily_weather_forecast_sections(parse_soup_from_html(html_file.read()))['tropical_cyclone_informations'] is None
+
+    assert replay_fixture('daily_weather_forecast', tropical_cyclone_fixture_filepath) == replay_fixture('daily_weather_forecast', fixture_filepath)
@@ -0,0 +1,137 @@
+"""
+Idempotency of the merge load of the local warehouses.
+
+The cleaned DataFrames of the fixture corpus are written into a
+temporary SQLite or DuckDB database, and writing them again in `merge`
+mode must leave the SILVER tables unchanged. The DuckDB runs are
+skipped when `duckdb` is not installed.
+"""
+import os
+import importlib
+
+import pandas as pd
+import pytest
+
+from conftest import ROOT_DIR
+from benchmarks.fixture_corpus import find_fixtures
+from pipeline.backfill import BACKFILL_PAGES
+from pipeline.backfill import parse_snapshot
+from etl.extract.schema_registry import SILVER_TABLES
+from etl.extract.warehouse_sqlite import get_local_table_name
+
+# Environment variable of the database path and database filename of every local warehouse
+LOCAL_WAREHOUSES = {
+    'sqlite': ('PAGASA_SQLITE_PATH', 'pagasa.sqlite3'),
+    'duckdb': ('PAGASA_DUCKDB_PATH', 'pagasa.duckdb')
+}
+
+@pytest.fixture(params=list(LOCAL_WAREHOUSES.keys()))
+def warehouse(
+        request,
+        monkeypatch
+) -> object:
+    """
+    Select a local warehouse backend with a temporary database.
+
+    :return: Warehouse backend of `etl.extract`
+    :rtype: object
+    """
+    if request.param == 'duckdb':
+        pytest.importorskip('duckdb')
+
+    path_variable, database_filename = LOCAL_WAREHOUSES[request.param]
+    monkeypatch.setenv(path_variable, os.path.join('data', 'warehouse', database_filename))
+
+    return importlib.import_module(
+        f'etl.extract.warehouse_{request.param}'
+    )
+
+def parse_fixture_corpus(
+) -> dict[str, pd.DataFrame]:
+    """
+    Parse and clean every fixture of the corpus with a backfill parser.
+
+    :return: Dictionary containing SILVER table names and
+        corresponding cleaned DataFrames
+    :rtype: dict[str, pd.DataFrame]
+    """
+    dataframes = {}
+
+    for page_name, fixture_filepath in find_fixtures(os.path.join(ROOT_DIR, 'data', 'fixtures', 'html')):
+        if page_name not in BACKFILL_PAGES:
+            continue
+
+        for table, data in parse_snapshot(page_name, fixture_filepath).items():
+            dataframes[table] = data
+
+    return dataframes
+
+def load_tables(
+        warehouse: object,
+        conn,
+        tables: list[str]
+) -> dict[str, list[tuple]]:
+    """
+    Load the sorted rows of SILVER tables of a local warehouse.
+
+    :param warehouse: Warehouse backend of `etl.extract`
+    :type warehouse: object
+
+    :param conn: Connection to the database of the warehouse
+    :type conn: sqlite3.Connection | duckdb.DuckDBPyConnection
+
+    :param tables: Names of the tables
+    :type tables: list[str]
+
+    :return: Dictionary containing table names and
+        corresponding sorted rows
+    :rtype: dict[str, list[tuple]]
+    """
+    rows = {}
+
+    for table in tables:
+        local_table_name = get_local_table_name(table, SILVER_TABLES[table])
+
+        # DuckDB creates every table in its declared schema
+        if warehouse.__name__ == 'etl.extract.warehouse_duckdb':
+            local_table_name = SILVER_TABLES[table]['schema'] + '.' + table
+
+        rows[table] = sorted(
+            conn.execute(f'SELECT * FROM {local_table_name}').fetchall(),
+            key=repr
+        )
+
+    return rows
+
+def test_merge_is_idempotent(
+        warehouse
+) -> None:
+    dataframes = parse_fixture_corpus()
+
+    with warehouse.warehouse_connection() as conn:
+        warehouse.create_tables(conn)
+        warehouse.write_dataframes(conn, dataframes, load_mode='merge')
+        first_load = load_tables(warehouse, conn, list(dataframes.keys()))
+
+        warehouse.write_dataframes(conn, dataframes, load_mode='merge')
+        second_load = load_tables(warehouse, conn, list(dataframes.keys()))
+
+    assert second_load == first_load
+
+    for table, data in dataframes.items():
+        assert len(first_load[table]) == len(data.drop_duplicates(subset=SILVER_TABLES[table]['keys']))
+
+def test_merge_keeps_the_last_row_of_duplicated_keys(
+        warehouse
+) -> None:
+    synopses = parse_fixture_corpus()['SYNOPSES']
+    revised_synopses = synopses.assign(SYNOPSIS='Revised synopsis.')
+
+    with warehouse.warehouse_connection() as conn:
+        warehouse.create_tables(conn)
+        warehouse.write_dataframes(conn, {'SYNOPSES': synopses}, load_mode='merge')
+        warehouse.write_dataframes(conn, {'SYNOPSES': pd.concat([synopses, revised_synopses])}, load_mode='merge')
+        rows = load_tables(warehouse, conn, ['SYNOPSES'])['SYNOPSES']
+
+    assert len(rows) == len(synopses)
+    assert rows[0][-1] == 'Revised synopsis.'
@@ -0,0 +1,185 @@
+"""
+Skip logic of the run manifest of the ETL pipeline.
+
+A stage is skipped only when its input files, its output files and the
+settings it ran with are unchanged since its last successful run.
+"""
+import os
+import json
+import shutil
+import threading
+
+import pytest
+
+from conftest import ROOT_DIR
+from pipeline.manifest import MANIFEST_FILEPATH
+from pipeline.manifest import compute_files_hashes
+from pipeline.manifest import load_manifest
+from pipeline.manifest import save_manifest
+from pipeline.manifest import is_stage_up_to_date
+from pipeline.manifest import record_stage_run
+from etl.extract.warehouse import get_warehouse_settings
+
+SQLITE_SETTINGS = {
+    'warehouse': 'sqlite',
+    'target': '/tmp/pagasa.sqlite3',
+    'load_mode': 'merge'
+}
+
+def write_file(
+        filepath: str,
+        content: str
+) -> None:
+    """
+    Write a text file, creating its directory.
+
+    :param filepath: Filepath of the file
+    :type filepath: str
+
+    :param content: Content of the file
+    :type content: str
+    """
+    os.makedirs(os.path.dirname(filepath), exist_ok=True)
+
+    with open(filepath, 'w') as file:
+        file.write(content)
+
+def record_stage(
+        settings: dict | None = None
+) -> dict[str, dict]:
+    """
+    Record a run of a stage reading `inputs/*.json` and
+    writing `outputs/*.json`.
+
+    :param settings: Settings of the run, or NoneType
+    :type settings: dict | None
+
+    :return: Run manifest containing the run of the stage
+    :rtype: dict[str, dict]
+    """
+    write_file(os.path.join('inputs', 'input.json'), '{"input": 1}')
+    write_file(os.path.join('outputs', 'output.json'), '{"output": 1}')
+    manifest = {}
+    record_stage_run(
+        manifest,
+        'stage',
+        compute_files_hashes(['inputs/*.json']),
+        ['outputs/*.json'],
+        settings
+    )
+
+    return manifest
+
+def test_unchanged_stage_is_up_to_date(
+) -> None:
+    manifest = record_stage(SQLITE_SETTINGS)
+
+    assert is_stage_up_to_date(manifest, 'stage', compute_files_hashes(['inputs/*.json']), ['outputs/*.json'], dict(SQLITE_SETTINGS))
+
+def test_changed_input_or_output_is_not_up_to_date(
+) -> None:
+    manifest = record_stage()
+
+    write_file(os.path.join('outputs', 'output.json'), '{"output": 2}')
+    assert not is_stage_up_to_date(manifest, 'stage', compute_files_hashes(['inputs/*.json']), ['outputs/*.json'])
+
+    manifest = record_stage()
+
+    write_file(os.path.join('inputs', 'input.json'), '{"input": 2}')
+    assert not is_stage_up_to_date(manifest, 'stage', compute_files_hashes(['inputs/*.json']), ['outputs/*.json'])
+
+@pytest.mark.parametrize(
+    'changed_settings',
+    [
+        {'warehouse': 'snowflake', 'target': 'account', 'load_mode': 'merge'},
+        {'warehouse': 'sqlite', 'target': '/tmp/other.sqlite3', 'load_mode': 'merge'},
+        {'warehouse': 'sqlite', 'target': '/tmp/pagasa.sqlite3', 'load_mode': 'append'},
+        None
+    ]
+)
+def test_changed_settings_are_not_up_to_date(
+        changed_settings: dict | None
+) -> None:
+    manifest = record_stage(SQLITE_SETTINGS)
+
+    assert not is_stage_up_to_date(manifest, 'stage', compute_files_hashes(['inputs/*.json']), ['outputs/*.json'], changed_settings)
+
+def test_entry_recorded_without_settings_reruns_a_stage_with_settings(
+) -> None:
+    manifest = record_stage()
+    del manifest['stage']['settings']
+
+    assert is_stage_up_to_date(manifest, 'stage', compute_files_hashes(['inputs/*.json']), ['outputs/*.json'])
+    assert not is_stage_up_to_date(manifest, 'stage', compute_files_hashes(['inputs/*.json']), ['outputs/*.json'], SQLITE_SETTINGS)
+
+def test_stage_without_inputs_is_never_up_to_date(
+) -> None:
+    manifest = record_stage()
+
+    assert not is_stage_up_to_date(manifest, 'stage', {}, ['outputs/*.json'])
+
+def test_warehouse_settings_follow_the_environment(
+        monkeypatch
+) -> None:
+    monkeypatch.setenv('PAGASA_WAREHOUSE', 'sqlite')
+    monkeypatch.setenv('PAGASA_SQLITE_PATH', 'first.sqlite3')
+    monkeypatch.setenv('PAGASA_LOAD_MODE', 'merge')
+    first_settings = get_warehouse_settings()
+
+    monkeypatch.setenv('PAGASA_SQLITE_PATH', 'second.sqlite3')
+    second_settings = get_warehouse_settings()
+
+    monkeypatch.setenv('PAGASA_LOAD_MODE', 'append')
+    third_settings = get_warehouse_settings()
+
+    assert first_settings['target'] == os.path.abspath('first.sqlite3')
+    assert len({json.dumps(first_settings), json.dumps(second_settings), json.dumps(third_settings)}) == 3
+
+def test_overlapping_saves_leave_a_complete_manifest(
+) -> None:
+    manifests = []
+
+    for index in range(8):
+        manifests.append(
+            {f'stage_{index}': {'input_hashes': {}, 'output_hashes': {}, 'settings': {}}}
+        )
+
+    threads = []
+
+    for manifest in manifests:
+        threads.append(
+            threading.Thread(target=save_manifest, args=(manifest,))
+        )
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    assert load_manifest() in manifests
+    assert os.listdir(os.path.dirname(MANIFEST_FILEPATH)) == [os.path.basename(MANIFEST_FILEPATH)]
+
+def test_extract_stage_reruns_when_the_warehouse_changes(
+        monkeypatch
+) -> None:
+    pytest.importorskip('dotenv')
+    from pipeline.pipeline import run_pipeline
+
+    shutil.copytree(
+        os.path.join(ROOT_DIR, 'data', 'raw', 'weather_outlooks_for_ph_cities'),
+        os.path.join('data', 'raw', 'weather_outlooks_for_ph_cities')
+    )
+    monkeypatch.setenv('PAGASA_WAREHOUSE', 'sqlite')
+    monkeypatch.setenv('PAGASA_LOAD_MODE', 'merge')
+    monkeypatch.setenv('PAGASA_SQLITE_PATH', os.path.join('data', 'warehouse', 'first.sqlite3'))
+
+    assert run_pipeline(['extract_cities'])['extract_cities']['status'] == 'processed'
+    assert run_pipeline(['extract_cities'])['extract_cities']['status'] == 'up_to_date'
+
+    monkeypatch.setenv('PAGASA_SQLITE_PATH', os.path.join('data', 'warehouse', 'second.sqlite3'))
+    assert run_pipeline(['extract_cities'])['extract_cities']['status'] == 'processed'
+
+    monkeypatch.setenv('PAGASA_LOAD_MODE', 'append')
+    assert run_pipeline(['extract_cities'])['extract_cities']['status'] == 'processed'
+    assert run_pipeline(['extract_cities'])['extract_cities']['status'] == 'up_to_date'
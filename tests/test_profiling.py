@@ -0,0 +1,89 @@
+"""
+Profiles of the stages handing their work to threads.
+
+The fetch of the pages runs its HTTP requests on the workers of a
+thread pool, so its profiles must contain the frames of the threads
+started during the stage, not only the thread waiting on them.
+"""
+import os
+import time
+import pstats
+from concurrent.futures import ThreadPoolExecutor
+
+from pipeline.profiling import profile_stage
+
+def fetch_in_worker_thread(
+        seconds: float
+) -> float:
+    """
+    Stand in for the HTTP request of a worker thread, busy for
+    a number of seconds.
+
+    :param seconds: Duration of the work in seconds
+    :type seconds: float
+
+    :return: Sum computed by the work
+    :rtype: float
+    """
+    deadline = time.perf_counter() + seconds
+    total = 0.0
+
+    while time.perf_counter() < deadline:
+        total += 1.0
+
+    return total
+
+def profile_thread_pool(
+        profile_dir: str,
+        profile_started_threads: bool
+) -> tuple[set[str], str]:
+    """
+    Profile a stage running its work on a thread pool.
+
+    :param profile_dir: Profile directory of the run
+    :type profile_dir: str
+
+    :param profile_started_threads: Also profile the threads
+        started during the stage
+    :type profile_started_threads: bool
+
+    :return: Function names of `<stage>.pstats` and the content
+        of `<stage>.collapsed`
+    :rtype: tuple[set[str], str]
+    """
+    with profile_stage('fetch', profile_dir, interval_seconds=0.001, profile_started_threads=profile_started_threads):
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            list(executor.map(fetch_in_worker_thread, [0.1, 0.1]))
+
+    function_names = set()
+
+    for filename, line_number, function_name in pstats.Stats(os.path.join(profile_dir, 'fetch.pstats')).stats.keys():
+        function_names.add(
+            function_name
+        )
+
+    with open(os.path.join(profile_dir, 'fetch.collapsed'), 'r', encoding='utf-8') as collapsed_file:
+        collapsed_stacks = collapsed_file.read()
+
+    return function_names, collapsed_stacks
+
+def test_profile_contains_the_started_threads(
+) -> None:
+    function_names, collapsed_stacks = profile_thread_pool(
+        'with_threads',
+        True
+    )
+
+    assert 'fetch_in_worker_thread' in function_names
+    assert 'fetch_in_worker_thread' in collapsed_stacks
+    assert 'sample_stacks' not in function_names
+    assert 'sample_stacks' not in collapsed_stacks
+
+def test_profile_of_the_calling_thread_only(
+) -> None:
+    function_names, collapsed_stacks = profile_thread_pool(
+        'without_threads',
+        False
+    )
+
+    assert 'fetch_in_worker_thread' not in collapsed_stacks
@@ -0,0 +1,218 @@
+"""
+Time-partitioned archive of the raw artifacts and its replay.
+
+Snapshots are archived at fixed times, so the partitions, the latest
+pointer and the listed time ranges are known in advance, and the
+replay of the daily weather forecast into SQLite must keep the synopsis
+of the latest snapshot.
+"""
+import os
+import json
+import datetime
+
+import pytest
+
+from ingest.raw_archive import archive_raw_artifact
+from ingest.raw_archive import load_latest_pointer
+from ingest.raw_archive import list_archived_snapshots
+from ingest.raw_archive import find_archived_snapshot_before
+from pipeline.archive_replay import list_archived_page_snapshots
+
+PAGE_DIR = os.path.join('data', 'raw', 'daily_weather_forecasts')
+
+ISSUED_DATETIME = json.dumps(
+    [{'issued_datetime': 'Issued at: 4:00 AM, 29 January 2026'}]
+).encode('utf-8')
+
+def utc(
+        hour: int,
+        minute: int = 0
+) -> datetime.datetime:
+    """
+    Build a time (UTC) of 29 January 2026.
+
+    :param hour: Hour of the time
+    :type hour: int
+
+    :param minute: Minute of the time
+    :type minute: int
+
+    :return: Timezone-aware time
+    :rtype: datetime.datetime
+    """
+    return datetime.datetime(2026, 1, 29, hour, minute, tzinfo=datetime.timezone.utc)
+
+def synopsis(
+        text: str
+) -> bytes:
+    """
+    Build the content of a synopsis artifact.
+
+    :param text: Synopsis
+    :type text: str
+
+    :return: Content of the artifact
+    :rtype: bytes
+    """
+    return json.dumps([{'synopsis': text}]).encode('utf-8')
+
+def archive(
+        filename: str,
+        content: bytes,
+        archived_at: datetime.datetime
+) -> dict | None:
+    """
+    Archive a snapshot of an artifact of the daily weather forecast.
+
+    :param filename: Filename of the artifact
+    :type filename: str
+
+    :param content: Content of the artifact
+    :type content: bytes
+
+    :param archived_at: Time (UTC) of the snapshot
+    :type archived_at: datetime.datetime
+
+    :return: Index entry of the archived snapshot, or NoneType
+    :rtype: dict | None
+    """
+    return archive_raw_artifact(
+        os.path.join(PAGE_DIR, filename),
+        content,
+        archived_at
+    )
+
+@pytest.fixture(autouse=True)
+def enabled_raw_archive(
+        monkeypatch
+) -> None:
+    monkeypatch.setenv('PAGASA_RAW_ARCHIVE', '1')
+    os.makedirs(PAGE_DIR)
+
+def test_identical_snapshots_are_archived_once(
+) -> None:
+    assert archive('synopsis.json', synopsis('Northeast Monsoon'), utc(3)) is not None
+    assert archive('synopsis.json', synopsis('Northeast Monsoon'), utc(4)) is None
+
+    assert os.listdir(os.path.join(PAGE_DIR, 'objects')) == [
+        list_archived_snapshots(PAGE_DIR)[0]['sha256'] + '.json'
+    ]
+    assert len(list_archived_snapshots(PAGE_DIR)) == 1
+
+def test_reverted_snapshots_reuse_their_object(
+) -> None:
+    archive('synopsis.json', synopsis('Northeast Monsoon'), utc(3))
+    archive('synopsis.json', synopsis('Shear Line'), utc(4))
+    archive('synopsis.json', synopsis('Northeast Monsoon'), utc(5))
+
+    assert len(list_archived_snapshots(PAGE_DIR)) == 3
+    assert len(os.listdir(os.path.join(PAGE_DIR, 'objects'))) == 2
+
+def test_snapshots_are_indexed_in_the_partition_of_their_hour(
+) -> None:
+    archive('synopsis.json', synopsis('Northeast Monsoon'), utc(3, 10))
+    archive('issued_datetime.json', ISSUED_DATETIME, utc(3, 50))
+    archive('synopsis.json', synopsis('Shear Line'), utc(4, 5))
+
+    with open(os.path.join(PAGE_DIR, 'dt=2026-01-29', 'hh=03', 'index.json'), 'r') as index_file:
+        assert [index_entry['filename'] for index_entry in json.load(index_file)] == [
+            'synopsis.json',
+            'issued_datetime.json'
+        ]
+
+    with open(os.path.join(PAGE_DIR, 'dt=2026-01-29', 'hh=04', 'index.json'), 'r') as index_file:
+        assert [index_entry['archived_at'] for index_entry in json.load(index_file)] == [
+            utc(4, 5).isoformat()
+        ]
+
+def test_latest_pointer_follows_the_latest_snapshot_of_every_artifact(
+) -> None:
+    archive('synopsis.json', synopsis('Northeast Monsoon'), utc(3))
+    archive('issued_datetime.json', ISSUED_DATETIME, utc(3, 30))
+    shear_line_entry = archive('synopsis.json', synopsis('Shear Line'), utc(4))
+
+    latest_pointer = load_latest_pointer(
+        PAGE_DIR
+    )
+
+    assert latest_pointer['synopsis.json']['sha256'] == shear_line_entry['sha256']
+    assert latest_pointer['synopsis.json']['partition'] == os.path.join('dt=2026-01-29', 'hh=04')
+    assert latest_pointer['issued_datetime.json']['archived_at'] == utc(3, 30).isoformat()
+
+def test_time_ranges_list_and_find_the_snapshots_current_at_the_time(
+) -> None:
+    archive('synopsis.json', synopsis('Northeast Monsoon'), utc(3))
+    archive('synopsis.json', synopsis('Shear Line'), utc(4, 30))
+    archive('synopsis.json', synopsis('Easterlies'), utc(6))
+
+    archived_snapshots = list_archived_snapshots(
+        PAGE_DIR,
+        utc(4),
+        utc(6)
+    )
+
+    assert [index_entry['archived_at'] for index_entry in archived_snapshots] == [utc(4, 30).isoformat()]
+
+    with open(archived_snapshots[0]['object'], 'rb') as object_file:
+        assert object_file.read() == synopsis('Shear Line')
+
+    assert find_archived_snapshot_before(PAGE_DIR, 'synopsis.json', utc(3)) is None
+    assert find_archived_snapshot_before(PAGE_DIR, 'synopsis.json', utc(4, 30))['archived_at'] == utc(3).isoformat()
+    assert find_archived_snapshot_before(PAGE_DIR, 'synopsis.json', utc(23))['archived_at'] == utc(6).isoformat()
+
+def test_page_snapshots_pair_the_artifacts_current_at_the_start(
+) -> None:
+    archive('issued_datetime.json', ISSUED_DATETIME, utc(3))
+    archive('synopsis.json', synopsis('Northeast Monsoon'), utc(3, 1))
+    archive('synopsis.json', synopsis('Shear Line'), utc(5))
+
+    page_snapshots = list_archived_page_snapshots(
+        PAGE_DIR,
+        ['issued_datetime.json', 'synopsis.json'],
+        utc(4)
+    )
+
+    assert len(page_snapshots) == 1
+    assert page_snapshots[0][0] == utc(5).isoformat()
+    assert sorted(page_snapshots[0][1].keys()) == ['issued_datetime.json', 'synopsis.json']
+
+    # Without a start, the first snapshot waits for every artifact of the page
+    assert [archived_at for archived_at, _ in list_archived_page_snapshots(PAGE_DIR, ['issued_datetime.json', 'synopsis.json'])] == [
+        utc(3, 1).isoformat(),
+        utc(5).isoformat()
+    ]
+
+def test_replay_keeps_the_synopsis_of_the_latest_snapshot(
+        monkeypatch
+) -> None:
+    pytest.importorskip('dotenv')
+
+    from pipeline.archive_replay import replay_archived_snapshots
+    from etl.extract.schema_registry import SILVER_TABLES
+    from etl.extract.warehouse_sqlite import get_local_table_name
+    from etl.extract.warehouse_sqlite import warehouse_connection
+
+    monkeypatch.setenv('PAGASA_WAREHOUSE', 'sqlite')
+    monkeypatch.setenv('PAGASA_SQLITE_PATH', os.path.join('data', 'warehouse', 'pagasa.sqlite3'))
+
+    archive('issued_datetime.json', ISSUED_DATETIME, utc(3))
+    archive('synopsis.json', synopsis('Northeast Monsoon'), utc(3, 1))
+    archive('synopsis.json', synopsis('Shear Line'), utc(5))
+
+    summary = replay_archived_snapshots(
+        os.path.join('data', 'raw'),
+        ['daily_weather_forecast'],
+        batch_size=1,
+        load_mode='merge'
+    )
+
+    assert summary['replayed_snapshots'] == 2
+    assert summary['failed_snapshots'] == {}
+
+    local_table_name = get_local_table_name(
+        'SYNOPSES',
+        SILVER_TABLES['SYNOPSES']
+    )
+
+    with warehouse_connection() as conn:
+        assert conn.execute(f'SELECT SYNOPSIS FROM {local_table_name}').fetchall() == [('Shear Line',)]